@@ -32,7 +32,7 @@ from src.abs import ABSAuthError, ABSConnectionError, ABSError
 from src.audible import AudibleAuthError
 from src.cli.abs import abs_app
 from src.cli.audible import audible_app
-from src.cli.common import Icons, console, get_abs_client, get_audible_client, get_cache, ui
+from src.cli.common import Icons, close_cache, console, get_abs_client, get_audible_client, get_cache, ui
 from src.cli.quality import quality_app
 from src.cli.series import series_app
 from src.config import get_settings
@@ -59,6 +59,7 @@ app = typer.Typer(
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     version: Annotated[
         bool | None,
         typer.Option(
@@ -71,6 +72,7 @@ def main(
     ] = None,
 ) -> None:
     """A2A - Audiobook to Audible management tool."""
+    ctx.call_on_close(close_cache)
 
 
 # Register sub-apps
@@ -242,11 +242,13 @@ class ABSClient:
 
         # Setup caching - prefer new SQLiteCache, fall back to legacy
         self._cache: Optional["SQLiteCache"] = cache
+        self._owns_cache = False  # close() only closes a cache this client created
         if cache is None and cache_dir:
             # Legacy support: create SQLiteCache from cache_dir
             from ..cache import SQLiteCache
 
             db_path = Path(cache_dir) / "cache.db"
+            self._owns_cache = True
             self._cache = SQLiteCache(
                 db_path=db_path,
                 default_ttl_hours=cache_ttl_hours,
@@ -383,8 +385,10 @@ class ABSClient:
         return self._request("POST", endpoint, json=json, params=params)
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client (and the cache, if this client created it)."""
         self._client.close()
+        if self._owns_cache and self._cache:
+            self._cache.close()
 
     def __enter__(self) -> "ABSClient":
         return self
@@ -1033,7 +1037,7 @@ class ABSClient:
             try:
                 results.append(BookSearchResult.model_validate(item))
             except ValidationError:
-                logger.debug(f"Skipping invalid book search result: {item}")
+                logger.debug("Skipping invalid book search result: %s", item)
         return results
 
     def search_authors(self, query: str) -> dict | None:
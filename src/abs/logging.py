@@ -25,38 +25,66 @@ Usage:
 """
 
 import logging
-import sys
+from collections.abc import Hashable, Mapping
 from pathlib import Path
-from typing import Literal
-
-from rich.logging import RichHandler
-from rich.traceback import install as install_rich_traceback
-
+from types import MappingProxyType
+from typing import Any, Final, Literal
+
+from src.utils.logging import (
+    attach_handlers,
+    build_console_handler,
+    build_file_handler,
+    close_unused_handlers,
+    detach_handlers,
+    install_rich_tracebacks,
+    minimize_log_records,
+    queued_handlers,
+    sample_debug_records,
+)
 from src.utils.ui import console as rich_console
 
 # Module logger name - all ABS module logs use this prefix
-MODULE_LOGGER_NAME = "src.abs"
+MODULE_LOGGER_NAME: Final = "src.abs"
 
 # Type alias for log levels
 LogLevel = Literal["debug", "info", "warning", "error", "critical"]
 
+# Map string levels to logging constants (read-only)
+_LEVEL_MAP: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "debug": logging.DEBUG,
+        "info": logging.INFO,
+        "warning": logging.WARNING,
+        "error": logging.ERROR,
+        "critical": logging.CRITICAL,
+    }
+)
+# Plain-dict lookup table with uppercase spellings too (faster to probe than the proxy)
+_LEVEL_MAP_CI: Final[dict[str, int]] = {**_LEVEL_MAP, **{name.upper(): value for name, value in _LEVEL_MAP.items()}}
+
+# Default record format for plain console and file output
+_DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Words the Rich console handler highlights
+_RICH_KEYWORDS = ("ABS", "audiobookshelf", "library", "item", "cache", "API")
+
 # Module state
 _configured = False
 
+# Handlers built by configure_logging(), keyed by kind and options; reused while the options are unchanged
+_handler_cache: dict[tuple[Any, ...], logging.Handler] = {}
+
 
 def _get_log_level(level: LogLevel | int) -> int:
     """Convert level string to logging constant."""
-    if isinstance(level, int):
+    if type(level) is int:
         return level
-
-    level_map = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL,
-    }
-    return level_map.get(level.lower(), logging.INFO)
+    if isinstance(level, int):
+        return level  # int subclasses such as IntEnum
+    mapped = _LEVEL_MAP_CI.get(level)
+    if mapped is not None:
+        return mapped
+    return _LEVEL_MAP_CI.get(level.lower(), logging.INFO)
 
 
 def configure_logging(
@@ -70,6 +98,15 @@ def configure_logging(
     show_path: bool = False,
     show_time: bool = True,
     markup: bool = True,
+    buffer_capacity: int = 512,
+    rotate_bytes: int = 10_000_000,
+    backup_count: int = 3,
+    flush_level: LogLevel | int = "error",
+    async_logging: bool = False,
+    debug_sample_every: int = 1,
+    minimal_records: bool = True,
+    production: bool = False,
+    console_output: bool | None = None,
 ) -> logging.Logger:
     """
     Configure rich-enhanced logging for the ABS module.
@@ -96,6 +133,21 @@ def configure_logging(
         show_path: Show file path in console logs
         show_time: Show timestamp in console logs
         markup: Enable rich markup in log messages
+        buffer_capacity: Number of file log records buffered before writing (0 writes each record immediately)
+        flush_level: File records at this level or above are written immediately, along with the buffer
+        rotate_bytes: Size at which the log file is rotated (0 never rotates)
+        backup_count: Number of rotated log files to keep
+        async_logging: Run the console/file handlers on a background thread so logging calls only
+            enqueue records. Off by default so output is written before the logging call returns
+            (what tests and log-tailing scripts expect).
+        debug_sample_every: At debug level, show only one in this many DEBUG records on the console
+            (the file still gets all of them); 1 shows everything
+        minimal_records: Skip thread/process/task lookups when creating log records.
+            **Process-wide toggle** - affects every logger; disable if a format uses
+            ``%(threadName)s``, ``%(process)d`` or similar.
+        production: Swallow errors raised inside handlers instead of printing them
+            (``logging.raiseExceptions = False``). **Process-wide toggle.**
+        console_output: Alias for ``console`` (the name the Audible module uses); wins if given
 
     Returns:
         Configured logger instance
@@ -113,75 +165,67 @@ def configure_logging(
     """
     global _configured
 
+    if console_output is not None:
+        console = console_output
     log_level = _get_log_level(level)
     file_log_level = _get_log_level(file_log_level) if file_log_level else log_level
 
     # Install rich tracebacks globally for beautiful exceptions
     if use_rich and rich_tracebacks:
-        install_rich_traceback(
-            console=rich_console,
-            show_locals=False,
-            width=rich_console.width,
-            extra_lines=3,
-            theme="monokai",
-            word_wrap=True,
-        )
+        install_rich_tracebacks(rich_console)
 
     # Configure our module logger
     logger = logging.getLogger(MODULE_LOGGER_NAME)
     logger.setLevel(log_level)
 
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
+    # Remove existing handlers to avoid duplicates (flushing any buffered file output first)
+    detach_handlers(logger)
 
-    # Initialize handler variables for potential reuse
     console_handler: logging.Handler | None = None
     file_handler: logging.Handler | None = None
+    in_use: list[Hashable] = []
 
-    # Console handler - use Rich if enabled
     if console:
-        if use_rich:
-            console_handler = RichHandler(
-                level=log_level,
-                console=rich_console,
-                show_time=show_time,
-                show_path=show_path,
-                rich_tracebacks=rich_tracebacks,
-                markup=markup,
-                log_time_format="[%X]",
-                keywords=[
-                    # Highlight these words in logs
-                    "ABS",
-                    "audiobookshelf",
-                    "library",
-                    "item",
-                    "cache",
-                    "API",
-                ],
-            )
-        else:
-            # Standard handler
-            if format_string is None:
-                format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            formatter = logging.Formatter(format_string)
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(log_level)
-            console_handler.setFormatter(formatter)
-
-        logger.addHandler(console_handler)
+        console_handler = build_console_handler(
+            _handler_cache,
+            in_use,
+            level=log_level,
+            use_rich=use_rich,
+            console=rich_console,
+            keywords=_RICH_KEYWORDS,
+            format_string=format_string or _DEFAULT_FORMAT,
+            datefmt=None,
+            show_time=show_time,
+            show_path=show_path,
+            markup=markup,
+            rich_tracebacks=rich_tracebacks,
+        )
+        # Throttle noisy per-item debug output on the console only
+        sample_debug_records(console_handler, debug_sample_every if log_level == logging.DEBUG else 1)
 
     # File handler - always use standard formatting for parseable logs
     if file_path:
-        file_path = Path(file_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = build_file_handler(
+            _handler_cache,
+            in_use,
+            Path(file_path),
+            level=file_log_level,
+            format_string=format_string or _DEFAULT_FORMAT,
+            datefmt=None,
+            buffer_capacity=buffer_capacity,
+            flush_level=_get_log_level(flush_level),
+            rotate_bytes=rotate_bytes,
+            backup_count=backup_count,
+        )
 
-        file_format = format_string or "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        file_formatter = logging.Formatter(file_format)
+    # Release handlers for options no longer in use (e.g. the previous log file)
+    close_unused_handlers(_handler_cache, in_use)
+    attach_handlers(logger, [h for h in (console_handler, file_handler) if h is not None], async_logging=async_logging)
 
-        file_handler = logging.FileHandler(file_path, encoding="utf-8")
-        file_handler.setLevel(file_log_level)
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+    if minimal_records:
+        minimize_log_records(production=production)
+    elif production:
+        logging.raiseExceptions = False
 
     _configured = True
     return logger
@@ -217,9 +261,12 @@ def set_level(level: LogLevel | int) -> None:
     """
     log_level = _get_log_level(level)
     logger = logging.getLogger(MODULE_LOGGER_NAME)
-    logger.setLevel(log_level)
-    for handler in logger.handlers:
-        handler.setLevel(log_level)
+    if logger.level != log_level:
+        # setLevel() resets every logger's level cache, so only call it on a real change
+        logger.setLevel(log_level)
+    for handler in (*logger.handlers, *queued_handlers(MODULE_LOGGER_NAME)):
+        if handler.level != log_level:
+            handler.setLevel(log_level)
 
 
 def enable_debug_logging() -> None:
@@ -247,14 +294,16 @@ class LogContext:
         """Enter context and set new level."""
         logger = logging.getLogger(MODULE_LOGGER_NAME)
         self._original_level = logger.level
-        logger.setLevel(self._target_level)
+        if logger.level != self._target_level:
+            logger.setLevel(self._target_level)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit context and restore original level."""
         if self._original_level is not None:
             logger = logging.getLogger(MODULE_LOGGER_NAME)
-            logger.setLevel(self._original_level)
+            if logger.level != self._original_level:
+                logger.setLevel(self._original_level)
 
 
 # =============================================================================
@@ -27,7 +27,12 @@ from .encryption import (
     load_auth,
     save_auth,
 )
-from .enrichment import AsyncAudibleEnrichmentService, AudibleEnrichment, AudibleEnrichmentService
+from .enrichment import (
+    AsyncAudibleEnrichmentService,
+    AudibleEnrichment,
+    AudibleEnrichmentHeader,
+    AudibleEnrichmentService,
+)
 from .logging import (
     LogContext,
     configure_logging,
@@ -131,6 +136,7 @@ __all__ = [
     "get_auth_password_from_env",
     # Enrichment service
     "AudibleEnrichment",
+    "AudibleEnrichmentHeader",
     "AudibleEnrichmentService",
     "AsyncAudibleEnrichmentService",
     # API Enums - for type-safe API usage
@@ -26,6 +26,8 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, cast
 
+import httpx
+import orjson
 from pydantic import ValidationError
 
 import audible
@@ -33,10 +35,15 @@ from audible import Authenticator
 
 from .encryption import get_encryption_config, load_auth
 from .models import (
+    CATALOG_PRODUCT_LIST_ADAPTER,
+    LIBRARY_ITEM_LIST_ADAPTER,
     LICENSE_TEST_CONFIGS,
+    WISHLIST_ITEM_LIST_ADAPTER,
     AudibleAccountInfo,
     AudibleCatalogProduct,
+    AudibleCatalogResponse,
     AudibleLibraryItem,
+    AudibleLibraryResponse,
     AudibleListeningStats,
     AudioFormat,
     CatalogSortBy,
@@ -52,6 +59,7 @@ from .models import (
     WishlistItem,
     WishlistSortBy,
 )
+from .utils import raw_response_body
 
 if TYPE_CHECKING:
     from ..cache import SQLiteCache
@@ -60,6 +68,16 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _http2_available() -> bool:
+    """Check if HTTP/2 dependencies are installed."""
+    try:
+        import h2
+
+        return True
+    except ImportError:
+        return False
+
+
 class AsyncAudibleError(Exception):
     """Base exception for async Audible API errors."""
 
@@ -129,6 +147,7 @@ class AsyncAudibleClient:
         self._client: audible.AsyncClient | None = None
         self._cache = cache
         self._cache_ttl_seconds = cache_ttl_hours * 3600
+        self._max_concurrent_requests = max_concurrent_requests
         self._semaphore = asyncio.Semaphore(max_concurrent_requests)
         self._request_delay = request_delay
         self._last_request_time = 0.0
@@ -187,7 +206,19 @@ class AsyncAudibleClient:
 
     async def __aenter__(self) -> "AsyncAudibleClient":
         """Async context manager entry."""
-        self._client = audible.AsyncClient(auth=self._auth)
+        # Concurrent requests share one multiplexed HTTP/2 connection instead of
+        # each paying a TCP + TLS handshake; keep-alive pool sized to our concurrency
+        http2 = _http2_available()
+        if not http2:
+            logger.debug("HTTP/2 not available; using HTTP/1.1 (install httpx[http2] for HTTP/2)")
+        self._client = audible.AsyncClient(
+            auth=self._auth,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=self._max_concurrent_requests,
+                max_keepalive_connections=self._max_concurrent_requests,
+            ),
+        )
         await self._client.__aenter__()
         return self
 
@@ -218,11 +249,13 @@ class AsyncAudibleClient:
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API path (e.g., "library", "catalog/products/B00123")
-            **kwargs: Additional request parameters
+            **kwargs: Additional request parameters; ``response_callback`` is
+                forwarded to the audible client instead of the query string
 
         Returns:
-            Response data as dict
+            Response data as dict, or whatever ``response_callback`` returns
         """
+        response_callback = kwargs.pop("response_callback", None)
         if not self._client:
             raise AsyncAudibleError("Client not initialized. Use 'async with' context manager.")
 
@@ -232,7 +265,7 @@ class AsyncAudibleClient:
             response: Any = None
             try:
                 if method.upper() == "GET":
-                    response = await self._client.get(path=path, params=kwargs)
+                    response = await self._client.get(path=path, response_callback=response_callback, params=kwargs)
                 elif method.upper() == "POST":
                     response = await self._client.post(path=path, body=kwargs.get("json", {}))
                 elif method.upper() == "DELETE":
@@ -280,31 +313,40 @@ class AsyncAudibleClient:
         if use_cache and self._cache:
             cached = self._cache.get("library", cache_key)
             if cached:
-                return [AudibleLibraryItem.model_validate(item) for item in cached]
+                return LIBRARY_ITEM_LIST_ADAPTER.validate_python(cached)
 
-        response = await self._request(
-            "GET",
-            "library",
-            num_results=num_results,
-            page=page,
-            response_groups=LIBRARY_RESPONSE_GROUPS,
-            sort_by=sort_value,
-            status=status_value,
+        body = cast(
+            bytes,
+            await self._request(
+                "GET",
+                "library",
+                num_results=num_results,
+                page=page,
+                response_groups=LIBRARY_RESPONSE_GROUPS,
+                sort_by=sort_value,
+                status=status_value,
+                response_callback=raw_response_body,
+            ),
         )
 
-        items_data = response.get("items", [])
-        items = []
-        for idx, item_data in enumerate(items_data):
-            try:
-                items.append(AudibleLibraryItem.model_validate(item_data))
-            except ValidationError as e:
-                logger.debug(
-                    "Failed to validate library item at index %d: %s. Item data: %s",
-                    idx,
-                    str(e),
-                    item_data.get("asin", "<unknown ASIN>"),
-                )
-                pass
+        # Parse items straight from the JSON body
+        try:
+            items = AudibleLibraryResponse.model_validate_json(body).items
+        except ValidationError:
+            # Some entry is malformed: validate one at a time and skip the bad ones
+            items_data = orjson.loads(body).get("items") or []
+            items = []
+            for idx, item_data in enumerate(items_data):
+                try:
+                    items.append(AudibleLibraryItem.model_validate(item_data))
+                except ValidationError as e:
+                    logger.debug(
+                        "Failed to validate library item at index %d: %s. Item data: %s",
+                        idx,
+                        str(e),
+                        item_data.get("asin", "<unknown ASIN>"),
+                    )
+                    pass
 
         # Cache results
         if self._cache:
@@ -315,17 +357,48 @@ class AsyncAudibleClient:
     async def get_all_library_items(
         self,
         use_cache: bool = True,
+        parallel: bool = False,
     ) -> list[AudibleLibraryItem]:
-        """Get all library items with pagination."""
+        """
+        Get all library items with pagination.
+
+        Args:
+            use_cache: Whether to use cache
+            parallel: After a full first page, fetch following pages concurrently in
+                windows of max_concurrent_requests (the library API gives no total count,
+                so pages are requested speculatively until one comes back short)
+
+        Returns:
+            List of all library items
+        """
+        page_size = 1000
         all_items: list[AudibleLibraryItem] = []
         page = 1
 
+        if parallel:
+            items = await self.get_library(num_results=page_size, page=page, use_cache=use_cache)
+            all_items.extend(items)
+            window = max(1, self._max_concurrent_requests)
+            while len(items) == page_size:
+                pages = await asyncio.gather(
+                    *(
+                        self.get_library(num_results=page_size, page=p, use_cache=use_cache)
+                        for p in range(page + 1, page + 1 + window)
+                    )
+                )
+                page += window
+                for items in pages:
+                    all_items.extend(items)
+                    if len(items) < page_size:
+                        break
+            return all_items
+
         while True:
-            items = await self.get_library(num_results=1000, page=page, use_cache=use_cache)
+            items = await self.get_library(num_results=page_size, page=page, use_cache=use_cache)
             if not items:
                 break
             all_items.extend(items)
-            if len(items) < 1000:
+            if len(items) < page_size:
                 break
             page += 1
 
@@ -453,7 +526,7 @@ class AsyncAudibleClient:
         if use_cache and self._cache:
             cached = self._cache.get("search", cache_key)
             if cached:
-                return [AudibleCatalogProduct.model_validate(p) for p in cached]
+                return CATALOG_PRODUCT_LIST_ADAPTER.validate_python(cached)
 
         params: dict[str, Any] = {
             "num_results": min(num_results, 50),
@@ -469,21 +542,28 @@ class AsyncAudibleClient:
         if narrator:
             params["narrator"] = narrator
 
-        response = await self._request("GET", "catalog/products", **params)
+        body = cast(
+            bytes, await self._request("GET", "catalog/products", response_callback=raw_response_body, **params)
+        )
 
-        products_data = response.get("products", [])
-        products = []
-        for idx, prod_data in enumerate(products_data):
-            try:
-                products.append(AudibleCatalogProduct.model_validate(prod_data))
-            except ValidationError as e:
-                logger.debug(
-                    "Failed to validate catalog product at index %d: %s. Product ASIN: %s",
-                    idx,
-                    str(e),
-                    prod_data.get("asin", "<unknown ASIN>"),
-                )
-                pass
+        # Parse products straight from the JSON body
+        try:
+            products = AudibleCatalogResponse.model_validate_json(body).products
+        except ValidationError:
+            # Some entry is malformed: validate one at a time and skip the bad ones
+            products_data = orjson.loads(body).get("products") or []
+            products = []
+            for idx, prod_data in enumerate(products_data):
+                try:
+                    products.append(AudibleCatalogProduct.model_validate(prod_data))
+                except ValidationError as e:
+                    logger.debug(
+                        "Failed to validate catalog product at index %d: %s. Product ASIN: %s",
+                        idx,
+                        str(e),
+                        prod_data.get("asin", "<unknown ASIN>"),
+                    )
+                    pass
 
         if self._cache:
             self._cache.set(
@@ -510,7 +590,7 @@ class AsyncAudibleClient:
         if use_cache and self._cache:
             cached = self._cache.get("catalog", cache_key)
             if cached:
-                return [AudibleCatalogProduct.model_validate(p) for p in cached]
+                return CATALOG_PRODUCT_LIST_ADAPTER.validate_python(cached)
 
         try:
             response = await self._request(
@@ -522,19 +602,23 @@ class AsyncAudibleClient:
             )
 
             products_data = response.get("similar_products", [])
-            products = []
-            for idx, prod_data in enumerate(products_data):
-                try:
-                    products.append(AudibleCatalogProduct.model_validate(prod_data))
-                except ValidationError as e:
-                    logger.debug(
-                        "Failed to validate similar product at index %d for ASIN %s: %s. Product ASIN: %s",
-                        idx,
-                        asin,
-                        str(e),
-                        prod_data.get("asin", "<unknown ASIN>"),
-                    )
-                    pass
+            try:
+                products = CATALOG_PRODUCT_LIST_ADAPTER.validate_python(products_data)
+            except ValidationError:
+                # Some entry is malformed: validate one at a time and skip the bad ones
+                products = []
+                for idx, prod_data in enumerate(products_data):
+                    try:
+                        products.append(AudibleCatalogProduct.model_validate(prod_data))
+                    except ValidationError as e:
+                        logger.debug(
+                            "Failed to validate similar product at index %d for ASIN %s: %s. Product ASIN: %s",
+                            idx,
+                            asin,
+                            str(e),
+                            prod_data.get("asin", "<unknown ASIN>"),
+                        )
+                        pass
 
             if self._cache:
                 self._cache.set(
@@ -577,7 +661,7 @@ class AsyncAudibleClient:
         if use_cache and self._cache:
             cached = self._cache.get("library", cache_key)
             if cached:
-                return [WishlistItem.model_validate(p) for p in cached]
+                return WISHLIST_ITEM_LIST_ADAPTER.validate_python(cached)
 
         response = await self._request(
             "GET",
@@ -589,23 +673,29 @@ class AsyncAudibleClient:
         )
 
         products_data = response.get("products", [])
-        products = []
-        for idx, prod_data in enumerate(products_data):
-            try:
-                products.append(WishlistItem.model_validate(prod_data))
-            except ValidationError as e:
-                logger.debug(
-                    "Failed to validate wishlist item at index %d: %s. Item ASIN: %s",
-                    idx,
-                    str(e),
-                    prod_data.get("asin", "<unknown ASIN>"),
-                )
-                pass
+        try:
+            products = WISHLIST_ITEM_LIST_ADAPTER.validate_python(products_data)
+            valid_raw = products_data
+        except ValidationError:
+            # Some entry is malformed: validate one at a time and skip the bad ones
+            products = []
+            valid_raw = []
+            for idx, prod_data in enumerate(products_data):
+                try:
+                    products.append(WishlistItem.model_validate(prod_data))
+                    valid_raw.append(prod_data)  # Only cache items we know are parseable
+                except ValidationError as e:
+                    logger.debug(
+                        "Failed to validate wishlist item at index %d: %s. Item ASIN: %s",
+                        idx,
+                        str(e),
+                        prod_data.get("asin", "<unknown ASIN>"),
+                    )
+                    pass
 
+        # Cache the raw API dicts rather than re-serializing the validated models
         if self._cache:
-            self._cache.set(
-                "library", cache_key, [p.model_dump() for p in products], ttl_seconds=self._cache_ttl_seconds
-            )
+            self._cache.set("library", cache_key, valid_raw, ttl_seconds=self._cache_ttl_seconds)
 
         return products
 
@@ -644,7 +734,7 @@ class AsyncAudibleClient:
         if use_cache and self._cache:
             cached = self._cache.get("catalog", cache_key)
             if cached:
-                return [AudibleCatalogProduct.model_validate(p) for p in cached]
+                return CATALOG_PRODUCT_LIST_ADAPTER.validate_python(cached)
 
         try:
             response = await self._request(
@@ -655,18 +745,22 @@ class AsyncAudibleClient:
             )
 
             products_data = response.get("products", [])
-            products = []
-            for idx, prod_data in enumerate(products_data):
-                try:
-                    products.append(AudibleCatalogProduct.model_validate(prod_data))
-                except ValidationError as e:
-                    logger.debug(
-                        "Failed to validate catalog product at index %d: %s. Product ASIN: %s",
-                        idx,
-                        str(e),
-                        prod_data.get("asin", "<unknown ASIN>"),
-                    )
-                    pass
+            try:
+                products = CATALOG_PRODUCT_LIST_ADAPTER.validate_python(products_data)
+            except ValidationError:
+                # Some entry is malformed: validate one at a time and skip the bad ones
+                products = []
+                for idx, prod_data in enumerate(products_data):
+                    try:
+                        products.append(AudibleCatalogProduct.model_validate(prod_data))
+                    except ValidationError as e:
+                        logger.debug(
+                            "Failed to validate catalog product at index %d: %s. Product ASIN: %s",
+                            idx,
+                            str(e),
+                            prod_data.get("asin", "<unknown ASIN>"),
+                        )
+                        pass
 
             if self._cache:
                 self._cache.set(
@@ -12,15 +12,21 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, cast
 
+import orjson
 from pydantic import ValidationError
 
 from audible import Authenticator, Client
 
 from .encryption import get_encryption_config, load_auth, save_auth
 from .models import (
+    CATALOG_PRODUCT_LIST_ADAPTER,
+    LIBRARY_ITEM_LIST_ADAPTER,
+    WISHLIST_ITEM_LIST_ADAPTER,
     AudibleAccountInfo,
     AudibleCatalogProduct,
+    AudibleCatalogResponse,
     AudibleLibraryItem,
+    AudibleLibraryResponse,
     AudibleListeningStats,
     CatalogSortBy,
     ChapterInfo,
@@ -34,6 +40,7 @@ from .models import (
     WishlistItem,
     WishlistSortBy,
 )
+from .utils import raw_response_body
 
 if TYPE_CHECKING:
     from ..cache import SQLiteCache
@@ -177,11 +184,13 @@ class AudibleClient:
 
         # Setup caching - prefer new SQLiteCache
         self._cache: Optional["SQLiteCache"] = cache
+        self._owns_cache = False  # close() only closes a cache this client created
         if cache is None and cache_dir:
             # Legacy support: create SQLiteCache from cache_dir
             from ..cache import SQLiteCache
 
             db_path = Path(cache_dir) / "cache.db"
+            self._owns_cache = True
             self._cache = SQLiteCache(
                 db_path=db_path,
                 default_ttl_hours=cache_ttl_hours if cache_ttl_hours != 240.0 else cache_ttl_days * 24,
@@ -587,28 +596,36 @@ class AudibleClient:
         if use_cache and self._cache:
             cached = self._cache.get("library", cache_key)
             if cached:
-                return [AudibleLibraryItem.model_validate(item) for item in cached]
+                return LIBRARY_ITEM_LIST_ADAPTER.validate_python(cached)
 
         # Make API request
-        response = self._request(
-            "GET",
-            "1.0/library",
-            num_results=num_results,
-            page=page,
-            response_groups=response_groups or LIBRARY_RESPONSE_GROUPS,
-            sort_by=sort_value,
-            status=status_value,
+        body = cast(
+            bytes,
+            self._request(
+                "GET",
+                "1.0/library",
+                num_results=num_results,
+                page=page,
+                response_groups=response_groups or LIBRARY_RESPONSE_GROUPS,
+                sort_by=sort_value,
+                status=status_value,
+                response_callback=raw_response_body,
+            ),
         )
 
-        # Parse items
-        items_data = response.get("items", [])
-        items = []
-        for item_data in items_data:
-            try:
-                items.append(AudibleLibraryItem.model_validate(item_data))
-            except ValidationError:
-                # Skip items that don't parse correctly
-                pass
+        # Parse items straight from the JSON body
+        try:
+            items = AudibleLibraryResponse.model_validate_json(body).items
+        except ValidationError:
+            # Some entry is malformed: validate one at a time and skip the bad ones
+            items_data = orjson.loads(body).get("items") or []
+            items = []
+            for item_data in items_data:
+                try:
+                    items.append(AudibleLibraryItem.model_validate(item_data))
+                except ValidationError:
+                    # Skip items that don't parse correctly
+                    pass
 
         # Cache results
         if self._cache:
@@ -783,7 +800,7 @@ class AudibleClient:
         if use_cache and self._cache:
             cached = self._cache.get("search", cache_key)
             if cached:
-                return [AudibleCatalogProduct.model_validate(p) for p in cached]
+                return CATALOG_PRODUCT_LIST_ADAPTER.validate_python(cached)
 
         # Build request params
         params = {
@@ -804,16 +821,20 @@ class AudibleClient:
         if publisher:
             params["publisher"] = publisher
 
-        response = self._request("GET", "1.0/catalog/products", **params)
+        body = cast(bytes, self._request("GET", "1.0/catalog/products", response_callback=raw_response_body, **params))
 
-        # Parse products
-        products_data = response.get("products", [])
-        products = []
-        for prod_data in products_data:
-            try:
-                products.append(AudibleCatalogProduct.model_validate(prod_data))
-            except ValidationError:
-                pass
+        # Parse products straight from the JSON body
+        try:
+            products = AudibleCatalogResponse.model_validate_json(body).products
+        except ValidationError:
+            # Some entry is malformed: validate one at a time and skip the bad ones
+            products_data = orjson.loads(body).get("products") or []
+            products = []
+            for prod_data in products_data:
+                try:
+                    products.append(AudibleCatalogProduct.model_validate(prod_data))
+                except ValidationError:
+                    pass
 
         # Cache results
         if self._cache:
@@ -863,7 +884,7 @@ class AudibleClient:
         if use_cache and self._cache:
             cached = self._cache.get("catalog", cache_key)
             if cached:
-                return [AudibleCatalogProduct.model_validate(p) for p in cached]
+                return CATALOG_PRODUCT_LIST_ADAPTER.validate_python(cached)
 
         try:
             response = self._request(
@@ -876,12 +897,16 @@ class AudibleClient:
 
             # Parse similar products
             products_data = response.get("similar_products", [])
-            products = []
-            for prod_data in products_data:
-                try:
-                    products.append(AudibleCatalogProduct.model_validate(prod_data))
-                except ValidationError:
-                    pass
+            try:
+                products = CATALOG_PRODUCT_LIST_ADAPTER.validate_python(products_data)
+            except ValidationError:
+                # Some entry is malformed: validate one at a time and skip the bad ones
+                products = []
+                for prod_data in products_data:
+                    try:
+                        products.append(AudibleCatalogProduct.model_validate(prod_data))
+                    except ValidationError:
+                        pass
 
             # Cache results
             if self._cache:
@@ -1030,7 +1055,7 @@ class AudibleClient:
         if use_cache and self._cache:
             cached = self._cache.get("library", cache_key)
             if cached:
-                return [WishlistItem.model_validate(p) for p in cached]
+                return WISHLIST_ITEM_LIST_ADAPTER.validate_python(cached)
 
         response = self._request(
             "GET",
@@ -1042,18 +1067,23 @@ class AudibleClient:
         )
 
         products_data = response.get("products", [])
-        products = []
-        for prod_data in products_data:
-            try:
-                products.append(WishlistItem.model_validate(prod_data))
-            except ValidationError:
-                pass
+        try:
+            products = WISHLIST_ITEM_LIST_ADAPTER.validate_python(products_data)
+            valid_raw = products_data
+        except ValidationError:
+            # Some entry is malformed: validate one at a time and skip the bad ones
+            products = []
+            valid_raw = []
+            for prod_data in products_data:
+                try:
+                    products.append(WishlistItem.model_validate(prod_data))
+                    valid_raw.append(prod_data)  # Only cache items we know are parseable
+                except ValidationError:
+                    pass
 
-        # Cache results
+        # Cache the raw API dicts rather than re-serializing the validated models
         if self._cache:
-            self._cache.set(
-                "library", cache_key, [p.model_dump() for p in products], ttl_seconds=self._cache_ttl_seconds
-            )
+            self._cache.set("library", cache_key, valid_raw, ttl_seconds=self._cache_ttl_seconds)
 
         return products
 
@@ -1176,7 +1206,7 @@ class AudibleClient:
         if use_cache and self._cache:
             cached = self._cache.get("catalog", cache_key)
             if cached:
-                return [AudibleCatalogProduct.model_validate(p) for p in cached]
+                return CATALOG_PRODUCT_LIST_ADAPTER.validate_python(cached)
 
         try:
             response = self._request(
@@ -1187,12 +1217,16 @@ class AudibleClient:
             )
 
             products_data = response.get("products", [])
-            products = []
-            for prod_data in products_data:
-                try:
-                    products.append(AudibleCatalogProduct.model_validate(prod_data))
-                except ValidationError:
-                    pass
+            try:
+                products = CATALOG_PRODUCT_LIST_ADAPTER.validate_python(products_data)
+            except ValidationError:
+                # Some entry is malformed: validate one at a time and skip the bad ones
+                products = []
+                for prod_data in products_data:
+                    try:
+                        products.append(AudibleCatalogProduct.model_validate(prod_data))
+                    except ValidationError:
+                        pass
 
             # Cache results
             if self._cache:
@@ -1413,6 +1447,8 @@ class AudibleClient:
         """Close the client and cleanup."""
         if self._client:
             self._client.close()
+        if self._owns_cache and self._cache:
+            self._cache.close()
 
     def __enter__(self) -> "AudibleClient":
         return self
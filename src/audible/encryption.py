@@ -13,6 +13,7 @@ import logging
 import os
 import stat
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -45,6 +46,30 @@ class AuthFileEncryption:
             raise ValueError("kdf_iterations must be between 1 and 65535")
 
 
+@lru_cache(maxsize=8)
+def _cached_detect_encryption(path_str: str, mtime_ns: int, size: int) -> str | None:
+    """Detect encryption for a specific (path, mtime, size) snapshot of an auth file."""
+    # audible reports plain files as False (or None if unrecognized); normalize both to None
+    return detect_file_encryption(Path(path_str)) or None
+
+
+def _detect_encryption(auth_path: Path) -> str | None:
+    """
+    Detect auth file encryption, reusing the result while the file is unchanged.
+
+    The cache is keyed on the file's mtime and size, so rewriting the file
+    (e.g. after a token refresh) invalidates the cached result.
+
+    Args:
+        auth_path: Path to the auth file (must exist)
+
+    Returns:
+        'json', 'bytes', or None if not encrypted
+    """
+    st = auth_path.stat()
+    return _cached_detect_encryption(str(auth_path), st.st_mtime_ns, st.st_size)
+
+
 def get_auth_password_from_env() -> str | None:
     """
     Get auth encryption password from environment variable.
@@ -109,7 +134,7 @@ def load_auth(
         raise FileNotFoundError(f"Auth file not found: {auth_path}")
 
     # Detect whether the existing file is encrypted
-    detected = detect_file_encryption(auth_path)
+    detected = _detect_encryption(auth_path)
 
     if detected:
         logger.debug("Detected encrypted auth file (style: %s)", detected)
@@ -177,7 +202,7 @@ def is_file_encrypted(auth_path: Path) -> bool:
     """
     if not auth_path.exists():
         return False
-    return bool(detect_file_encryption(auth_path))
+    return bool(_detect_encryption(auth_path))
 
 
 def get_file_encryption_style(auth_path: Path) -> str | None:
@@ -190,7 +215,4 @@ def get_file_encryption_style(auth_path: Path) -> str | None:
     Returns:
         'json', 'bytes', or None if not encrypted
     """
-    if not auth_path.exists():
-        return None
-    detected = detect_file_encryption(auth_path)
-    return detected if detected else None
+    return _detect_encryption(auth_path) if auth_path.exists() else None
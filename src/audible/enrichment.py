@@ -15,13 +15,18 @@ This module is used by multiple features:
 
 import asyncio
 import logging
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, Optional, cast
+import re
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, computed_field
 
-from .client import AudibleClient
-from .models import ContentQualityInfo, PlusCatalogInfo, PricingInfo
+from .client import AudibleClient, AudibleNotFoundError
+from .models import AudioFormat, ContentQualityInfo, PlusCatalogInfo, PricingInfo
 
 if TYPE_CHECKING:
     from ..cache import SQLiteCache
@@ -32,6 +37,158 @@ from .async_client import AsyncAudibleError
 
 logger = logging.getLogger(__name__)
 
+# Codec bitrate parsing. The "name" field has format like "aax_44_128" or "mp4_44_128" where:
+#   - "aax" or "mp4" = format
+#   - "44" or "22" = sample rate (44.1kHz or 22.05kHz)
+#   - "128" or "64" = bitrate in kbps (the last numeric part)
+# The "enhanced_codec" field has format like "LC_128_44100_stereo" where:
+#   - "LC" = codec type (AAC-LC)
+#   - "128" = bitrate (second part)
+#   - "44100" = sample rate
+#   - "stereo" = channel layout
+_CODEC_NAME_NUMBERS_RE = re.compile(r"_(\d+)(?=_|$)")
+_ENHANCED_CODEC_BITRATE_RE = re.compile(r"[^_]*_(\d+)(?:_|$)")
+_MAX_BITRATE_KBPS = 320  # Larger numbers are sample rates (22050, 44100), not bitrates
+
+
+def _extract_best_bitrate(codecs: list[dict[str, Any]]) -> int | None:
+    """
+    Get the best catalog bitrate (kbps) from an available_codecs list.
+
+    Codecs are scanned in order and the highest bitrate wins. The "name" field
+    is parsed first; "enhanced_codec" is consulted while no bitrate has been
+    found yet, so an earlier enhanced_codec bitrate can still beat a lower
+    name bitrate from a later codec.
+    """
+    best = 0
+    for codec in codecs:
+        numbers = _CODEC_NAME_NUMBERS_RE.findall(codec.get("name", ""))
+        if numbers:
+            bitrate = int(numbers[-1])
+            if best < bitrate <= _MAX_BITRATE_KBPS:
+                best = bitrate
+
+        if not best:
+            match = _ENHANCED_CODEC_BITRATE_RE.match(codec.get("enhanced_codec", ""))
+            if match and int(match.group(1)) <= _MAX_BITRATE_KBPS:
+                best = int(match.group(1))
+
+    return best or None
+
+
+# Cover image sizes in order of preference (500px first, then larger, then smaller)
+_COVER_IMAGE_SIZES = ("500", "1024", "252")
+
+
+def _pick_cover_image(product_images: dict[str, str]) -> str | None:
+    """Pick the preferred cover image URL, falling back to any available size."""
+    for size in _COVER_IMAGE_SIZES:
+        url = product_images.get(size)
+        if url:
+            return url
+    return next(iter(product_images.values()), None)
+
+
+# Cached in place of an enrichment when the catalog has no such product
+_NOT_FOUND_MARKER: dict[str, Any] = {"_not_found": True}
+
+
+def _minimal_owned_enrichment(asin: str) -> "AudibleEnrichment":
+    """Build an ownership-only enrichment for an owned ASIN without any catalog data."""
+    return AudibleEnrichment(asin=asin, owned=True, audible_url=f"https://www.audible.com/pd/{asin}")
+
+
+def _compute_scoring(
+    owned: bool, plus_catalog: PlusCatalogInfo, pricing: PricingInfo | None, has_atmos: bool
+) -> tuple[float, str]:
+    """
+    Compute priority boost and acquisition recommendation in one pass.
+
+    Both are driven by the same ownership / Plus Catalog / pricing checks,
+    so the decision tree is walked once.
+
+    Args:
+        owned: User owns the title on Audible
+        plus_catalog: Plus Catalog status
+        pricing: Pricing info, if known
+        has_atmos: Dolby Atmos version available
+
+    Returns:
+        Tuple of (priority_boost, acquisition_recommendation). Higher boost =
+        more urgent to acquire; recommendation is one of FREE, MONTHLY_DEAL,
+        GOOD_DEAL, CREDIT, EXPENSIVE, OWNED, or N/A
+    """
+    # Already owned - no need to acquire (still show but deprioritize)
+    if owned:
+        return 0.1, "OWNED"
+
+    boost = 1.0
+
+    # Plus Catalog items get highest priority (FREE!)
+    if plus_catalog.is_plus_catalog:
+        boost = 5.0
+        recommendation = "FREE"
+        # Extra boost for expiring soon
+        if plus_catalog.is_expiring_soon:
+            days = plus_catalog.days_until_expiration or 30
+            # More urgent as expiration approaches
+            boost += (30 - days) / 6  # Up to +5 for same-day
+            recommendation = f"FREE (expires {plus_catalog.expiration_display})"
+
+    elif pricing:
+        discount = pricing.discount_percent or 0
+        is_good_deal = pricing.is_good_deal
+        price = pricing.effective_price
+        is_monthly_deal = pricing.is_monthly_deal
+
+        # Monthly deals (type=sale) with big discounts (50%+) - time limited!
+        if is_monthly_deal:
+            if discount >= 70:
+                boost = 4.0  # Almost as good as free!
+            elif discount >= 50:
+                boost = 3.5
+            elif is_good_deal:
+                boost = 3.0
+        # Good deals get priority
+        elif is_good_deal:
+            boost = 3.0 if discount >= 50 else 2.5
+
+        if is_monthly_deal and discount >= 50:
+            recommendation = f"MONTHLY_DEAL (${price:.2f}, {discount:.0f}% off)"
+        elif is_good_deal:
+            if discount > 0:
+                recommendation = f"GOOD_DEAL (${price:.2f}, {discount:.0f}% off)"
+            else:
+                recommendation = f"GOOD_DEAL (${price:.2f})"
+        elif pricing.credit_price == 1.0:
+            recommendation = "CREDIT"
+        else:
+            recommendation = f"EXPENSIVE (${price:.2f})"
+
+    else:
+        recommendation = "N/A"
+
+    # Atmos upgrade available
+    if has_atmos:
+        boost += 0.5
+
+    return boost, recommendation
+
+
+@dataclass(slots=True, frozen=True)
+class AudibleEnrichmentHeader:
+    """
+    Lightweight acquisition summary for an ASIN.
+
+    Carries just enough to decide whether an upgrade is worthwhile, without
+    building a full AudibleEnrichment.
+    """
+
+    asin: str
+    owned: bool
+    priority_boost: float
+    acquisition_recommendation: str
+
 
 class AudibleEnrichment(BaseModel):
     """
@@ -107,6 +264,38 @@ class AudibleEnrichment(BaseModel):
             return f"{self.best_bitrate} kbps"
         return "Unknown"
 
+    @property
+    def scoring(self) -> tuple[float, str]:
+        """
+        Get (priority_boost, acquisition_recommendation) from one scoring pass.
+
+        The result is memoized against the scoring inputs, so reading both
+        values (e.g. in model_dump) walks the decision tree once, while any
+        change to ownership, pricing, Plus Catalog or Atmos is picked up.
+        """
+        pricing = self.pricing
+        plus_catalog = self.plus_catalog
+        key = (
+            self.owned,
+            self.has_atmos,
+            plus_catalog.is_plus_catalog,
+            plus_catalog.days_until_expiration,
+            (
+                None
+                if pricing is None
+                else (pricing.list_price, pricing.sale_price, pricing.credit_price, pricing.is_monthly_deal)
+            ),
+        )
+        # Kept in the instance __dict__ (like cached_property) so it stays out of
+        # equality and serialization; the key check makes copies and mutation safe
+        memo = self.__dict__.get("_scoring_memo")
+        if memo is None or memo[0] != key:
+            memo = (key, _compute_scoring(self.owned, plus_catalog, pricing, self.has_atmos))
+            self.__dict__["_scoring_memo"] = memo
+        result: tuple[float, str] = memo[1]
+        return result
+
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def acquisition_recommendation(self) -> str:
         """
@@ -115,33 +304,9 @@ class AudibleEnrichment(BaseModel):
         Returns:
             Recommendation string: FREE, MONTHLY_DEAL, GOOD_DEAL, CREDIT, EXPENSIVE, OWNED, or N/A
         """
-        if self.owned:
-            return "OWNED"
-
-        if self.plus_catalog.is_plus_catalog:
-            if self.plus_catalog.is_expiring_soon:
-                return f"FREE (expires {self.plus_catalog.expiration_display})"
-            return "FREE"
-
-        if self.pricing:
-            # Monthly deals (type=sale) with big discounts
-            if self.pricing.is_monthly_deal:
-                discount = self.pricing.discount_percent or 0
-                if discount >= 50:
-                    return f"MONTHLY_DEAL (${self.pricing.effective_price:.2f}, {discount:.0f}% off)"
-
-            if self.pricing.is_good_deal:
-                discount = self.pricing.discount_percent or 0
-                if discount > 0:
-                    return f"GOOD_DEAL (${self.pricing.effective_price:.2f}, {discount:.0f}% off)"
-                return f"GOOD_DEAL (${self.pricing.effective_price:.2f})"
-            elif self.pricing.credit_price == 1.0:
-                return "CREDIT"
-            else:
-                return f"EXPENSIVE (${self.pricing.effective_price:.2f})"
-
-        return "N/A"
+        return self.scoring[1]
 
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def priority_boost(self) -> float:
         """
@@ -149,43 +314,49 @@ class AudibleEnrichment(BaseModel):
 
         Higher boost = more urgent to acquire.
         """
-        boost = 1.0
-
-        # Plus Catalog items get highest priority (FREE!)
-        if self.plus_catalog.is_plus_catalog:
-            boost = 5.0
-            # Extra boost for expiring soon
-            if self.plus_catalog.is_expiring_soon:
-                days = self.plus_catalog.days_until_expiration or 30
-                # More urgent as expiration approaches
-                boost += (30 - days) / 6  # Up to +5 for same-day
-
-        # Monthly deals with big discounts (50%+) - time limited!
-        elif self.pricing and self.pricing.is_monthly_deal:
-            discount = self.pricing.discount_percent or 0
-            if discount >= 70:
-                boost = 4.0  # Almost as good as free!
-            elif discount >= 50:
-                boost = 3.5
-            elif self.pricing.is_good_deal:
-                boost = 3.0
+        return self.scoring[0]
 
-        # Good deals get priority
-        elif self.pricing and self.pricing.is_good_deal:
-            boost = 2.5
-            discount = self.pricing.discount_percent or 0
-            if discount >= 50:
-                boost = 3.0
+    @classmethod
+    def from_cached(cls, data: dict[str, Any]) -> "AudibleEnrichment":
+        """
+        Rebuild an enrichment from its cached model_dump() without validation.
 
-        # Atmos upgrade available
-        if self.has_atmos:
-            boost += 0.5
+        Cached entries were produced by this model, so nested models are
+        rebuilt with model_construct. Use model_validate for anything else.
+
+        Args:
+            data: Dict previously produced by model_dump() (and JSON round-tripped)
 
-        # Already owned - no need to acquire
-        if self.owned:
-            boost = 0.1  # Still show but deprioritize
+        Returns:
+            AudibleEnrichment
+        """
+        fields = dict(data)
+        fields["available_codecs"] = [sys.intern(name) for name in fields.get("available_codecs", [])]
+
+        pricing = fields.get("pricing")
+        if pricing is not None:
+            fields["pricing"] = PricingInfo.model_construct(**pricing)
+
+        plus_catalog = fields.get("plus_catalog")
+        if plus_catalog is not None:
+            # JSON round-trip turns the expiration datetime into an ISO string
+            expiration = plus_catalog.get("expiration_date")
+            if isinstance(expiration, str):
+                plus_catalog = {**plus_catalog, "expiration_date": datetime.fromisoformat(expiration)}
+            fields["plus_catalog"] = PlusCatalogInfo.model_construct(**plus_catalog)
+
+        quality = fields.get("actual_quality")
+        if quality is not None:
+            best_format = quality.get("best_format")
+            fields["actual_quality"] = ContentQualityInfo.model_construct(
+                **{
+                    **quality,
+                    "formats": [AudioFormat.model_construct(**f) for f in quality.get("formats", [])],
+                    "best_format": AudioFormat.model_construct(**best_format) if best_format else None,
+                }
+            )
 
-        return boost
+        return cls.model_construct(**fields)
 
 
 class AudibleEnrichmentService:
@@ -201,6 +372,11 @@ class AudibleEnrichmentService:
 
     CACHE_NAMESPACE = "audible_enrichment"
     CACHE_TTL_SECONDS = 3600 * 6  # 6 hours base (actual TTL may be shorter near month end)
+    OWNERSHIP_NAMESPACE = "ownership_v1"  # Compact list of owned ASINs (avoids re-parsing the library)
+    OWNERSHIP_CACHE_KEY = "library_asins"
+    OWNERSHIP_TTL_SECONDS = 600  # Short so new purchases show up quickly
+    NOT_FOUND_TTL_SECONDS = 3600  # Negative results for ASINs missing from the catalog
+    PROGRESS_INTERVAL_SECONDS = 0.033  # ~30 progress updates/sec is all a terminal can render
 
     def __init__(
         self,
@@ -214,7 +390,7 @@ class AudibleEnrichmentService:
         Args:
             client: Authenticated AudibleClient
             cache: Optional SQLiteCache for caching enrichment results
-            progress_callback: Optional callback(current, total, message)
+            progress_callback: Optional callback(current, total, asin), rate-limited during batches
         """
         self._client = client
         self._cache = cache
@@ -234,60 +410,87 @@ class AudibleEnrichmentService:
         }
 
     def _load_library_asins(self) -> set[str]:
-        """Load all ASINs from user's Audible library."""
+        """
+        Load all ASINs from user's Audible library.
+
+        Tries the cached ownership list first; only falls back to walking the
+        full library (and then caches the ASIN list) when it's missing or expired.
+        """
         if self._library_asins is None:
-            library = self._client.get_all_library_items(use_cache=True)
-            self._library_asins = {item.asin for item in library}
+            cached = self._cache.get(self.OWNERSHIP_NAMESPACE, self.OWNERSHIP_CACHE_KEY) if self._cache else None
+            if cached is not None:
+                self._library_asins = set(cached)
+            else:
+                library = self._client.get_all_library_items(use_cache=True)
+                self._library_asins = {item.asin for item in library}
+                if self._cache:
+                    self._cache.set(
+                        self.OWNERSHIP_NAMESPACE,
+                        self.OWNERSHIP_CACHE_KEY,
+                        sorted(self._library_asins),
+                        ttl_seconds=self.OWNERSHIP_TTL_SECONDS,
+                    )
         return self._library_asins
 
+    def prefetch_library(self) -> None:
+        """Warm the library ownership set once before enriching many ASINs."""
+        self._load_library_asins()
+
     def _get_catalog_product(self, asin: str) -> dict[str, Any]:
         """Get product data from Audible catalog API."""
-        return cast(
-            dict[str, Any],
-            self._client._request(
-                "GET",
-                f"1.0/catalog/products/{asin}",
-                response_groups="contributors,media,product_attrs,product_desc,product_details,product_extended_attrs,series,category_ladders,customer_rights,price",
-            ),
+        return self._client._request(
+            "GET",
+            f"1.0/catalog/products/{asin}",
+            response_groups="contributors,media,product_attrs,product_desc,product_details,product_extended_attrs,series,category_ladders,customer_rights,price",
         )
 
-    def enrich_single(self, asin: str, use_cache: bool = True) -> AudibleEnrichment | None:
+    def enrich_single(
+        self,
+        asin: str,
+        use_cache: bool = True,
+        minimal: bool = False,
+        *,
+        _library_asins: set[str] | None = None,
+    ) -> AudibleEnrichment | None:
         """
         Enrich a single ASIN with Audible data.
 
         Args:
             asin: Audible ASIN
             use_cache: Use cached data if available
+            minimal: Skip the catalog lookup for owned ASINs and return ownership only
+            _library_asins: Preloaded library ASINs (passed by batch callers to skip the lookup)
 
         Returns:
             AudibleEnrichment or None if not found
         """
         cache_key = f"enrich_{asin}"
+        library_asins = _library_asins if _library_asins is not None else self._load_library_asins()
 
         # Check cache first (no rate limiting!)
         if use_cache and self._cache:
             cached = self._cache.get(self.CACHE_NAMESPACE, cache_key)
             if cached:
                 self._cache_hits += 1
-                enrichment = AudibleEnrichment.model_validate(cached)
+                if cached.get("_not_found"):
+                    return None
+                enrichment = AudibleEnrichment.from_cached(cached)
                 # Update ownership from current library (may have changed)
-                library_asins = self._load_library_asins()
                 enrichment.owned = asin in library_asins
                 return enrichment
 
         # Check ownership
-        library_asins = self._load_library_asins()
         owned = asin in library_asins
+        if minimal and owned:
+            return _minimal_owned_enrichment(asin)
 
         # Get catalog data via raw API for plans field
         self._api_calls += 1
         try:
             response = self._get_catalog_product(asin)
-            if not response:
-                logger.debug("No catalog response for ASIN %s", asin)
-                return None
-
-            product = response.get("product", response)
+            product = response.get("product", response) if response else None
+        except AudibleNotFoundError:
+            product = None
         except Exception as e:
             logger.debug(
                 "Failed to get catalog product for ASIN %s: %s",
@@ -297,12 +500,21 @@ class AudibleEnrichmentService:
             return None
 
         if not product:
+            logger.debug("No catalog product for ASIN %s", asin)
+            # Remember the miss briefly so retries don't hit the API again
+            if self._cache:
+                self._cache.set(
+                    self.CACHE_NAMESPACE, cache_key, _NOT_FOUND_MARKER, ttl_seconds=self.NOT_FOUND_TTL_SECONDS
+                )
             return None
 
+        # Bind the lookup once; the product dict is read ~10 times below
+        get = product.get
+
         # Parse data
         enrichment = AudibleEnrichment(
             asin=asin,
-            title=product.get("title"),
+            title=get("title"),
             owned=owned,
         )
 
@@ -310,73 +522,34 @@ class AudibleEnrichmentService:
         enrichment.audible_url = f"https://www.audible.com/pd/{asin}"
 
         # Cover image URL (from product_images)
-        product_images = cast(dict[str, Any], product.get("product_images", {}))
+        product_images: dict[str, str] = get("product_images", {})
         if product_images:
-            # Prefer 500px, fall back to largest available
-            enrichment.cover_image_url = cast(
-                str | None,
-                product_images.get("500")
-                or product_images.get("1024")
-                or product_images.get("252")
-                or next(iter(product_images.values()), None),
-            )
+            enrichment.cover_image_url = _pick_cover_image(product_images)
 
         # Pricing - use shared parsing
-        enrichment.pricing = PricingInfo.from_api_response(cast(dict[str, Any] | None, product.get("price")))
+        enrichment.pricing = PricingInfo.from_api_response(get("price"))
 
         # Plus Catalog from plans - use shared parsing
-        enrichment.plus_catalog = PlusCatalogInfo.from_api_response(
-            cast(list[dict[str, Any]], product.get("plans", []))
-        )
+        enrichment.plus_catalog = PlusCatalogInfo.from_api_response(get("plans", []))
 
         # Available codecs
-        available_codecs = cast(list[dict[str, Any]], product.get("available_codecs", []))
-        enrichment.available_codecs = [cast(str, c.get("name", "")) for c in available_codecs]
+        available_codecs: list[dict[str, Any]] = get("available_codecs", [])
+        # Only a handful of distinct codec names exist; intern them so thousands of
+        # enrichments share the same string objects
+        enrichment.available_codecs = [sys.intern(name) for c in available_codecs if (name := c.get("name"))]
 
         # Check for Atmos
-        enrichment.has_atmos = product.get("has_dolby_atmos", False)
+        enrichment.has_atmos = get("has_dolby_atmos", False)
 
         # For spatial audio detection via asset_details
-        asset_details = product.get("asset_details", [])
+        asset_details = get("asset_details", [])
         for asset in asset_details:
             if asset.get("is_spatial"):
                 enrichment.has_atmos = True
                 break
 
         # Best bitrate from codecs
-        # The "name" field has format like "aax_44_128" or "mp4_44_128" where:
-        #   - "aax" or "mp4" = format
-        #   - "44" or "22" = sample rate (44.1kHz or 22.05kHz)
-        #   - "128" or "64" = bitrate in kbps
-        # The "enhanced_codec" field has format like "LC_128_44100_stereo" where:
-        #   - "LC" = codec type (AAC-LC)
-        #   - "128" = bitrate (second part)
-        #   - "44100" = sample rate
-        #   - "stereo" = channel layout
-        for codec in available_codecs:
-            # Method 1: Parse from "name" field (most reliable)
-            # Format: "aax_44_128" -> bitrate is the last number
-            codec_name = codec.get("name", "")
-            if "_" in codec_name:
-                parts = codec_name.split("_")
-                # Last numeric part is typically the bitrate
-                for part in reversed(parts):
-                    if part.isdigit():
-                        bitrate = int(part)
-                        # Filter out sample rates (22050, 44100) - bitrates are typically <= 320
-                        if bitrate <= 320 and bitrate > (enrichment.best_bitrate or 0):
-                            enrichment.best_bitrate = bitrate
-                        break
-
-            # Method 2: Parse from "enhanced_codec" field as fallback
-            # Format: "LC_128_44100_stereo" -> bitrate is typically second part
-            enhanced_codec = codec.get("enhanced_codec", "")
-            if "_" in enhanced_codec and not enrichment.best_bitrate:
-                parts = enhanced_codec.split("_")
-                if len(parts) >= 2 and parts[1].isdigit():
-                    bitrate = int(parts[1])
-                    if bitrate <= 320 and bitrate > (enrichment.best_bitrate or 0):
-                        enrichment.best_bitrate = bitrate
+        enrichment.best_bitrate = _extract_best_bitrate(available_codecs)
 
         # API reliability - unreliable for Atmos/USAC
         if enrichment.has_atmos:
@@ -392,36 +565,122 @@ class AudibleEnrichmentService:
 
         return enrichment
 
+    def enrich_batch_iter(
+        self,
+        asins: list[str],
+        use_cache: bool = True,
+        minimal: bool = False,
+    ) -> Iterator[AudibleEnrichment]:
+        """
+        Enrich multiple ASINs, yielding each result as it is produced.
+
+        ASINs that can't be enriched are skipped.
+
+        Args:
+            asins: List of ASINs to enrich
+            use_cache: Use cached data if available
+            minimal: Skip catalog lookups for owned ASINs (ownership-only results)
+
+        Yields:
+            AudibleEnrichment for each ASIN that was found
+        """
+        total = len(asins)
+        last_progress = 0.0
+
+        # Preload library once for ownership checks across the batch
+        library_asins = self._load_library_asins()
+
+        for i, asin in enumerate(asins):
+            # Throttle progress updates; always report the final item
+            if self._progress:
+                now = time.monotonic()
+                if now - last_progress > self.PROGRESS_INTERVAL_SECONDS or i == total - 1:
+                    self._progress(i + 1, total, asin)
+                    last_progress = now
+
+            enrichment = self.enrich_single(asin, use_cache=use_cache, minimal=minimal, _library_asins=library_asins)
+            if enrichment:
+                yield enrichment
+
     def enrich_batch(
         self,
         asins: list[str],
         use_cache: bool = True,
+        minimal: bool = False,
     ) -> dict[str, AudibleEnrichment]:
         """
         Enrich multiple ASINs with Audible data.
 
+        Prefer enrich_batch_iter when the results are only iterated.
+
         Args:
             asins: List of ASINs to enrich
             use_cache: Use cached data if available
+            minimal: Skip catalog lookups for owned ASINs (ownership-only results)
 
         Returns:
             Dict mapping ASIN to enrichment data
         """
-        results = {}
-        total = len(asins)
+        return {e.asin: e for e in self.enrich_batch_iter(asins, use_cache=use_cache, minimal=minimal)}
 
-        # Preload library for ownership check
-        self._load_library_asins()
+    def enrich_batch_headers(
+        self,
+        asins: list[str],
+        use_cache: bool = True,
+    ) -> dict[str, AudibleEnrichmentHeader]:
+        """
+        Get ownership and acquisition priority for multiple ASINs.
 
-        for i, asin in enumerate(asins):
-            if self._progress:
-                self._progress(i + 1, total, f"Enriching {asin}...")
+        Cached entries are summarized straight from the cached dict, so no
+        AudibleEnrichment is built for them; only misses go through the full
+        enrichment (which also populates the cache).
 
-            enrichment = self.enrich_single(asin, use_cache=use_cache)
-            if enrichment:
-                results[asin] = enrichment
+        Args:
+            asins: List of ASINs to summarize
+            use_cache: Use cached data if available
 
-        return results
+        Returns:
+            Dict mapping ASIN to its header (ASINs that can't be enriched are skipped)
+        """
+        library_asins = self._load_library_asins()
+        headers: dict[str, AudibleEnrichmentHeader] = {}
+
+        cached: dict[str, Any] = {}
+        if use_cache and self._cache:
+            cached = self._cache.get_many(self.CACHE_NAMESPACE, [f"enrich_{asin}" for asin in asins])
+
+        misses = []
+        for asin in asins:
+            data = cached.get(f"enrich_{asin}")
+            if not data:
+                misses.append(asin)
+                continue
+            self._cache_hits += 1
+            if data.get("_not_found"):
+                continue
+            headers[asin] = self._header_from_cached(asin, data, asin in library_asins)
+
+        for enrichment in self.enrich_batch_iter(misses, use_cache=False):
+            headers[enrichment.asin] = AudibleEnrichmentHeader(
+                asin=enrichment.asin,
+                owned=enrichment.owned,
+                priority_boost=enrichment.priority_boost,
+                acquisition_recommendation=enrichment.acquisition_recommendation,
+            )
+
+        return headers
+
+    @staticmethod
+    def _header_from_cached(asin: str, cached: dict[str, Any], owned: bool) -> AudibleEnrichmentHeader:
+        """Summarize a cached enrichment dict, rescoring only when ownership changed."""
+        boost = cached.get("priority_boost")
+        recommendation = cached.get("acquisition_recommendation")
+        if owned != cached.get("owned") or boost is None or recommendation is None:
+            enrichment = AudibleEnrichment.from_cached({**cached, "owned": owned})
+            boost, recommendation = enrichment.priority_boost, enrichment.acquisition_recommendation
+        return AudibleEnrichmentHeader(
+            asin=asin, owned=owned, priority_boost=boost, acquisition_recommendation=recommendation
+        )
 
 
 class AsyncAudibleEnrichmentService:
@@ -446,6 +705,11 @@ class AsyncAudibleEnrichmentService:
 
     CACHE_NAMESPACE = "audible_enrichment_v2"  # New namespace for quality-enriched data
     CACHE_TTL_SECONDS = 3600 * 6  # 6 hours base (actual TTL may be shorter near month end)
+    OWNERSHIP_NAMESPACE = "ownership_v1"  # Compact list of owned ASINs (avoids re-parsing the library)
+    OWNERSHIP_CACHE_KEY = "library_asins"
+    OWNERSHIP_TTL_SECONDS = 600  # Short so new purchases show up quickly
+    NOT_FOUND_TTL_SECONDS = 3600  # Negative results for ASINs missing from the catalog
+    PROGRESS_INTERVAL_SECONDS = 0.033  # ~30 progress updates/sec is all a terminal can render
 
     def __init__(
         self,
@@ -459,12 +723,14 @@ class AsyncAudibleEnrichmentService:
         Args:
             async_client: Authenticated AsyncAudibleClient (must be in context)
             cache: Optional SQLiteCache for caching enrichment results
-            progress_callback: Optional callback(current, total, message)
+            progress_callback: Optional callback(current, total, asin), rate-limited during batches
         """
         self._client = async_client
         self._cache = cache
         self._progress = progress_callback
         self._library_asins: set[str] | None = None
+        # Uncached lookups currently running, so concurrent callers for the same ASIN share one fetch
+        self._inflight: dict[tuple[str, bool], asyncio.Future[AudibleEnrichment | None]] = {}
 
         # Stats
         self._cache_hits = 0
@@ -481,17 +747,57 @@ class AsyncAudibleEnrichmentService:
         }
 
     async def _load_library_asins(self) -> set[str]:
-        """Load all ASINs from user's Audible library."""
+        """
+        Load all ASINs from user's Audible library.
+
+        Tries the cached ownership list first; only falls back to walking the
+        full library (and then caches the ASIN list) when it's missing or expired.
+        """
         if self._library_asins is None:
-            library = await self._client.get_all_library_items(use_cache=True)
-            self._library_asins = {item.asin for item in library}
+            cached = self._cache.get(self.OWNERSHIP_NAMESPACE, self.OWNERSHIP_CACHE_KEY) if self._cache else None
+            if cached is not None:
+                self._library_asins = set(cached)
+            else:
+                library = await self._client.get_all_library_items(use_cache=True, parallel=True)
+                self._library_asins = {item.asin for item in library}
+                if self._cache:
+                    self._cache.set(
+                        self.OWNERSHIP_NAMESPACE,
+                        self.OWNERSHIP_CACHE_KEY,
+                        sorted(self._library_asins),
+                        ttl_seconds=self.OWNERSHIP_TTL_SECONDS,
+                    )
         return self._library_asins
 
+    async def prefetch_library(self) -> None:
+        """Warm the library ownership set once before enriching many ASINs."""
+        await self._load_library_asins()
+
+    @staticmethod
+    def _cache_key(asin: str) -> str:
+        """Build the enrichment cache key for an ASIN."""
+        return f"enrich_v2_{asin}"
+
+    def _from_cache(self, asin: str, cached: dict[str, Any], library_asins: set[str]) -> AudibleEnrichment | None:
+        """Rebuild a cached enrichment, refreshing ownership from the current library (None if cached as missing)."""
+        self._cache_hits += 1
+        if cached.get("_not_found"):
+            return None
+        enrichment = AudibleEnrichment.from_cached(cached)
+        # Update ownership from current library (may have changed)
+        enrichment.owned = asin in library_asins
+        return enrichment
+
     async def enrich_single_with_quality(
         self,
         asin: str,
         use_cache: bool = True,
         discover_quality: bool = True,
+        minimal: bool = False,
+        *,
+        _library_asins: set[str] | None = None,
+        _skip_cache_read: bool = False,
+        _cache_writes: list[tuple[str, Any, float | None]] | None = None,
     ) -> AudibleEnrichment | None:
         """
         Enrich a single ASIN with Audible data including actual quality.
@@ -500,27 +806,59 @@ class AsyncAudibleEnrichmentService:
             asin: Audible ASIN
             use_cache: Use cached data if available
             discover_quality: Make license requests to discover actual quality
+            minimal: Skip catalog and quality lookups for owned ASINs and return ownership only
+            _library_asins: Preloaded library ASINs (passed by batch callers to skip the lookup)
+            _skip_cache_read: Skip the enrichment cache lookup (batch callers already checked it)
+            _cache_writes: Buffer to append the cache entry to instead of writing it immediately
 
         Returns:
             AudibleEnrichment or None if not found
         """
-        cache_key = f"enrich_v2_{asin}"
+        cache_key = self._cache_key(asin)
+        library_asins = _library_asins if _library_asins is not None else await self._load_library_asins()
 
         # Check cache first
-        if use_cache and self._cache:
+        if use_cache and self._cache and not _skip_cache_read:
             cached = self._cache.get(self.CACHE_NAMESPACE, cache_key)
             if cached:
-                self._cache_hits += 1
-                enrichment = AudibleEnrichment.model_validate(cached)
-                # Update ownership from current library (may have changed)
-                library_asins = await self._load_library_asins()
-                enrichment.owned = asin in library_asins
-                return enrichment
+                return self._from_cache(asin, cached, library_asins)
 
-        # Check ownership
-        library_asins = await self._load_library_asins()
-        owned = asin in library_asins
+        if minimal and asin in library_asins:
+            return _minimal_owned_enrichment(asin)
+
+        # Another caller is already fetching this ASIN - wait for its result
+        inflight_key = (asin, discover_quality)
+        inflight = self._inflight.get(inflight_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
 
+        future: asyncio.Future[AudibleEnrichment | None] = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = future
+        try:
+            result = await self._fetch_with_quality(
+                asin, asin in library_asins, use_cache, discover_quality, cache_key, _cache_writes
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody else awaited isn't logged by the loop
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[inflight_key]
+
+    async def _fetch_with_quality(
+        self,
+        asin: str,
+        owned: bool,
+        use_cache: bool,
+        discover_quality: bool,
+        cache_key: str,
+        cache_writes: list[tuple[str, Any, float | None]] | None,
+    ) -> AudibleEnrichment | None:
+        """Fetch catalog and quality data for an ASIN and cache the resulting enrichment."""
         # Get catalog product
         self._api_calls += 1
         try:
@@ -530,6 +868,14 @@ class AsyncAudibleEnrichmentService:
             return None
 
         if not product:
+            # Remember the miss briefly so retries don't hit the API again
+            if self._cache:
+                if cache_writes is not None:
+                    cache_writes.append((cache_key, _NOT_FOUND_MARKER, self.NOT_FOUND_TTL_SECONDS))
+                else:
+                    self._cache.set(
+                        self.CACHE_NAMESPACE, cache_key, _NOT_FOUND_MARKER, ttl_seconds=self.NOT_FOUND_TTL_SECONDS
+                    )
             return None
 
         # Build enrichment from catalog data
@@ -544,12 +890,7 @@ class AsyncAudibleEnrichmentService:
 
         # Cover image URL
         if product.product_images:
-            enrichment.cover_image_url = (
-                product.product_images.get("500")
-                or product.product_images.get("1024")
-                or product.product_images.get("252")
-                or next(iter(product.product_images.values()), None)
-            )
+            enrichment.cover_image_url = _pick_cover_image(product.product_images)
 
         # Pricing
         enrichment.pricing = PricingInfo.from_api_response(product.price)
@@ -568,24 +909,7 @@ class AsyncAudibleEnrichmentService:
         model_extra = getattr(product, "model_extra", None) or {}
         available_codecs = model_extra.get("available_codecs", []) if isinstance(model_extra, dict) else []
         if available_codecs:
-            for codec in available_codecs:
-                codec_name = codec.get("name", "")
-                if "_" in codec_name:
-                    parts = codec_name.split("_")
-                    for part in reversed(parts):
-                        if part.isdigit():
-                            bitrate = int(part)
-                            if bitrate <= 320 and bitrate > (enrichment.best_bitrate or 0):
-                                enrichment.best_bitrate = bitrate
-                            break
-
-                enhanced_codec = codec.get("enhanced_codec", "")
-                if "_" in enhanced_codec and not enrichment.best_bitrate:
-                    parts = enhanced_codec.split("_")
-                    if len(parts) >= 2 and parts[1].isdigit():
-                        bitrate = int(parts[1])
-                        if bitrate <= 320 and bitrate > (enrichment.best_bitrate or 0):
-                            enrichment.best_bitrate = bitrate
+            enrichment.best_bitrate = _extract_best_bitrate(available_codecs)
 
         # Discover actual quality via fast metadata endpoint (~3x faster than license requests)
         if discover_quality:
@@ -611,12 +935,15 @@ class AsyncAudibleEnrichmentService:
             from ..cache.sqlite_cache import calculate_pricing_ttl_seconds
 
             ttl = calculate_pricing_ttl_seconds(self.CACHE_TTL_SECONDS)
-            self._cache.set(
-                self.CACHE_NAMESPACE,
-                cache_key,
-                enrichment.model_dump(),
-                ttl_seconds=ttl,
-            )
+            if cache_writes is not None:
+                cache_writes.append((cache_key, enrichment.model_dump(), ttl))
+            else:
+                self._cache.set(
+                    self.CACHE_NAMESPACE,
+                    cache_key,
+                    enrichment.model_dump(),
+                    ttl_seconds=ttl,
+                )
 
         return enrichment
 
@@ -627,55 +954,104 @@ class AsyncAudibleEnrichmentService:
         discover_quality: bool = True,
         max_concurrent: int = 5,
         use_fast_quality: bool = True,
+        minimal: bool = False,
     ) -> dict[str, AudibleEnrichment]:
         """
         Enrich multiple ASINs with Audible data including actual quality.
 
         This method fetches catalog data and discovers quality concurrently
-        for efficient batch processing. Progress is reported as each item completes.
+        for efficient batch processing. Progress is reported as items complete,
+        at most every PROGRESS_INTERVAL_SECONDS plus the final item.
 
         Args:
             asins: List of ASINs to enrich
             use_cache: Use cached data if available
             discover_quality: Discover actual audio quality
-            max_concurrent: Max concurrent enrichment operations
+            max_concurrent: Max concurrent enrichment operations (values below 1 are treated as 1)
             use_fast_quality: Use fast metadata endpoint (default) vs slower license requests
+            minimal: Skip catalog and quality lookups for owned ASINs (ownership-only results)
 
         Returns:
             Dict mapping ASIN to enrichment data
         """
-        # Preload library
-        await self._load_library_asins()
+        # Preload library once for ownership checks across the batch
+        library_asins = await self._load_library_asins()
 
         results: dict[str, AudibleEnrichment] = {}
         total = len(asins)
         completed = 0
-        semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def enrich_one(asin: str) -> tuple[str, AudibleEnrichment | None]:
+        # Cache writes are buffered and flushed in one transaction at the end
+        cache_writes: list[tuple[str, Any, float | None]] = []
+
+        # Serve cache hits with one multi-key lookup; only misses need API work
+        pending = asins
+        last_cached: str | None = None
+        if use_cache and self._cache:
+            cached = self._cache.get_many(self.CACHE_NAMESPACE, [self._cache_key(asin) for asin in asins])
+            pending = []
+            for asin in asins:
+                data = cached.get(self._cache_key(asin))
+                if data:
+                    last_cached = asin
+                    enrichment = self._from_cache(asin, data, library_asins)
+                    if enrichment:
+                        results[asin] = enrichment
+                else:
+                    pending.append(asin)
+
+            completed = total - len(pending)
+
+        last_progress = 0.0
+
+        def report_progress(asin: str) -> None:
+            """Throttle progress updates; always report the final item."""
+            nonlocal last_progress
+            if not self._progress:
+                return
+            now = time.monotonic()
+            if now - last_progress > self.PROGRESS_INTERVAL_SECONDS or completed == total:
+                self._progress(completed, total, asin)
+                last_progress = now
+
+        if last_cached:
+            # Cache hits complete together; report them as one jump
+            report_progress(last_cached)
+
+        # Fixed pool of workers draining a queue: concurrency is bounded by the
+        # worker count and only max_concurrent tasks exist regardless of batch size
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for asin in pending:
+            queue.put_nowait(asin)
+
+        async def worker() -> None:
             nonlocal completed
-            async with semaphore:
-                result = await self.enrich_single_with_quality(
-                    asin, use_cache=use_cache, discover_quality=discover_quality
-                )
+            while not queue.empty():
+                asin = queue.get_nowait()
+                try:
+                    enrichment = await self.enrich_single_with_quality(
+                        asin,
+                        use_cache=use_cache,
+                        discover_quality=discover_quality,
+                        minimal=minimal,
+                        _library_asins=library_asins,
+                        _skip_cache_read=True,
+                        _cache_writes=cache_writes,
+                    )
+                    if enrichment:
+                        results[asin] = enrichment
+                except Exception as e:
+                    logger.warning("Enrichment failed for ASIN %s: %s", asin, e)
+
                 # Update progress after completion (not at start)
                 completed += 1
-                if self._progress:
-                    self._progress(completed, total, f"Enriched {asin}")
-                return asin, result
+                report_progress(asin)
 
-        # Create all tasks
-        tasks = [enrich_one(asin) for asin in asins]
+        # Clamp to at least one worker so a non-positive max_concurrent can't drop every miss
+        workers = [asyncio.create_task(worker()) for _ in range(min(max(1, max_concurrent), len(pending)))]
+        await asyncio.gather(*workers)
 
-        # Run concurrently with as_completed for live progress updates
-        for coro in asyncio.as_completed(tasks):
-            try:
-                result = await coro
-                if isinstance(result, tuple):
-                    asin, enrichment = result
-                    if enrichment:
-                        results[asin] = enrichment
-            except Exception as e:
-                logger.warning("Enrichment failed: %s", e)
+        if self._cache and cache_writes:
+            self._cache.set_many(self.CACHE_NAMESPACE, cache_writes)
 
         return results
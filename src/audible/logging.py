@@ -34,13 +34,22 @@ Usage:
 """
 
 import logging
-import sys
+from collections.abc import Hashable, Mapping
 from pathlib import Path
-from typing import Literal
-
-from rich.logging import RichHandler
-from rich.traceback import install as install_rich_traceback
-
+from types import MappingProxyType
+from typing import Any, Final, Literal
+
+from src.utils.logging import (
+    attach_handlers,
+    build_console_handler,
+    build_file_handler,
+    close_unused_handlers,
+    detach_handlers,
+    install_rich_tracebacks,
+    minimize_log_records,
+    queued_handlers,
+    sample_debug_records,
+)
 from src.utils.ui import console as rich_console
 
 # Try to import audible's log_helper
@@ -55,28 +64,55 @@ except ImportError:
 
 LogLevel = Literal["debug", "info", "warning", "error", "critical", "notset"]
 
-# Map string levels to logging constants
-LEVEL_MAP = {
-    "debug": logging.DEBUG,
-    "info": logging.INFO,
-    "warning": logging.WARNING,
-    "error": logging.ERROR,
-    "critical": logging.CRITICAL,
-    "notset": logging.NOTSET,
-}
+# Map string levels to logging constants (read-only)
+LEVEL_MAP: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "debug": logging.DEBUG,
+        "info": logging.INFO,
+        "warning": logging.WARNING,
+        "error": logging.ERROR,
+        "critical": logging.CRITICAL,
+        "notset": logging.NOTSET,
+    }
+)
+
+# Plain-dict lookup table: LEVEL_MAP plus uppercase spellings, so common inputs resolve
+# without lowercasing (and without the proxy's extra indirection)
+_LEVEL_MAP_CI: Final[dict[str, int]] = {**LEVEL_MAP, **{name.upper(): value for name, value in LEVEL_MAP.items()}}
 
 # Our module's logger name
-MODULE_LOGGER_NAME = "src.audible"
+MODULE_LOGGER_NAME: Final = "src.audible"
+
+# Loggers are process-wide singletons; resolve them once instead of on every call
+_MODULE_LOGGER: Final = logging.getLogger(MODULE_LOGGER_NAME)
+_AUDIBLE_LOGGER: Final = logging.getLogger("audible")
+_HTTPX_LOGGER: Final = logging.getLogger("httpx")
+_HTTPCORE_LOGGER: Final = logging.getLogger("httpcore")
+
+# Default record and date formats for plain console and file output
+_DEFAULT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Words the Rich console handler highlights
+_RICH_KEYWORDS = ("audible", "library", "catalog", "ASIN", "cache", "auth", "rate limit")
 
 # Track if we've configured
 _configured = False
 
+# Handlers built by configure_logging(), keyed by kind and options; reused while the options are unchanged
+_handler_cache: dict[tuple[Any, ...], logging.Handler] = {}
+
 
 def get_level(level: LogLevel | int) -> int:
     """Convert string level to logging constant."""
-    if isinstance(level, int):
+    if type(level) is int:
         return level
-    return LEVEL_MAP.get(level.lower(), logging.INFO)
+    if isinstance(level, int):
+        return level  # int subclasses such as IntEnum
+    mapped = _LEVEL_MAP_CI.get(level)
+    if mapped is not None:
+        return mapped
+    return _LEVEL_MAP_CI.get(level.lower(), logging.INFO)
 
 
 def get_logger(name: str | None = None) -> logging.Logger:
@@ -97,7 +133,7 @@ def get_logger(name: str | None = None) -> logging.Logger:
         logger.error("[red]Failed:[/red] %s", error_message)
     """
     if name is None:
-        return logging.getLogger(MODULE_LOGGER_NAME)
+        return _MODULE_LOGGER
     return logging.getLogger(name)
 
 
@@ -115,6 +151,15 @@ def configure_logging(
     show_path: bool = False,
     show_time: bool = True,
     markup: bool = True,
+    buffer_capacity: int = 512,
+    rotate_bytes: int = 10_000_000,
+    backup_count: int = 3,
+    flush_level: LogLevel | int = "error",
+    async_logging: bool = False,
+    debug_sample_every: int = 1,
+    minimal_records: bool = True,
+    production: bool = False,
+    console: bool | None = None,
 ) -> logging.Logger:
     """
     Configure rich-enhanced logging for all audible-related operations.
@@ -146,6 +191,21 @@ def configure_logging(
         show_path: Show file path in console logs
         show_time: Show timestamp in console logs
         markup: Enable rich markup in log messages
+        buffer_capacity: Number of file log records buffered before writing (0 writes each record immediately)
+        flush_level: File records at this level or above are written immediately, along with the buffer
+        rotate_bytes: Size at which the log file is rotated (0 never rotates)
+        backup_count: Number of rotated log files to keep
+        async_logging: Run the console/file handlers on a background thread so logging calls only
+            enqueue records. Off by default so output is written before the logging call returns
+            (what tests and log-tailing scripts expect).
+        debug_sample_every: At debug level, show only one in this many DEBUG records on the console
+            (the file still gets all of them); 1 shows everything
+        minimal_records: Skip thread/process/task lookups when creating log records.
+            **Process-wide toggle** - affects every logger; disable if a format uses
+            ``%(threadName)s``, ``%(process)d`` or similar.
+        production: Swallow errors raised inside handlers instead of printing them
+            (``logging.raiseExceptions = False``). **Process-wide toggle.**
+        console: Alias for ``console_output`` (the name the ABS module uses); wins if given
 
     Returns:
         The configured logger
@@ -180,76 +240,62 @@ def configure_logging(
     """
     global _configured
 
+    if console is not None:
+        console_output = console
     log_level = get_level(level)
     file_log_level = get_level(file_level) if file_level else log_level
 
     # Install rich tracebacks globally for beautiful exceptions
     if use_rich and rich_tracebacks:
-        install_rich_traceback(
-            console=rich_console,
-            show_locals=False,
-            width=rich_console.width,
-            extra_lines=3,
-            theme="monokai",
-            word_wrap=True,
-        )
+        install_rich_tracebacks(rich_console)
 
     # Configure our module logger
-    logger = logging.getLogger(MODULE_LOGGER_NAME)
+    logger = _MODULE_LOGGER
     logger.setLevel(log_level)
 
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
+    # Remove existing handlers to avoid duplicates (flushing any buffered file output first)
+    detach_handlers(logger)
 
-    # Initialize handler variables
     console_handler: logging.Handler | None = None
     file_handler: logging.Handler | None = None
+    in_use: list[Hashable] = []
 
-    # Console handler - use Rich if enabled
     if console_output:
-        if use_rich:
-            console_handler = RichHandler(
-                level=log_level,
-                console=rich_console,
-                show_time=show_time,
-                show_path=show_path,
-                rich_tracebacks=rich_tracebacks,
-                markup=markup,
-                log_time_format="[%X]",
-                keywords=[
-                    # Highlight these words in logs
-                    "audible",
-                    "library",
-                    "catalog",
-                    "ASIN",
-                    "cache",
-                    "auth",
-                    "rate limit",
-                ],
-            )
-        else:
-            # Standard handler
-            if format_string is None:
-                format_string = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
-            formatter = logging.Formatter(format_string, datefmt="%Y-%m-%d %H:%M:%S")
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(log_level)
-            console_handler.setFormatter(formatter)
-
-        logger.addHandler(console_handler)
+        console_handler = build_console_handler(
+            _handler_cache,
+            in_use,
+            level=log_level,
+            use_rich=use_rich,
+            console=rich_console,
+            keywords=_RICH_KEYWORDS,
+            format_string=format_string or _DEFAULT_FORMAT,
+            datefmt=_DATE_FORMAT,
+            show_time=show_time,
+            show_path=show_path,
+            markup=markup,
+            rich_tracebacks=rich_tracebacks,
+        )
+        # Throttle noisy per-item debug output on the console only
+        sample_debug_records(console_handler, debug_sample_every if log_level == logging.DEBUG else 1)
 
     # File handler - always use standard formatting for parseable logs
     if file_path:
-        file_path = Path(file_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        file_format = format_string or "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
-        file_formatter = logging.Formatter(file_format, datefmt="%Y-%m-%d %H:%M:%S")
+        file_handler = build_file_handler(
+            _handler_cache,
+            in_use,
+            Path(file_path),
+            level=file_log_level,
+            format_string=format_string or _DEFAULT_FORMAT,
+            datefmt=_DATE_FORMAT,
+            buffer_capacity=buffer_capacity,
+            flush_level=get_level(flush_level),
+            rotate_bytes=rotate_bytes,
+            backup_count=backup_count,
+        )
 
-        file_handler = logging.FileHandler(file_path, encoding="utf-8")
-        file_handler.setLevel(file_log_level)
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+    # Release handlers for options no longer in use (e.g. the previous log file)
+    close_unused_handlers(_handler_cache, in_use)
+    attach_handlers(logger, [h for h in (console_handler, file_handler) if h is not None], async_logging=async_logging)
 
     # Configure the audible package's logger
     if configure_audible_package and HAS_AUDIBLE_LOG_HELPER:
@@ -266,7 +312,7 @@ def configure_logging(
                 log_helper.capture_warnings()
         except Exception:
             # If audible log_helper fails, fall back to standard logging
-            audible_logger = logging.getLogger("audible")
+            audible_logger = _AUDIBLE_LOGGER
             audible_logger.setLevel(log_level)
             if not audible_logger.handlers:
                 if console_handler is not None:
@@ -278,6 +324,11 @@ def configure_logging(
     if capture_warnings:
         logging.captureWarnings(True)
 
+    if minimal_records:
+        minimize_log_records(production=production)
+    elif production:
+        logging.raiseExceptions = False
+
     _configured = True
     return logger
 
@@ -292,10 +343,19 @@ def set_level(level: LogLevel | int) -> None:
     log_level = get_level(level)
 
     # Our logger
-    logger = logging.getLogger(MODULE_LOGGER_NAME)
+    logger = _MODULE_LOGGER
+    handlers = (*logger.handlers, *queued_handlers(MODULE_LOGGER_NAME))
+    if (
+        logger.level == log_level
+        and _AUDIBLE_LOGGER.level == log_level
+        and all(handler.level == log_level for handler in handlers)
+    ):
+        return  # Nothing to change; skip the logger cache reset setLevel() triggers
+
     logger.setLevel(log_level)
-    for handler in logger.handlers:
-        handler.setLevel(log_level)
+    for handler in handlers:
+        if handler.level != log_level:
+            handler.setLevel(log_level)
 
     # Audible package logger
     if HAS_AUDIBLE_LOG_HELPER:
@@ -304,8 +364,7 @@ def set_level(level: LogLevel | int) -> None:
         except Exception as e:
             logger.debug("Failed to set audible log_helper level: %s", e)
 
-    audible_logger = logging.getLogger("audible")
-    audible_logger.setLevel(log_level)
+    _AUDIBLE_LOGGER.setLevel(log_level)
 
 
 def silence_audible_package() -> None:
@@ -314,9 +373,9 @@ def silence_audible_package() -> None:
 
     Useful when you only want to see your own logs.
     """
-    logging.getLogger("audible").setLevel(logging.CRITICAL)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
+    _AUDIBLE_LOGGER.setLevel(logging.CRITICAL)
+    _HTTPX_LOGGER.setLevel(logging.WARNING)
+    _HTTPCORE_LOGGER.setLevel(logging.WARNING)
 
 
 def enable_debug_logging() -> None:
@@ -334,8 +393,8 @@ def enable_request_logging() -> None:
 
     Useful for debugging API issues.
     """
-    logging.getLogger("httpx").setLevel(logging.DEBUG)
-    logging.getLogger("httpcore").setLevel(logging.DEBUG)
+    _HTTPX_LOGGER.setLevel(logging.DEBUG)
+    _HTTPCORE_LOGGER.setLevel(logging.DEBUG)
 
 
 class LogContext:
@@ -351,20 +410,21 @@ class LogContext:
 
     def __init__(self, level: LogLevel | int):
         self.new_level = get_level(level)
-        self.old_levels: dict[str, int] = {}
+        self.old_levels: dict[logging.Logger, int] = {}
 
     def __enter__(self):
-        # Save current levels
-        for name in [MODULE_LOGGER_NAME, "audible"]:
-            logger = logging.getLogger(name)
-            self.old_levels[name] = logger.level
-            logger.setLevel(self.new_level)
+        # Save current levels (setLevel() resets every logger's level cache, so skip no-op changes)
+        for logger in (_MODULE_LOGGER, _AUDIBLE_LOGGER):
+            self.old_levels[logger] = logger.level
+            if logger.level != self.new_level:
+                logger.setLevel(self.new_level)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         # Restore levels
-        for name, level in self.old_levels.items():
-            logging.getLogger(name).setLevel(level)
+        for logger, level in self.old_levels.items():
+            if logger.level != level:
+                logger.setLevel(level)
         return False
 
 
@@ -11,10 +11,14 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Shared by every model below: the API adds fields freely, so unknown keys are dropped
+_MODEL_CONFIG = ConfigDict(extra="ignore")
+
 # =============================================================================
 # API Enums - Centralized API constants for type safety and discoverability
 # =============================================================================
@@ -217,6 +221,20 @@ class ResponseGroups:
 # =============================================================================
 
 
+def _as_price(value: Any) -> float | None:
+    """Coerce an API price value to float, or None if it is missing or not numeric."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int | float):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
 class PricingInfo(BaseModel):
     """
     Pricing information from Audible.
@@ -232,7 +250,7 @@ class PricingInfo(BaseModel):
     price_type: str | None = Field(default=None, description="Price type: sale, member, list")
     is_monthly_deal: bool = Field(default=False, description="Is a monthly deal (type=sale)")
 
-    model_config = {"extra": "ignore"}
+    model_config = _MODEL_CONFIG
 
     @property
     def discount_percent(self) -> float | None:
@@ -255,40 +273,63 @@ class PricingInfo(BaseModel):
         """Get the effective (best) price."""
         return self.sale_price or self.list_price
 
+    @staticmethod
+    def _parse_api_fields(price_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Extract model fields from the 'price' dict of an API response.
+
+        Values are coerced to the field types (missing or malformed ones are left
+        at their defaults) so the result is safe to pass to model_construct.
+        """
+        fields: dict[str, Any] = {}
+
+        credit_price = _as_price(price_data.get("credit_price"))
+        if credit_price is not None:
+            fields["credit_price"] = credit_price
+
+        # List price
+        list_price_data = price_data.get("list_price")
+        if list_price_data and isinstance(list_price_data, dict):
+            fields["list_price"] = _as_price(list_price_data.get("base"))
+            currency = list_price_data.get("currency_code")
+            if isinstance(currency, str) and currency:
+                fields["currency"] = currency
+
+        # Sale/member price (lowest_price)
+        lowest_price_data = price_data.get("lowest_price")
+        if lowest_price_data and isinstance(lowest_price_data, dict):
+            price_type = lowest_price_data.get("type")
+            if not isinstance(price_type, str):
+                price_type = None
+            fields["sale_price"] = _as_price(lowest_price_data.get("base"))
+            fields["price_type"] = price_type
+            # Monthly deals have type "sale" (not "member")
+            fields["is_monthly_deal"] = price_type == "sale"
+
+        return fields
+
     @classmethod
     def from_api_response(cls, price_data: dict[str, Any] | None) -> "PricingInfo | None":
         """
         Parse pricing data from Audible API response.
 
+        Skips validation via model_construct; _parse_api_fields already coerces
+        the extracted values to the field types.
+
         Args:
             price_data: The 'price' dict from API response
 
         Returns:
             PricingInfo or None if no price data
         """
-        if not price_data:
+        if not price_data or not isinstance(price_data, dict):
             return None
+        return cls.model_construct(**cls._parse_api_fields(price_data))
 
-        pricing = cls()
 
-        # Credit price
-        pricing.credit_price = price_data.get("credit_price", 1.0)
-
-        # List price
-        list_price_data = price_data.get("list_price", {})
-        if list_price_data:
-            pricing.list_price = list_price_data.get("base")
-            pricing.currency = list_price_data.get("currency_code", "USD")
-
-        # Sale/member price (lowest_price)
-        lowest_price_data = price_data.get("lowest_price", {})
-        if lowest_price_data:
-            pricing.sale_price = lowest_price_data.get("base")
-            pricing.price_type = lowest_price_data.get("type")
-            # Monthly deals have type "sale" (not "member")
-            pricing.is_monthly_deal = pricing.price_type == "sale"
-
-        return pricing
+def _is_plus_plan_name(plan_name: str) -> bool:
+    """Check if a plan name marks Plus Catalog (US Minerva or any AYCE plan)."""
+    return "Minerva" in plan_name or "AYCE" in plan_name.upper()
 
 
 class PlusCatalogInfo(BaseModel):
@@ -302,7 +343,7 @@ class PlusCatalogInfo(BaseModel):
     plan_name: str | None = Field(default=None, description="Plan name (US Minerva = Plus)")
     expiration_date: datetime | None = Field(default=None, description="When removed from Plus")
 
-    model_config = {"extra": "ignore"}
+    model_config = _MODEL_CONFIG
 
     @property
     def is_expiring_soon(self) -> bool:
@@ -328,52 +369,61 @@ class PlusCatalogInfo(BaseModel):
             return None
         return self.expiration_date.strftime("%Y-%m-%d")
 
-    @classmethod
-    def from_api_response(cls, plans: list[dict[str, Any]] | None) -> "PlusCatalogInfo":
-        """
-        Parse plans array for Plus Catalog info.
-
-        Plus Catalog is indicated by plan_name containing 'Minerva'.
+    @staticmethod
+    def _parse_api_fields(plans: list[dict[str, Any]] | None) -> dict[str, Any]:
+        """Extract model fields from the 'plans' array of an API response."""
+        fields: dict[str, Any] = {}
 
-        Args:
-            plans: The 'plans' array from API response
-
-        Returns:
-            PlusCatalogInfo (always returns, with defaults if no Plus)
-        """
-        info = cls()
-
-        if not plans:
-            return info
+        if not plans or not isinstance(plans, list):
+            return fields
 
         for plan in plans:
-            plan_name = plan.get("plan_name", "")
-            end_date_str = plan.get("end_date", "")
+            if not isinstance(plan, dict):
+                continue
+            plan_name = plan.get("plan_name")
+            if not isinstance(plan_name, str):
+                continue
+            end_date_str = plan.get("end_date")
 
             # US Minerva = Plus Catalog
-            if "Minerva" in plan_name or "AYCE" in plan_name.upper():
-                info.is_plus_catalog = True
-                info.plan_name = plan_name
+            if _is_plus_plan_name(plan_name):
+                fields["is_plus_catalog"] = True
+                fields["plan_name"] = plan_name
 
                 # Parse expiration date
-                if end_date_str:
+                if end_date_str and isinstance(end_date_str, str):
                     try:
-                        # Handle ISO format with microseconds
-                        end_date_str = end_date_str.replace("Z", "+00:00")
-                        if ".000" in end_date_str:
-                            # Remove extra decimal places
-                            end_date_str = end_date_str.split(".")[0] + "+00:00"
+                        # fromisoformat handles "Z" and fractional seconds natively
                         end_date = datetime.fromisoformat(end_date_str)
+                        if end_date.tzinfo is None:
+                            end_date = end_date.replace(tzinfo=timezone.utc)
 
                         # Check if it's a "forever" date (9999, 2099)
                         if end_date.year < 2099:
-                            info.expiration_date = end_date
+                            fields["expiration_date"] = end_date
                     except (ValueError, TypeError):
                         pass
 
                 break  # Found Plus Catalog, done
 
-        return info
+        return fields
+
+    @classmethod
+    def from_api_response(cls, plans: list[dict[str, Any]] | None) -> "PlusCatalogInfo":
+        """
+        Parse plans array for Plus Catalog info.
+
+        Plus Catalog is indicated by plan_name containing 'Minerva'.
+        Skips validation via model_construct; _parse_api_fields skips malformed
+        plan entries and only emits correctly typed values.
+
+        Args:
+            plans: The 'plans' array from API response
+
+        Returns:
+            PlusCatalogInfo (always returns, with defaults if no Plus)
+        """
+        return cls.model_construct(**cls._parse_api_fields(plans))
 
 
 # =============================================================================
@@ -381,24 +431,23 @@ class PlusCatalogInfo(BaseModel):
 # =============================================================================
 
 
-class AudibleAuthor(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True, config=_MODEL_CONFIG)
+class AudibleAuthor:
     """Author/contributor information."""
 
     asin: str | None = None
     name: str
 
-    model_config = {"extra": "ignore"}
-
 
-class AudibleNarrator(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True, config=_MODEL_CONFIG)
+class AudibleNarrator:
     """Narrator information."""
 
     name: str
 
-    model_config = {"extra": "ignore"}
 
-
-class AudibleSeries(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True, config=_MODEL_CONFIG)
+class AudibleSeries:
     """Series information."""
 
     asin: str | None = None
@@ -406,19 +455,16 @@ class AudibleSeries(BaseModel):
     sequence: str | None = None
     url: str | None = None
 
-    model_config = {"extra": "ignore"}
-
 
-class AudibleRating(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True, config=_MODEL_CONFIG)
+class AudibleRating:
     """Rating information."""
 
     # Distribution dicts can contain int, float, or string values
-    overall_distribution: dict[str, Any] | None = Field(default=None, alias="overall_distribution")
-    performance_distribution: dict[str, Any] | None = Field(default=None, alias="performance_distribution")
-    story_distribution: dict[str, Any] | None = Field(default=None, alias="story_distribution")
-    num_reviews: int | None = Field(default=None, alias="num_reviews")
-
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    overall_distribution: dict[str, Any] | None = None
+    performance_distribution: dict[str, Any] | None = None
+    story_distribution: dict[str, Any] | None = None
+    num_reviews: int | None = None
 
     @property
     def overall(self) -> float | None:
@@ -448,15 +494,14 @@ class AudibleRating(BaseModel):
         return None
 
 
-class AudibleCategory(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True, config=_MODEL_CONFIG)
+class AudibleCategory:
     """Category/genre information."""
 
-    id: str | None = Field(default=None, alias="category_id")
-    name: str | None = Field(default=None, alias="name")
+    id: str | None = Field(default=None, validation_alias=AliasChoices("category_id", "id"))
+    name: str | None = None
     root: str | None = None
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
-
 
 class AudibleCategoryLadder(BaseModel):
     """Category hierarchy (ladder)."""
@@ -464,16 +509,16 @@ class AudibleCategoryLadder(BaseModel):
     ladder: list[AudibleCategory] = Field(default_factory=lambda: [])
     root: str | None = None
 
-    model_config = {"extra": "ignore"}
+    model_config = _MODEL_CONFIG
 
 
 class AudiblePlan(BaseModel):
     """Plan/subscription info."""
 
     plan_name: str | None = None
-    is_in_plan: bool = Field(default=False, alias="is_in_plan")
+    is_in_plan: bool = False
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class AudibleBook(BaseModel):
@@ -526,11 +571,11 @@ class AudibleBook(BaseModel):
     sample_url: str | None = None
 
     # Extended attributes
-    is_ayce: bool = Field(default=False, alias="is_ayce")  # All You Can Eat (included in subscription)
-    is_adult_product: bool = Field(default=False, alias="is_adult_product")
+    is_ayce: bool = False  # All You Can Eat (included in subscription)
+    is_adult_product: bool = False
 
     # Audible Plus catalog
-    is_listenable: bool = Field(default=False, alias="is_listenable")
+    is_listenable: bool = False
 
     # Content info
     content_type: str | None = None
@@ -539,7 +584,7 @@ class AudibleBook(BaseModel):
     # Merchandising summary (short description)
     merchandising_summary: str | None = None
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @property
     def runtime_hours(self) -> float | None:
@@ -600,21 +645,21 @@ class AudibleLibraryItem(AudibleBook):
     origin_type: str | None = None
 
     # Status flags (can be None from API)
-    is_downloaded: bool | None = Field(default=False, alias="is_downloaded")
-    is_finished: bool | None = Field(default=False, alias="is_finished")
-    is_playable: bool | None = Field(default=True, alias="is_playable")
-    is_archived: bool | None = Field(default=False, alias="is_archived")
-    is_visible: bool | None = Field(default=True, alias="is_visible")
-    is_removable: bool | None = Field(default=False, alias="is_removable")
-    is_returnable: bool | None = Field(default=False, alias="is_returnable")
+    is_downloaded: bool | None = False
+    is_finished: bool | None = False
+    is_playable: bool | None = True
+    is_archived: bool | None = False
+    is_visible: bool | None = True
+    is_removable: bool | None = False
+    is_returnable: bool | None = False
 
     # Listening progress
-    percent_complete: float | None = Field(default=None, alias="percent_complete")
+    percent_complete: float | None = None
 
     # PDF availability
     pdf_url: str | None = None
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class AudibleCatalogProduct(AudibleBook):
@@ -637,7 +682,12 @@ class AudibleCatalogProduct(AudibleBook):
     # Relationships (similar products, etc.)
     relationships: list[dict[str, Any]] | None = None
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
+
+
+# Validate whole list payloads in a single call instead of one model_validate() per item
+LIBRARY_ITEM_LIST_ADAPTER: TypeAdapter[list[AudibleLibraryItem]] = TypeAdapter(list[AudibleLibraryItem])
+CATALOG_PRODUCT_LIST_ADAPTER: TypeAdapter[list[AudibleCatalogProduct]] = TypeAdapter(list[AudibleCatalogProduct])
 
 
 class AudibleLibraryResponse(BaseModel):
@@ -645,38 +695,50 @@ class AudibleLibraryResponse(BaseModel):
 
     items: list[AudibleLibraryItem] = Field(default_factory=lambda: [])
     response_groups: list[str] | None = None
-    total_results: int | None = Field(default=None, alias="total_results")
+    total_results: int | None = None
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class AudibleCatalogResponse(BaseModel):
     """Response from GET /1.0/catalog/products."""
 
     products: list[AudibleCatalogProduct] = Field(default_factory=lambda: [])
-    total_results: int | None = Field(default=None, alias="total_results")
+    total_results: int | None = None
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class AudibleListeningStats(BaseModel):
     """User listening statistics from /1.0/stats/aggregates."""
 
     # Total stats
-    total_listening_time_ms: int | None = Field(default=None, alias="totalListeningTimeMs")
-    total_finished_titles: int | None = Field(default=None, alias="totalFinishedTitles")
+    total_listening_time_ms: int | None = Field(
+        default=None, validation_alias=AliasChoices("totalListeningTimeMs", "total_listening_time_ms")
+    )
+    total_finished_titles: int | None = Field(
+        default=None, validation_alias=AliasChoices("totalFinishedTitles", "total_finished_titles")
+    )
 
     # Additional stats
-    distinct_titles_listened: int | None = Field(default=None, alias="distinctTitlesListened")
-    distinct_authors_listened: int | None = Field(default=None, alias="distinctAuthorsListened")
-    current_listening_streak: int | None = Field(default=None, alias="currentListeningStreak")
-    longest_listening_streak: int | None = Field(default=None, alias="longestListeningStreak")
+    distinct_titles_listened: int | None = Field(
+        default=None, validation_alias=AliasChoices("distinctTitlesListened", "distinct_titles_listened")
+    )
+    distinct_authors_listened: int | None = Field(
+        default=None, validation_alias=AliasChoices("distinctAuthorsListened", "distinct_authors_listened")
+    )
+    current_listening_streak: int | None = Field(
+        default=None, validation_alias=AliasChoices("currentListeningStreak", "current_listening_streak")
+    )
+    longest_listening_streak: int | None = Field(
+        default=None, validation_alias=AliasChoices("longestListeningStreak", "longest_listening_streak")
+    )
 
     # Daily/monthly breakdowns if requested
     daily_listening_stats: list[dict[str, Any]] | None = None
     monthly_listening_stats: list[dict[str, Any]] | None = None
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @property
     def total_hours(self) -> float | None:
@@ -699,14 +761,18 @@ class AudibleAccountInfo(BaseModel):
     plan_summary: dict[str, Any] | None = None
 
     # Account status
-    is_active_member: bool | None = Field(default=None, alias="isActiveMember")
+    is_active_member: bool | None = Field(
+        default=None, validation_alias=AliasChoices("isActiveMember", "is_active_member")
+    )
 
     # Benefits and plans
     benefits: list[dict[str, Any]] | None = Field(default=None)
-    plan_name: str | None = Field(default=None, alias="planName")
-    credits_available: int | None = Field(default=None, alias="creditsAvailable")
+    plan_name: str | None = Field(default=None, validation_alias=AliasChoices("planName", "plan_name"))
+    credits_available: int | None = Field(
+        default=None, validation_alias=AliasChoices("creditsAvailable", "credits_available")
+    )
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 # =============================================================================
@@ -722,36 +788,33 @@ class WishlistItem(AudibleBook):
     """
 
     # When added to wishlist
-    date_added: str | None = Field(default=None, alias="date_added")
+    date_added: str | None = None
 
     # Availability info
     available_date: str | None = None
-    is_preorderable: bool = Field(default=False, alias="is_preorderable")
+    is_preorderable: bool = False
 
     # Plans (for Plus Catalog detection)
     plans: list[dict[str, Any]] = Field(default_factory=lambda: [])
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @property
     def is_plus_catalog(self) -> bool:
         """Check if item is in Plus Catalog."""
-        if self.is_ayce:
-            return True
-        for plan in self.plans:
-            plan_name = plan.get("plan_name", "")
-            if "Minerva" in plan_name or "AYCE" in plan_name.upper():
-                return True
-        return False
+        return self.is_ayce or any(_is_plus_plan_name(plan.get("plan_name") or "") for plan in self.plans)
+
+
+WISHLIST_ITEM_LIST_ADAPTER: TypeAdapter[list[WishlistItem]] = TypeAdapter(list[WishlistItem])
 
 
 class WishlistResponse(BaseModel):
     """Response from GET /1.0/wishlist."""
 
     products: list[WishlistItem] = Field(default_factory=lambda: [])
-    total_results: int | None = Field(default=None, alias="total_results")
+    total_results: int | None = None
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 # =============================================================================
@@ -759,6 +822,17 @@ class WishlistResponse(BaseModel):
 # =============================================================================
 
 
+# Codec IDs reported in content_reference / available_codecs
+_ATMOS_CODECS = frozenset({"ec+3", "ac-4"})
+_AAC_CODECS = frozenset({"mp4a.40.2", "mp4a.40.42"})
+_CODEC_NAMES = {
+    "mp4a.40.2": "AAC-LC",
+    "mp4a.40.42": "HE-AAC v2",
+    "ec+3": "Dolby Digital Plus",
+    "ac-4": "Dolby AC-4 (Atmos)",
+}
+
+
 class ContentReference(BaseModel):
     """
     Content reference from /content/{asin}/metadata endpoint.
@@ -771,16 +845,20 @@ class ContentReference(BaseModel):
     """
 
     codec: str | None = Field(default=None, description="Codec ID: mp4a.40.2, mp4a.40.42, ec+3, ac-4")
-    content_format: str | None = Field(
-        default=None, alias="content_format", description="Format: M4A, M4A_XHE, M4A_EC3"
-    )
+    content_format: str | None = Field(default=None, description="Format: M4A, M4A_XHE, M4A_EC3")
     content_size_bytes: int = Field(
-        default=0, alias="content_size_in_bytes", description="Content size for bitrate calc"
+        default=0,
+        validation_alias=AliasChoices("content_size_in_bytes", "content_size_bytes"),
+        description="Content size for bitrate calc",
+    )
+    runtime_ms: int = Field(
+        default=0,
+        validation_alias=AliasChoices("runtime_length_ms", "runtime_ms"),
+        description="Runtime in milliseconds",
     )
-    runtime_ms: int = Field(default=0, alias="runtime_length_ms", description="Runtime in milliseconds")
     acr: str | None = Field(default=None, description="Audio Content Reference")
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @property
     def bitrate_kbps(self) -> float:
@@ -793,7 +871,7 @@ class ContentReference(BaseModel):
     @property
     def is_atmos(self) -> bool:
         """Check if this is Dolby Atmos/spatial audio."""
-        return self.codec in ("ec+3", "ac-4")
+        return self.codec in _ATMOS_CODECS
 
     @property
     def is_high_efficiency(self) -> bool:
@@ -808,12 +886,7 @@ class ContentReference(BaseModel):
     @property
     def codec_name(self) -> str:
         """Human-readable codec name."""
-        return {
-            "mp4a.40.2": "AAC-LC",
-            "mp4a.40.42": "HE-AAC v2",
-            "ec+3": "Dolby Digital Plus",
-            "ac-4": "Dolby AC-4 (Atmos)",
-        }.get(self.codec or "", "Unknown")
+        return _CODEC_NAMES.get(self.codec or "", "Unknown")
 
 
 class ContentMetadata(BaseModel):
@@ -844,7 +917,7 @@ class ContentMetadata(BaseModel):
     # DRM type used to fetch this metadata
     drm_type: str | None = Field(default=None, description="DRM type: Widevine, Adrm")
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     def model_post_init(self, __context: Any) -> None:
         """Parse content_reference into structured model after init."""
@@ -863,12 +936,11 @@ class ContentMetadata(BaseModel):
         if self.parsed_content_ref and self.parsed_content_ref.codec:
             return self.parsed_content_ref.is_atmos
         # Check model-level available_codecs
-        if "ac-4" in self.available_codecs or "ec+3" in self.available_codecs:
+        if not _ATMOS_CODECS.isdisjoint(self.available_codecs):
             return True
         # Also check raw content_reference.available_codec (legacy format)
         if self.content_reference:
-            raw_codecs = self.content_reference.get("available_codec", [])
-            return "ac-4" in raw_codecs or "ec+3" in raw_codecs
+            return not _ATMOS_CODECS.isdisjoint(self.content_reference.get("available_codec") or ())
         return False
 
     @property
@@ -876,7 +948,7 @@ class ContentMetadata(BaseModel):
         """Check if high quality AAC is available."""
         if self.parsed_content_ref and self.parsed_content_ref.codec:
             return self.parsed_content_ref.is_high_efficiency or self.parsed_content_ref.is_standard_aac
-        return "mp4a.40.2" in self.available_codecs or "mp4a.40.42" in self.available_codecs
+        return not _AAC_CODECS.isdisjoint(self.available_codecs)
 
     @property
     def bitrate_kbps(self) -> float:
@@ -922,14 +994,14 @@ class ContentMetadata(BaseModel):
 class ChapterInfo(BaseModel):
     """Chapter information for an audiobook."""
 
-    brandIntroDurationMs: int | None = Field(default=None, alias="brandIntroDurationMs")
-    brandOutroDurationMs: int | None = Field(default=None, alias="brandOutroDurationMs")
-    is_accurate: bool | None = Field(default=None, alias="is_accurate")
-    runtime_length_ms: int | None = Field(default=None, alias="runtime_length_ms")
-    runtime_length_sec: int | None = Field(default=None, alias="runtime_length_sec")
+    brandIntroDurationMs: int | None = None
+    brandOutroDurationMs: int | None = None
+    is_accurate: bool | None = None
+    runtime_length_ms: int | None = None
+    runtime_length_sec: int | None = None
     chapters: list[dict[str, Any]] = Field(default_factory=lambda: [])
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @property
     def chapter_count(self) -> int:
@@ -968,7 +1040,7 @@ class AudioFormat(BaseModel):
     runtime_ms: int = Field(default=0, description="Runtime in milliseconds")
     is_spatial: bool = Field(default=False, description="Is spatial/Atmos audio")
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @property
     def size_mb(self) -> float:
@@ -1014,7 +1086,7 @@ class ContentQualityInfo(BaseModel):
     has_high_efficiency: bool = Field(default=False, description="HE-AAC v2 available (Widevine)")
     has_standard: bool = Field(default=False, description="Standard AAC available (Adrm)")
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @classmethod
     def from_formats(cls, asin: str, formats: list[AudioFormat]) -> "ContentQualityInfo":
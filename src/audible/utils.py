@@ -8,11 +8,17 @@ This module provides:
 """
 
 import logging
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
+
+import httpx
 
 from audible import Authenticator
+from audible.client import raise_for_status
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +28,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarketplaceInfo:
     """Information about an Audible marketplace."""
 
@@ -34,89 +40,94 @@ class MarketplaceInfo:
     language: str
 
 
-# Known Audible marketplaces
-MARKETPLACES: dict[str, MarketplaceInfo] = {
-    "us": MarketplaceInfo(
-        country_code="us",
-        domain="audible.com",
-        marketplace_id="AF2M0KC94RCEA",
-        name="United States",
-        currency="USD",
-        language="en_US",
-    ),
-    "uk": MarketplaceInfo(
-        country_code="uk",
-        domain="audible.co.uk",
-        marketplace_id="A2I9A3Q2GNFNGQ",
-        name="United Kingdom",
-        currency="GBP",
-        language="en_GB",
-    ),
-    "de": MarketplaceInfo(
-        country_code="de",
-        domain="audible.de",
-        marketplace_id="AN7V1F1VY261K",
-        name="Germany",
-        currency="EUR",
-        language="de_DE",
-    ),
-    "fr": MarketplaceInfo(
-        country_code="fr",
-        domain="audible.fr",
-        marketplace_id="A2728XDNODOQ8T",
-        name="France",
-        currency="EUR",
-        language="fr_FR",
-    ),
-    "ca": MarketplaceInfo(
-        country_code="ca",
-        domain="audible.ca",
-        marketplace_id="A2CQZ5RBY40XE",
-        name="Canada",
-        currency="CAD",
-        language="en_CA",
-    ),
-    "au": MarketplaceInfo(
-        country_code="au",
-        domain="audible.com.au",
-        marketplace_id="AN7EY7DTAW63G",
-        name="Australia",
-        currency="AUD",
-        language="en_AU",
-    ),
-    "it": MarketplaceInfo(
-        country_code="it",
-        domain="audible.it",
-        marketplace_id="A2N7FU2W2BU2ZC",
-        name="Italy",
-        currency="EUR",
-        language="it_IT",
-    ),
-    "in": MarketplaceInfo(
-        country_code="in",
-        domain="audible.in",
-        marketplace_id="AJO3FBRUE6J4S",
-        name="India",
-        currency="INR",
-        language="en_IN",
-    ),
-    "jp": MarketplaceInfo(
-        country_code="jp",
-        domain="audible.co.jp",
-        marketplace_id="A1QAP3MOU4173J",
-        name="Japan",
-        currency="JPY",
-        language="ja_JP",
-    ),
-    "es": MarketplaceInfo(
-        country_code="es",
-        domain="audible.es",
-        marketplace_id="ATVPDKIKX0DER",
-        name="Spain",
-        currency="EUR",
-        language="es_ES",
-    ),
-}
+# Known Audible marketplaces (read-only)
+MARKETPLACES: Final[Mapping[str, MarketplaceInfo]] = MappingProxyType(
+    {
+        "us": MarketplaceInfo(
+            country_code="us",
+            domain="audible.com",
+            marketplace_id="AF2M0KC94RCEA",
+            name="United States",
+            currency="USD",
+            language="en_US",
+        ),
+        "uk": MarketplaceInfo(
+            country_code="uk",
+            domain="audible.co.uk",
+            marketplace_id="A2I9A3Q2GNFNGQ",
+            name="United Kingdom",
+            currency="GBP",
+            language="en_GB",
+        ),
+        "de": MarketplaceInfo(
+            country_code="de",
+            domain="audible.de",
+            marketplace_id="AN7V1F1VY261K",
+            name="Germany",
+            currency="EUR",
+            language="de_DE",
+        ),
+        "fr": MarketplaceInfo(
+            country_code="fr",
+            domain="audible.fr",
+            marketplace_id="A2728XDNODOQ8T",
+            name="France",
+            currency="EUR",
+            language="fr_FR",
+        ),
+        "ca": MarketplaceInfo(
+            country_code="ca",
+            domain="audible.ca",
+            marketplace_id="A2CQZ5RBY40XE",
+            name="Canada",
+            currency="CAD",
+            language="en_CA",
+        ),
+        "au": MarketplaceInfo(
+            country_code="au",
+            domain="audible.com.au",
+            marketplace_id="AN7EY7DTAW63G",
+            name="Australia",
+            currency="AUD",
+            language="en_AU",
+        ),
+        "it": MarketplaceInfo(
+            country_code="it",
+            domain="audible.it",
+            marketplace_id="A2N7FU2W2BU2ZC",
+            name="Italy",
+            currency="EUR",
+            language="it_IT",
+        ),
+        "in": MarketplaceInfo(
+            country_code="in",
+            domain="audible.in",
+            marketplace_id="AJO3FBRUE6J4S",
+            name="India",
+            currency="INR",
+            language="en_IN",
+        ),
+        "jp": MarketplaceInfo(
+            country_code="jp",
+            domain="audible.co.jp",
+            marketplace_id="A1QAP3MOU4173J",
+            name="Japan",
+            currency="JPY",
+            language="ja_JP",
+        ),
+        "es": MarketplaceInfo(
+            country_code="es",
+            domain="audible.es",
+            marketplace_id="ATVPDKIKX0DER",
+            name="Spain",
+            currency="EUR",
+            language="es_ES",
+        ),
+    }
+)
+
+# Reverse index for get_marketplace_for_domain
+_MARKETPLACES_BY_DOMAIN: dict[str, MarketplaceInfo] = {mp.domain: mp for mp in MARKETPLACES.values()}
 
 
 def get_marketplace(locale: str) -> MarketplaceInfo | None:
@@ -147,11 +158,30 @@ def get_marketplace_for_domain(domain: str) -> MarketplaceInfo | None:
     Returns:
         MarketplaceInfo or None
     """
-    domain = domain.lower().replace("www.", "")
-    for marketplace in MARKETPLACES.values():
-        if marketplace.domain == domain:
-            return marketplace
-    return None
+    return _MARKETPLACES_BY_DOMAIN.get(domain.lower().removeprefix("www."))
+
+
+# =============================================================================
+# API Responses
+# =============================================================================
+
+
+def raw_response_body(response: httpx.Response) -> bytes:
+    """
+    Response callback that returns the undecoded JSON body.
+
+    Passed as ``response_callback`` to the audible client so large listings can
+    be handed straight to ``model_validate_json`` instead of being decoded into
+    dicts first. HTTP errors still raise the usual audible exceptions.
+
+    Args:
+        response: HTTP response from the audible client
+
+    Returns:
+        Raw response body
+    """
+    raise_for_status(response)
+    return response.content
 
 
 # =============================================================================
@@ -212,7 +242,7 @@ def get_activation_bytes_from_file(auth_file: str | Path) -> str | None:
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceInfo:
     """Information about a registered Audible device."""
 
@@ -288,10 +318,17 @@ def refresh_auth(auth: Authenticator) -> bool:
         return False
 
 
+# Refresh tokens that expire within this window instead of trusting them offline
+_TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+
 def is_auth_valid(auth_file: str | Path) -> bool:
     """
     Check if an auth file is valid and not expired.
 
+    A stored access token that is still live is accepted offline; otherwise
+    the token is refreshed against the API.
+
     Args:
         auth_file: Path to auth file
 
@@ -300,6 +337,8 @@ def is_auth_valid(auth_file: str | Path) -> bool:
     """
     try:
         auth = Authenticator.from_file(str(auth_file))
+        if auth.access_token and auth.expires and auth.expires - time.time() > _TOKEN_EXPIRY_MARGIN_SECONDS:
+            return True
         # Try to refresh - this will fail if invalid
         auth.refresh_access_token()
         return True
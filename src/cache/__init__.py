@@ -9,6 +9,8 @@ Provides SQLite-based caching with:
 - Month-boundary-aware TTL for pricing data
 """
 
+from functools import lru_cache
+
 from .sqlite_cache import (
     PRICING_NAMESPACES,
     SQLiteCache,
@@ -24,6 +26,7 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=None)
 def get_cache(
     db_path: str = "./data/cache/cache.db",
     default_ttl_hours: float = 2.0,
@@ -31,6 +34,10 @@ def get_cache(
     """
     Factory function to get a cache instance.
 
+    Instances are shared per (db_path, default_ttl_hours), so repeated calls
+    skip reopening the database and re-running the schema setup. Call
+    get_cache.cache_clear() to drop them (e.g. between tests).
+
     Args:
         db_path: Path to SQLite database
         default_ttl_hours: Default TTL for cached items
@@ -11,9 +11,11 @@ Provides efficient storage and retrieval of cached data with:
 
 import calendar
 import sqlite3
+import threading
 import time
+import weakref
 from collections.abc import Iterator
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -82,6 +84,26 @@ PRICING_NAMESPACES = frozenset(
 )
 
 
+class _ThreadConnection:
+    """Holder for one thread's connection; closes it when the thread exits."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection, connections: list[sqlite3.Connection], lock: threading.Lock):
+        self.conn = conn
+        # Thread-locals are dropped when their thread ends, which fires this finalizer.
+        # It must not reference the cache itself, or the cache would never be collected.
+        weakref.finalize(self, _release_connection, conn, connections, lock)
+
+
+def _release_connection(conn: sqlite3.Connection, connections: list[sqlite3.Connection], lock: threading.Lock) -> None:
+    """Close a connection and forget it (idempotent)."""
+    with lock:
+        if conn in connections:
+            connections.remove(conn)
+    conn.close()
+
+
 class SQLiteCache:
     """
     SQLite-based cache for API responses.
@@ -127,6 +149,12 @@ class SQLiteCache:
         # In-memory cache for frequently accessed items
         self._memory_cache: dict[str, tuple[Any, float]] = {}  # key -> (data, expires_at)
 
+        # One connection per thread, opened on first use and closed when the
+        # thread exits or close() is called
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -217,19 +245,43 @@ class SQLiteCache:
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Get a database connection with proper settings."""
-        conn = sqlite3.connect(
-            self.db_path,
-            timeout=30.0,
-            isolation_level=None,  # Autocommit mode
-        )
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")  # Better concurrent access
-        conn.execute("PRAGMA synchronous=NORMAL")  # Good balance of safety/speed
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """
+        Get this thread's database connection.
+
+        The connection is created (and its PRAGMAs applied) on first use in each
+        thread, then reused for every later operation in that thread. It is closed
+        when the thread exits (e.g. a ThreadPoolExecutor worker) or on close().
+        """
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=30.0,
+                isolation_level=None,  # Autocommit mode
+                check_same_thread=False,  # close() may run on another thread
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")  # Better concurrent access
+            conn.execute("PRAGMA synchronous=NORMAL")  # Good balance of safety/speed
+            conn.execute("PRAGMA mmap_size=268435456")  # Read pages via mmap (256 MB) instead of pread
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache (default is ~2 MB)
+            conn.execute("PRAGMA temp_store=MEMORY")  # Keep sorts/temp tables for FTS joins off disk
+            with self._connections_lock:
+                self._connections.append(conn)
+            holder = self._local.holder = _ThreadConnection(conn, self._connections, self._connections_lock)
+        yield holder.conn
+
+    def close(self) -> None:
+        """Close all open database connections. The cache reconnects on next use."""
+        with self._connections_lock:
+            connections = list(self._connections)
+        for conn in connections:
+            # A worker thread may exit (and close its connection) concurrently
+            with suppress(sqlite3.ProgrammingError):
+                conn.execute("PRAGMA optimize")  # Refresh query planner stats for the next run
+            _release_connection(conn, self._connections, self._connections_lock)
+        # Dropping the old thread-local releases its holders; their finalizers are now no-ops
+        self._local = threading.local()
 
     def _memory_key(self, namespace: str, key: str) -> str:
         """Generate memory cache key."""
@@ -330,26 +382,86 @@ class SQLiteCache:
 
         return None
 
-    def set(
+    def get_many(self, namespace: str, keys: list[str]) -> dict[str, Any]:
+        """
+        Get multiple items from cache in a single query.
+
+        Memory-cached items are served directly; the rest are fetched with one
+        SELECT (keys are bound as a single JSON array, so there is no
+        parameter-count limit).
+
+        Args:
+            namespace: Cache namespace
+            keys: Unique identifiers to look up
+
+        Returns:
+            Dict mapping each found, unexpired key to its cached data
+        """
+        now = time.time()
+        found: dict[str, Any] = {}
+        missing: list[str] = []
+
+        # Check memory cache first
+        for key in keys:
+            mem_key = self._memory_key(namespace, key)
+            entry = self._memory_cache.get(mem_key)
+            if entry is not None:
+                data, expires_at = entry
+                if expires_at > now:
+                    found[key] = data
+                    continue
+                del self._memory_cache[mem_key]
+            missing.append(key)
+
+        if not missing:
+            return found
+
+        # Check database
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT key, data, expires_at FROM cache
+                WHERE namespace = ? AND key IN (SELECT value FROM json_each(?)) AND expires_at > ?
+                """,
+                (namespace, orjson.dumps(missing).decode("utf-8"), now),
+            ).fetchall()
+
+        for row in rows:
+            data = orjson.loads(row["data"])
+            found[row["key"]] = data
+            self._add_to_memory(self._memory_key(namespace, row["key"]), data, row["expires_at"])
+
+        return found
+
+    _UPSERT_SQL = """
+        INSERT INTO cache (namespace, key, data, created_at, expires_at, asin, title, author, source)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(namespace, key) DO UPDATE SET
+            data = excluded.data,
+            created_at = excluded.created_at,
+            expires_at = excluded.expires_at,
+            asin = excluded.asin,
+            title = excluded.title,
+            author = excluded.author,
+            source = excluded.source
+    """
+
+    def _prepare_row(
         self,
         namespace: str,
         key: str,
         data: Any,
-        ttl_seconds: float | None = None,
-    ) -> None:
+        ttl_seconds: float | None,
+        now: float,
+    ) -> tuple[tuple[Any, ...], Any, float]:
         """
-        Store an item in cache.
+        Build the upsert parameters for a cache entry.
 
-        Args:
-            namespace: Cache namespace
-            key: Unique identifier
-            data: Data to cache (must be JSON-serializable)
-            ttl_seconds: Custom TTL in seconds
+        Returns:
+            Tuple of (SQL parameters, plain data for the memory cache, expires_at)
         """
         if ttl_seconds is None:
             ttl_seconds = self.default_ttl_seconds
-
-        now = time.time()
         expires_at = now + ttl_seconds
 
         # Convert Pydantic models to dict
@@ -359,41 +471,81 @@ class SQLiteCache:
         # Extract metadata
         metadata = self._extract_metadata(data, namespace)
 
-        # Serialize data
-        data_json = orjson.dumps(data).decode("utf-8")
+        # Serialize data. orjson's bytes are stored as-is (SQLite keeps them as a BLOB
+        # in the TEXT column) to skip a decode/re-encode; orjson.loads reads both forms.
+        data_json = orjson.dumps(data)
+
+        params = (
+            namespace,
+            key,
+            data_json,
+            now,
+            expires_at,
+            metadata["asin"],
+            metadata["title"],
+            metadata["author"],
+            metadata["source"],
+        )
+        return params, data, expires_at
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        data: Any,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """
+        Store an item in cache.
+
+        Args:
+            namespace: Cache namespace
+            key: Unique identifier
+            data: Data to cache (must be JSON-serializable)
+            ttl_seconds: Custom TTL in seconds
+        """
+        params, data, expires_at = self._prepare_row(namespace, key, data, ttl_seconds, time.time())
 
         # Store in database
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO cache (namespace, key, data, created_at, expires_at, asin, title, author, source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(namespace, key) DO UPDATE SET
-                    data = excluded.data,
-                    created_at = excluded.created_at,
-                    expires_at = excluded.expires_at,
-                    asin = excluded.asin,
-                    title = excluded.title,
-                    author = excluded.author,
-                    source = excluded.source
-            """,
-                (
-                    namespace,
-                    key,
-                    data_json,
-                    now,
-                    expires_at,
-                    metadata["asin"],
-                    metadata["title"],
-                    metadata["author"],
-                    metadata["source"],
-                ),
-            )
+            conn.execute(self._UPSERT_SQL, params)
 
         # Add to memory cache
         mem_key = self._memory_key(namespace, key)
         self._add_to_memory(mem_key, data, expires_at)
 
+    def set_many(
+        self,
+        namespace: str,
+        items: list[tuple[str, Any, float | None]],
+    ) -> None:
+        """
+        Store multiple items in cache within a single transaction.
+
+        Args:
+            namespace: Cache namespace
+            items: List of (key, data, ttl_seconds) tuples; ttl_seconds may be None for the default
+        """
+        if not items:
+            return
+
+        now = time.time()
+        prepared = [(key, *self._prepare_row(namespace, key, data, ttl, now)) for key, data, ttl in items]
+
+        # Store in database
+        with self._get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(self._UPSERT_SQL, [params for _, params, _, _ in prepared])
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+        # Add to memory cache
+        for key, _, data, expires_at in prepared:
+            self._add_to_memory(self._memory_key(namespace, key), data, expires_at)
+
     def _add_to_memory(self, key: str, data: Any, expires_at: float) -> None:
         """Add to memory cache with LRU eviction."""
         self._memory_cache[key] = (data, expires_at)
@@ -680,6 +832,8 @@ class SQLiteCache:
         now = time.time()
 
         with self._get_connection() as conn:
+            # Escape quotes so the query stays a single prefix phrase on the title column
+            safe_query = query.replace('"', '""')
             rows = conn.execute(
                 """
                 SELECT c.namespace, c.key, c.data, c.title, c.author,
@@ -690,7 +844,7 @@ class SQLiteCache:
                 ORDER BY score
                 LIMIT ?
             """,
-                (f'title:"{query}"*', now, limit),
+                (f'title:"{safe_query}"*', now, limit),
             ).fetchall()
 
             return [
@@ -718,17 +872,18 @@ class SQLiteCache:
         with self._get_connection() as conn:
             # Escape special FTS characters and add wildcards
             safe_query = query.replace('"', '""')
+            # Restrict matching to title/author, ranking title hits above author hits
             rows = conn.execute(
                 """
                 SELECT c.namespace, c.key, c.data, c.title, c.author,
-                       bm25(cache_fts) as score
+                       bm25(cache_fts, 2.0, 1.0) as score
                 FROM cache_fts
                 JOIN cache c ON cache_fts.rowid = c.id
                 WHERE cache_fts MATCH ? AND c.expires_at > ?
                 ORDER BY score
                 LIMIT ?
             """,
-                (f'"{safe_query}"*', now, limit),
+                (f'{{title author}}: "{safe_query}"*', now, limit),
             ).fetchall()
 
             return [
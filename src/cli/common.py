@@ -25,6 +25,7 @@ __all__ = [
     "AsyncBatchProcessor",
     "Icons",
     "async_command",
+    "close_cache",
     "console",
     "format_bitrate",
     "format_duration",
@@ -98,6 +99,14 @@ def get_cache() -> SQLiteCache | None:
     return _cache
 
 
+def close_cache() -> None:
+    """Close the shared SQLite cache's connections (called when the CLI exits)."""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+
+
 def get_abs_client() -> ABSClient:
     """Get configured ABS client.
 
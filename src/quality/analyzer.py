@@ -438,16 +438,16 @@ class QualityAnalyzer:
                 raise
             except ABSNotFoundError:
                 # Item deleted/moved - log and continue
-                logger.warning(f"Item not found, skipping: {item_id}")
+                logger.warning("Item not found, skipping: %s", item_id)
             except ValidationError as e:
                 # Data validation error - log details and continue
-                logger.exception(f"Validation error for item {item_id}: {e}")
+                logger.exception("Validation error for item %s: %s", item_id, e)
             except (ABSConnectionError, httpx.TimeoutException, httpx.ConnectError) as e:
                 # Transient network errors - log and continue
-                logger.error(f"Network error fetching item {item_id}: {e}")
+                logger.error("Network error fetching item %s: %s", item_id, e)
             except ABSError as e:
                 # Other ABS API errors - log and continue
-                logger.error(f"ABS API error for item {item_id}: {e}")
+                logger.error("ABS API error for item %s: %s", item_id, e)
 
             # Progress callback
             if progress_callback:
@@ -491,21 +491,21 @@ class QualityAnalyzer:
                 raise
             except ABSNotFoundError:
                 # Item deleted/moved - skip silently in streaming mode
-                logger.debug(f"Item not found, skipping: {item_id}")
+                logger.debug("Item not found, skipping: %s", item_id)
                 continue
             except ValidationError as e:
                 # Data validation error - log and skip
-                logger.error(f"Validation error for item {item_id}: {e}", exc_info=True)
+                logger.error("Validation error for item %s: %s", item_id, e, exc_info=True)
                 continue
             except (ABSConnectionError, httpx.TimeoutException, httpx.ConnectError) as e:
                 # Transient network errors - log and skip
-                logger.error(f"Network error fetching item {item_id}: {e}", exc_info=True)
+                logger.error("Network error fetching item %s: %s", item_id, e, exc_info=True)
                 continue
             except ABSError as e:
                 # Other ABS API errors - log and skip
-                logger.error(f"ABS API error for item {item_id}: {e}", exc_info=True)
+                logger.error("ABS API error for item %s: %s", item_id, e, exc_info=True)
                 continue
             except Exception:
                 # Unexpected errors (e.g., bugs in analyze_item) - log with full traceback
-                logger.exception(f"Unexpected error processing item {item_id}")
+                logger.exception("Unexpected error processing item %s", item_id)
                 continue
@@ -363,7 +363,7 @@ class UpgradeFinderService:
                     quality = self._analyzer.analyze_item(full_item)
                     report.add_item(quality)
                 except Exception as e:
-                    logger.warning(f"Failed to analyze item: {e}")
+                    logger.warning("Failed to analyze item: %s", e)
 
         report.finalize()
         return report
@@ -209,7 +209,7 @@ class SeriesMatcher:
                 series_list.append(series_info)
 
             except Exception as e:
-                logger.warning(f"Failed to parse series: {e}")
+                logger.warning("Failed to parse series: %s", e)
                 continue
 
         # Cache results
@@ -348,7 +348,7 @@ class SeriesMatcher:
                     break  # Use first series match
 
             except Exception as e:
-                logger.warning(f"Failed to look up ASIN {asin}: {e}")
+                logger.warning("Failed to look up ASIN %s: %s", asin, e)
                 continue
 
         return list(all_series_books.values()), series_asin
@@ -404,7 +404,7 @@ class SeriesMatcher:
                     summary=seed_product.merchandising_summary,
                 )
         except Exception as e:
-            logger.warning(f"Failed to look up seed ASIN {seed_asin}: {e}")
+            logger.warning("Failed to look up seed ASIN %s: %s", seed_asin, e)
 
         # Now use /sims to get ALL other books in the series
         try:
@@ -452,12 +452,14 @@ class SeriesMatcher:
                 )
 
             logger.debug(
-                f"Sims discovery found {len(all_series_books)} books for series "
-                f"'{series_name}' (ASIN: {series_asin})"
+                "Sims discovery found %d books for series '%s' (ASIN: %s)",
+                len(all_series_books),
+                series_name,
+                series_asin,
             )
 
         except Exception as e:
-            logger.warning(f"Failed to get sims for ASIN {seed_asin}: {e}")
+            logger.warning("Failed to get sims for ASIN %s: %s", seed_asin, e)
 
         return list(all_series_books.values()), series_asin, series_name
 
@@ -614,14 +616,17 @@ class SeriesMatcher:
             audible_books, series_asin, series_name = self.get_complete_series_from_sims(seed_asin, use_cache=use_cache)
             if audible_books:
                 logger.debug(
-                    f"Sims discovery found {len(audible_books)} total books for '{abs_series.name}' "
-                    f"(series: '{series_name}', ASIN: {series_asin})"
+                    "Sims discovery found %d total books for '%s' (series: '%s', ASIN: %s)",
+                    len(audible_books),
+                    abs_series.name,
+                    series_name,
+                    series_asin,
                 )
 
         # Strategy 2: Fall back to ASIN lookup if sims didn't work
         if not audible_books and abs_asins:
             audible_books, series_asin = self.get_series_books_by_asin(abs_asins, use_cache=use_cache)
-            logger.debug(f"ASIN lookup found {len(audible_books)} books for {abs_series.name}")
+            logger.debug("ASIN lookup found %d books for %s", len(audible_books), abs_series.name)
 
         # Strategy 3: Fall back to keyword search if ASIN lookup didn't work
         if not audible_books:
@@ -634,7 +639,7 @@ class SeriesMatcher:
                 author=primary_author,
                 use_cache=use_cache,
             )
-            logger.debug(f"Keyword search found {len(audible_books)} books for {abs_series.name}")
+            logger.debug("Keyword search found %d books for %s", len(audible_books), abs_series.name)
 
         # Create series match result
         if audible_books:
@@ -744,7 +749,7 @@ class SeriesMatcher:
                 result = self.compare_series(series, use_cache=use_cache)
                 results.append(result)
             except Exception as e:
-                logger.warning(f"Failed to analyze series '{series.name}': {e}")
+                logger.warning("Failed to analyze series '%s': %s", series.name, e)
                 continue
 
         # Build report
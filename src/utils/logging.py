@@ -3,11 +3,404 @@ Shared logging utilities with Rich markup support.
 
 Provides common logging helper functions used across modules
 with consistent Rich-enhanced formatting.
+
+Pass values as arguments rather than pre-formatting the message, so
+filtered-out records never pay for string formatting:
+
+    log_debug("Loaded %d items from %s", count, source)
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
+import sys
+from collections.abc import Collection, Hashable, Iterable, Sequence
+from pathlib import Path
 from typing import Any
 
+from rich.console import Console
+from rich.logging import RichHandler
+from rich.traceback import install as install_rich_traceback
+
+# Background listeners started by start_queue_listener(), keyed by logger name
+_queue_listeners: dict[str, logging.handlers.QueueListener] = {}
+
+# Set once install_rich_tracebacks() has installed the (process-wide) Rich excepthook
+_RICH_TRACEBACK_INSTALLED = False
+
+
+class _BufferedHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also closes (and sets the level of) its target, so it can stand in for the wrapped handler."""
+
+    def setLevel(self, level: int | str) -> None:
+        super().setLevel(level)
+        if self.target is not None:
+            self.target.setLevel(level)
+
+    def close(self) -> None:
+        target = self.target
+        try:
+            super().close()
+        finally:
+            if target is not None:
+                target.close()
+
+
+class _SamplingFilter(logging.Filter):
+    """Pass one in every ``every`` DEBUG records; anything above DEBUG always passes."""
+
+    def __init__(self, every: int) -> None:
+        super().__init__()
+        self.every = every
+        self._count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        passed = self._count == 0
+        self._count = (self._count + 1) % self.every
+        return passed
+
+
+def sample_debug_records(handler: logging.Handler, every: int) -> None:
+    """
+    Make ``handler`` emit only one in every ``every`` DEBUG records.
+
+    Replaces any sampling set up by an earlier call, so it is safe on
+    handlers reused across ``configure_logging()`` calls.
+
+    Args:
+        handler: Handler to throttle (normally the console handler)
+        every: Sampling interval; 1 or less emits every record
+    """
+    for existing in [f for f in handler.filters if isinstance(f, _SamplingFilter)]:
+        handler.removeFilter(existing)
+    if every > 1:
+        handler.addFilter(_SamplingFilter(every))
+
+
+def buffered_handler(
+    target: logging.Handler,
+    capacity: int = 512,
+    flush_level: int = logging.ERROR,
+) -> logging.Handler:
+    """
+    Wrap a handler so records are written in batches instead of one at a time.
+
+    Records are held in memory and passed to ``target`` once ``capacity``
+    records are buffered, a record at ``flush_level`` or above arrives, or the
+    handler is flushed/closed (``logging.shutdown`` does this at exit).
+
+    Args:
+        target: Handler that does the actual writing (e.g. a FileHandler)
+        capacity: Number of records to buffer; 0 or less returns ``target`` unwrapped
+        flush_level: Records at this level or above trigger an immediate flush
+
+    Returns:
+        MemoryHandler wrapping ``target`` (closing it closes ``target`` too),
+        or ``target`` itself when buffering is disabled
+    """
+    if capacity <= 0:
+        return target
+    buffered = _BufferedHandler(capacity, flushLevel=flush_level, target=target, flushOnClose=True)
+    buffered.setLevel(target.level)
+    return buffered
+
+
+@functools.lru_cache(maxsize=8)
+def get_log_formatter(fmt: str, datefmt: str | None = None) -> logging.Formatter:
+    """
+    Get a shared Formatter for ``fmt``/``datefmt``.
+
+    Formatters hold no per-record state, so handlers configured with the
+    same format can share one instead of building a new one per
+    ``configure_logging()`` call.
+
+    Args:
+        fmt: %-style record format
+        datefmt: strftime format for ``%(asctime)s`` (logging's default if None)
+
+    Returns:
+        Cached Formatter instance
+    """
+    return logging.Formatter(fmt, datefmt=datefmt)
+
+
+def cached_handler(cache: dict[Any, logging.Handler], key: Hashable) -> logging.Handler | None:
+    """
+    Get a handler kept by ``configure_logging()`` for reuse.
+
+    Buffered handlers closed since they were cached (by ``logging.shutdown``
+    or a caller) have dropped their target, so they are evicted instead of
+    returned. A closed FileHandler reopens its file on the next record.
+
+    Args:
+        cache: The module's handler cache
+        key: Options the handler was built with
+
+    Returns:
+        The cached handler, or None if there is none (or it was closed)
+    """
+    handler = cache.get(key)
+    if isinstance(handler, logging.handlers.MemoryHandler) and handler.target is None:
+        del cache[key]
+        return None
+    return handler
+
+
+def close_unused_handlers(cache: dict[Any, logging.Handler], keep: Collection[Hashable]) -> None:
+    """Close and forget cached handlers whose key is not in ``keep`` (e.g. a previous log file)."""
+    for key in [key for key in cache if key not in keep]:
+        cache.pop(key).close()
+
+
+def build_console_handler(
+    cache: dict[Any, logging.Handler],
+    in_use: list[Hashable],
+    *,
+    level: int,
+    use_rich: bool,
+    console: Console,
+    keywords: Sequence[str],
+    format_string: str,
+    datefmt: str | None,
+    show_time: bool,
+    show_path: bool,
+    markup: bool,
+    rich_tracebacks: bool,
+) -> logging.Handler:
+    """
+    Get the console handler for a ``configure_logging()`` call.
+
+    RichHandlers are reused from ``cache`` while their display options are
+    unchanged. Plain StreamHandlers are always rebuilt, since they bind
+    whatever ``sys.stdout`` is at construction time.
+
+    Args:
+        cache: The calling module's handler cache
+        in_use: Keys of the handlers this call uses; the handler's key is appended
+        level: Level for the handler
+        use_rich: Build a RichHandler instead of a plain StreamHandler
+        console: Rich console to render to
+        keywords: Words Rich highlights in messages
+        format_string: Record format for the plain handler
+        datefmt: Date format for the plain handler
+        show_time: Show timestamps (Rich)
+        show_path: Show the source path (Rich)
+        markup: Render Rich markup in messages
+        rich_tracebacks: Render exceptions with Rich
+
+    Returns:
+        Console handler with ``level`` applied
+    """
+    handler: logging.Handler | None
+    if use_rich:
+        key = ("rich", show_time, show_path, markup, rich_tracebacks)
+        in_use.append(key)
+        handler = cached_handler(cache, key)
+        if handler is None:
+            handler = cache[key] = RichHandler(
+                level=level,
+                console=console,
+                show_time=show_time,
+                show_path=show_path,
+                rich_tracebacks=rich_tracebacks,
+                markup=markup,
+                log_time_format="[%X]",
+                keywords=list(keywords),
+            )
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(get_log_formatter(format_string, datefmt))
+    handler.setLevel(level)
+    return handler
+
+
+def build_file_handler(
+    cache: dict[Any, logging.Handler],
+    in_use: list[Hashable],
+    file_path: Path,
+    *,
+    level: int,
+    format_string: str,
+    datefmt: str | None,
+    buffer_capacity: int,
+    flush_level: int,
+    rotate_bytes: int,
+    backup_count: int,
+) -> logging.Handler:
+    """
+    Get the file handler for a ``configure_logging()`` call.
+
+    The handler is reused from ``cache`` while the path and options are
+    unchanged, so the log file is not reopened on every call.
+
+    Args:
+        cache: The calling module's handler cache
+        in_use: Keys of the handlers this call uses; the handler's key is appended
+        file_path: Log file (parent directories are created)
+        level: Level for the handler
+        format_string: Record format
+        datefmt: Date format
+        buffer_capacity: Records buffered before writing (0 writes each record immediately)
+        flush_level: Records at this level or above flush the buffer immediately
+        rotate_bytes: Size at which the file is rotated (0 never rotates)
+        backup_count: Number of rotated files to keep
+
+    Returns:
+        File handler (buffered unless ``buffer_capacity`` is 0) with ``level`` applied
+    """
+    key = (
+        "file",
+        file_path.resolve(),
+        format_string,
+        datefmt,
+        buffer_capacity,
+        flush_level,
+        rotate_bytes,
+        backup_count,
+    )
+    in_use.append(key)
+    handler = cached_handler(cache, key)
+    if handler is None:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Opened on the first record (delay) so runs that never log to the file don't touch it
+        raw_handler = logging.handlers.RotatingFileHandler(
+            file_path,
+            maxBytes=rotate_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+            errors="replace",
+        )
+        raw_handler.setFormatter(get_log_formatter(format_string, datefmt))
+        # Batch writes instead of a write() per record
+        handler = cache[key] = buffered_handler(raw_handler, buffer_capacity, flush_level)
+    handler.setLevel(level)
+    return handler
+
+
+def detach_handlers(logger: logging.Logger) -> None:
+    """Flush and remove the handlers a previous ``configure_logging()`` attached to ``logger``."""
+    for handler in logger.handlers:
+        handler.flush()
+    logger.handlers.clear()
+    stop_queue_listener(logger.name)
+
+
+def attach_handlers(logger: logging.Logger, handlers: Iterable[logging.Handler], *, async_logging: bool) -> None:
+    """
+    Attach ``handlers`` to ``logger``, directly or behind a queue listener.
+
+    Args:
+        logger: Logger to attach to
+        handlers: Handlers that do the actual output
+        async_logging: Run the handlers on a listener thread fed by a QueueHandler
+    """
+    sinks = list(handlers)
+    if async_logging and sinks:
+        # Formatting and I/O happen on the listener thread; callers only enqueue
+        logger.addHandler(start_queue_listener(logger.name, *sinks))
+    else:
+        for handler in sinks:
+            logger.addHandler(handler)
+
+
+def install_rich_tracebacks(console: Console) -> None:
+    """
+    Install Rich's global traceback handler, at most once per process.
+
+    ``sys.excepthook`` is process-wide, so repeated ``configure_logging()``
+    calls only need the first install; later calls are no-ops.
+
+    Args:
+        console: Console the tracebacks are rendered to
+    """
+    global _RICH_TRACEBACK_INSTALLED
+
+    if _RICH_TRACEBACK_INSTALLED:
+        return
+    install_rich_traceback(
+        console=console,
+        show_locals=False,
+        width=console.width,
+        extra_lines=3,
+        theme="monokai",
+        word_wrap=True,
+    )
+    _RICH_TRACEBACK_INSTALLED = True
+
+
+def minimize_log_records(*, production: bool = False) -> None:
+    """
+    Stop filling LogRecord fields our formats never use.
+
+    Process-wide: every LogRecord created afterwards skips the thread,
+    process, multiprocessing and asyncio-task lookups. With ``production``,
+    errors raised inside handlers are also swallowed instead of printed.
+
+    Args:
+        production: Also set ``logging.raiseExceptions = False``
+    """
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False  # type: ignore[attr-defined]  # added in 3.12, missing from typeshed
+    if production:
+        logging.raiseExceptions = False
+
+
+def start_queue_listener(name: str, *handlers: logging.Handler) -> logging.Handler:
+    """
+    Run ``handlers`` on a background thread fed by a queue.
+
+    Returns a QueueHandler to attach to the logger instead of ``handlers``, so
+    the logging call only pays for an enqueue while formatting and I/O happen
+    on the listener thread. Any listener previously started under ``name`` is
+    stopped (and drained) first; all listeners are drained at exit.
+
+    Args:
+        name: Key for the listener, normally the configured logger's name
+        *handlers: Handlers that do the actual output; their levels are respected
+
+    Returns:
+        QueueHandler feeding the listener
+    """
+    stop_queue_listener(name)
+    if not _queue_listeners:
+        # Registered after logging's own shutdown hook, so it runs first (atexit is LIFO)
+        atexit.unregister(_stop_all_queue_listeners)
+        atexit.register(_stop_all_queue_listeners)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners[name] = listener
+    return logging.handlers.QueueHandler(log_queue)
+
+
+def stop_queue_listener(name: str) -> None:
+    """Stop the listener started under ``name``, writing out any queued records."""
+    listener = _queue_listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+
+
+def queued_handlers(name: str) -> tuple[logging.Handler, ...]:
+    """Get the handlers run by the listener started under ``name`` (empty if none)."""
+    listener = _queue_listeners.get(name)
+    return tuple(listener.handlers) if listener is not None else ()
+
+
+def _stop_all_queue_listeners() -> None:
+    """Drain and stop every running listener."""
+    for name in list(_queue_listeners):
+        stop_queue_listener(name)
+
 
 def log_success(
     message: str,
@@ -20,15 +413,15 @@ def log_success(
     Log a success message with green checkmark.
 
     Args:
-        message: Message to log
-        *args: Positional arguments for logger
+        message: Message to log; may contain %-style placeholders for ``args``
+        *args: Arguments merged into ``message`` only if the record is emitted
         logger_name: Name of logger to use (if logger not provided)
         logger: Logger instance to use (overrides logger_name)
         **kwargs: Keyword arguments for logger
     """
     if logger is None:
         logger = logging.getLogger(logger_name) if logger_name else logging.getLogger()
-    logger.info("[green]✓[/green] %s", message, *args, **kwargs)
+    logger.info("[green]✓[/green] " + message, *args, **kwargs)
 
 
 def log_error(
@@ -42,15 +435,15 @@ def log_error(
     Log an error message with red X.
 
     Args:
-        message: Message to log
-        *args: Positional arguments for logger
+        message: Message to log; may contain %-style placeholders for ``args``
+        *args: Arguments merged into ``message`` only if the record is emitted
         logger_name: Name of logger to use (if logger not provided)
         logger: Logger instance to use (overrides logger_name)
         **kwargs: Keyword arguments for logger
     """
     if logger is None:
         logger = logging.getLogger(logger_name) if logger_name else logging.getLogger()
-    logger.error("[red]✗[/red] %s", message, *args, **kwargs)
+    logger.error("[red]✗[/red] " + message, *args, **kwargs)
 
 
 def log_warning(
@@ -64,15 +457,15 @@ def log_warning(
     Log a warning message with yellow warning sign.
 
     Args:
-        message: Message to log
-        *args: Positional arguments for logger
+        message: Message to log; may contain %-style placeholders for ``args``
+        *args: Arguments merged into ``message`` only if the record is emitted
         logger_name: Name of logger to use (if logger not provided)
         logger: Logger instance to use (overrides logger_name)
         **kwargs: Keyword arguments for logger
     """
     if logger is None:
         logger = logging.getLogger(logger_name) if logger_name else logging.getLogger()
-    logger.warning("[yellow]⚠[/yellow] %s", message, *args, **kwargs)
+    logger.warning("[yellow]⚠[/yellow] " + message, *args, **kwargs)
 
 
 def log_info(
@@ -86,15 +479,15 @@ def log_info(
     Log an info message with cyan info icon.
 
     Args:
-        message: Message to log
-        *args: Positional arguments for logger
+        message: Message to log; may contain %-style placeholders for ``args``
+        *args: Arguments merged into ``message`` only if the record is emitted
         logger_name: Name of logger to use (if logger not provided)
         logger: Logger instance to use (overrides logger_name)
         **kwargs: Keyword arguments for logger
     """
     if logger is None:
         logger = logging.getLogger(logger_name) if logger_name else logging.getLogger()
-    logger.info("[cyan]ℹ[/cyan] %s", message, *args, **kwargs)
+    logger.info("[cyan]ℹ[/cyan] " + message, *args, **kwargs)
 
 
 def log_debug(
@@ -108,12 +501,12 @@ def log_debug(
     Log a debug message with dimmed text.
 
     Args:
-        message: Message to log
-        *args: Positional arguments for logger
+        message: Message to log; may contain %-style placeholders for ``args``
+        *args: Arguments merged into ``message`` only if the record is emitted
         logger_name: Name of logger to use (if logger not provided)
         logger: Logger instance to use (overrides logger_name)
         **kwargs: Keyword arguments for logger
     """
     if logger is None:
         logger = logging.getLogger(logger_name) if logger_name else logging.getLogger()
-    logger.debug("[dim]%s[/dim]", message, *args, **kwargs)
+    logger.debug("[dim]" + message + "[/dim]", *args, **kwargs)
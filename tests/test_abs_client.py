@@ -144,6 +144,26 @@ class TestLibraryMethods:
 
     # get_library_item does not exist; skip these tests
 
+    def test_batch_get_items_expanded_does_not_leak_connections(self, tmp_path):
+        from src.cache import SQLiteCache
+
+        cache = SQLiteCache(db_path=tmp_path / "test.db")
+        c = ABSClient("http://localhost:13378", "token", cache=cache)
+        c._client = MagicMock()
+        c._client.get.side_effect = lambda url, params: MagicMock(
+            status_code=200, json=MagicMock(return_value={"id": url.rsplit("/", 1)[-1]})
+        )
+
+        try:
+            for batch in range(5):
+                ids = [f"li_{batch}_{i}" for i in range(20)]
+                assert len(c.batch_get_items_expanded(ids, max_workers=10)) == 20
+                # Worker threads are gone, so only the main thread's connection remains
+                assert len(cache._connections) <= 1
+        finally:
+            cache.close()
+        assert cache._connections == []
+
 
 # -----------------------------------------------------------------------------
 # Collection Methods
@@ -1,6 +1,7 @@
 """Tests for ABS logging module."""
 
 import logging
+import logging.handlers
 from unittest.mock import patch
 
 import pytest
@@ -57,6 +58,46 @@ class TestConfigureLogging:
         # First handler should be a Handler (RichHandler or StreamHandler)
         assert isinstance(logger.handlers[0], logging.Handler)
 
+    def test_configure_logging_reuses_rich_handler(self, monkeypatch):
+        """Test repeated calls reuse the RichHandler and install tracebacks only once."""
+        import src.utils.logging as shared_logging
+
+        monkeypatch.setattr(shared_logging, "_RICH_TRACEBACK_INSTALLED", False)
+        with patch("src.utils.logging.install_rich_traceback") as mock_install:
+            first = configure_logging(level="info").handlers[0]
+            second = configure_logging(level="debug").handlers[0]
+
+        assert second is first
+        assert second.level == logging.DEBUG
+        mock_install.assert_called_once()
+
+    def test_configure_logging_reuses_file_handler(self, tmp_path):
+        """Test an unchanged log file keeps its handler and a new file releases the old one."""
+        first = configure_logging(console=False, file_path=tmp_path / "a.log").handlers[0]
+        second = configure_logging(console=False, file_path=tmp_path / "a.log", file_log_level="debug").handlers[0]
+
+        assert second is first
+        assert second.level == logging.DEBUG
+        assert second.target.level == logging.DEBUG
+
+        third = configure_logging(console=False, file_path=tmp_path / "b.log").handlers[0]
+
+        assert third is not first
+        assert first.target is None  # closed
+
+    def test_configure_logging_shares_formatters(self, tmp_path):
+        """Test handlers with the same format share one Formatter instance."""
+        logger = configure_logging(use_rich=False, file_path=tmp_path / "test.log")
+
+        console_handler, file_handler = logger.handlers
+        assert console_handler.formatter is file_handler.target.formatter
+
+    def test_configure_logging_console_output_alias(self):
+        """Test the Audible module's console_output spelling is accepted too."""
+        logger = configure_logging(console_output=False)
+
+        assert logger.handlers == []
+
     def test_configure_logging_no_console(self):
         """Test no console handler when disabled."""
         logger = configure_logging(console=False)
@@ -64,6 +105,36 @@ class TestConfigureLogging:
         # Should have no handlers (no file either)
         assert len(logger.handlers) == 0
 
+    def test_configure_logging_async_uses_queue(self, tmp_path):
+        """Test async_logging attaches a QueueHandler and the listener writes the file."""
+        from src.utils.logging import queued_handlers, stop_queue_listener
+
+        log_file = tmp_path / "test.log"
+        logger = configure_logging(console=False, file_path=log_file, async_logging=True)
+
+        try:
+            assert len(logger.handlers) == 1
+            assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+            logger.info("Queued message")
+            stop_queue_listener("src.abs")
+            assert queued_handlers("src.abs") == ()
+            assert "Queued message" in log_file.read_text()
+        finally:
+            for handler in logger.handlers[:]:
+                handler.close()
+                logger.removeHandler(handler)
+
+    def test_configure_logging_file_handler_unbuffered(self, tmp_path):
+        """Test buffer_capacity=0 attaches the file handler directly."""
+        logger = configure_logging(console=False, file_path=tmp_path / "test.log", buffer_capacity=0)
+
+        try:
+            assert isinstance(logger.handlers[0], logging.FileHandler)
+        finally:
+            for handler in logger.handlers[:]:
+                handler.close()
+                logger.removeHandler(handler)
+
     def test_configure_logging_file_handler(self, tmp_path):
         """Test file handler is created."""
         log_file = tmp_path / "test.log"
@@ -71,7 +142,10 @@ class TestConfigureLogging:
 
         try:
             assert len(logger.handlers) == 1
-            assert isinstance(logger.handlers[0], logging.FileHandler)
+            assert isinstance(logger.handlers[0], logging.handlers.MemoryHandler)
+            assert isinstance(logger.handlers[0].target, logging.handlers.RotatingFileHandler)
+            assert not log_file.exists()  # opened on the first record
+            logger.error("First record")
             assert log_file.exists()
         finally:
             # Explicitly close handlers to avoid ResourceWarning
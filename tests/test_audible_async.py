@@ -3,6 +3,7 @@
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
 from src.audible.async_client import AsyncAudibleAuthError, AsyncAudibleClient, AsyncAudibleError
@@ -49,6 +50,26 @@ class TestAsyncAudibleClient:
             # Verify __aexit__ was called
             mock_instance.__aexit__.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_context_manager_enables_http2_pool(self, mock_auth):
+        """Test the session uses HTTP/2 and a keep-alive pool sized to the request concurrency."""
+        with (
+            patch("src.audible.async_client.audible.AsyncClient") as mock_client_class,
+            patch("src.audible.async_client._http2_available", return_value=True),
+        ):
+            mock_instance = AsyncMock()
+            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
+            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_client_class.return_value = mock_instance
+
+            async with AsyncAudibleClient(auth=mock_auth, max_concurrent_requests=8):
+                pass
+
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["http2"] is True
+        assert kwargs["limits"].max_connections == 8
+        assert kwargs["limits"].max_keepalive_connections == 8
+
     @pytest.mark.asyncio
     async def test_get_library_returns_list(self, mock_auth):
         """Test get_library returns list of AudibleLibraryItem."""
@@ -63,7 +84,7 @@ class TestAsyncAudibleClient:
             mock_instance = AsyncMock()
             mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
             mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_instance.get = AsyncMock(return_value=mock_response)
+            mock_instance.get = AsyncMock(return_value=orjson.dumps(mock_response))
             mock_client_class.return_value = mock_instance
 
             async with AsyncAudibleClient(auth=mock_auth) as client:
@@ -74,6 +95,21 @@ class TestAsyncAudibleClient:
                 assert result[0].asin == "B001"
                 assert result[1].asin == "B002"
 
+    @pytest.mark.asyncio
+    async def test_get_all_library_items_parallel_pages(self, mock_auth):
+        """Test parallel pagination fetches pages in concurrent windows until a short page."""
+        client = AsyncAudibleClient(auth=mock_auth, max_concurrent_requests=2)
+        page_sizes = {1: 1000, 2: 1000, 3: 1000, 4: 10, 5: 0}
+
+        async def fake_get_library(num_results, page, use_cache):
+            return [MagicMock(asin=f"B{page}-{i}") for i in range(page_sizes[page])]
+
+        with patch.object(client, "get_library", side_effect=fake_get_library) as mock_get_library:
+            items = await client.get_all_library_items(parallel=True)
+
+        assert len(items) == 3010
+        assert sorted(c.kwargs["page"] for c in mock_get_library.call_args_list) == [1, 2, 3, 4, 5]
+
     @pytest.mark.asyncio
     async def test_get_wishlist_returns_list(self, mock_auth):
         """Test get_wishlist returns list of WishlistItem."""
@@ -8,6 +8,7 @@ import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from src.audible.client import (
@@ -294,12 +295,14 @@ class TestLibraryMethods:
 
     def test_get_library_parses_response(self, mock_client):
         """get_library parses API response into models."""
-        mock_client._client.get.return_value = {
-            "items": [
-                {"asin": "B001", "title": "Book 1"},
-                {"asin": "B002", "title": "Book 2"},
-            ]
-        }
+        mock_client._client.get.return_value = orjson.dumps(
+            {
+                "items": [
+                    {"asin": "B001", "title": "Book 1"},
+                    {"asin": "B002", "title": "Book 2"},
+                ]
+            }
+        )
 
         items = mock_client.get_library(use_cache=False)
 
@@ -310,20 +313,22 @@ class TestLibraryMethods:
 
     def test_get_library_handles_empty_response(self, mock_client):
         """get_library handles empty response."""
-        mock_client._client.get.return_value = {"items": []}
+        mock_client._client.get.return_value = orjson.dumps({"items": []})
 
         items = mock_client.get_library(use_cache=False)
         assert items == []
 
     def test_get_library_skips_invalid_items(self, mock_client):
         """get_library skips items that fail validation."""
-        mock_client._client.get.return_value = {
-            "items": [
-                {"asin": "B001", "title": "Valid"},
-                {},  # Missing required fields - will fail validation
-                {"asin": "B003", "title": "Also Valid"},
-            ]
-        }
+        mock_client._client.get.return_value = orjson.dumps(
+            {
+                "items": [
+                    {"asin": "B001", "title": "Valid"},
+                    {},  # Missing required fields - will fail validation
+                    {"asin": "B003", "title": "Also Valid"},
+                ]
+            }
+        )
 
         items = mock_client.get_library(use_cache=False)
 
@@ -332,7 +337,7 @@ class TestLibraryMethods:
 
     def test_get_library_uses_cache(self, mock_client_with_cache):
         """get_library caches results."""
-        mock_client_with_cache._client.get.return_value = {"items": [{"asin": "B001", "title": "Book 1"}]}
+        mock_client_with_cache._client.get.return_value = orjson.dumps({"items": [{"asin": "B001", "title": "Book 1"}]})
 
         # First call - hits API
         items1 = mock_client_with_cache.get_library(use_cache=True)
@@ -380,18 +385,36 @@ class TestCatalogMethods:
 
     def test_search_catalog(self, mock_client):
         """search_catalog parses response."""
-        mock_client._client.get.return_value = {
-            "products": [
-                {"asin": "B001", "title": "Search Result 1"},
-                {"asin": "B002", "title": "Search Result 2"},
-            ]
-        }
+        mock_client._client.get.return_value = orjson.dumps(
+            {
+                "products": [
+                    {"asin": "B001", "title": "Search Result 1"},
+                    {"asin": "B002", "title": "Search Result 2"},
+                ]
+            }
+        )
 
         results = mock_client.search_catalog(keywords="test", use_cache=False)
 
         assert len(results) == 2
         assert all(isinstance(p, AudibleCatalogProduct) for p in results)
 
+    def test_search_catalog_skips_invalid_products(self, mock_client):
+        """search_catalog falls back to per-item validation when one product is invalid."""
+        mock_client._client.get.return_value = orjson.dumps(
+            {
+                "products": [
+                    {"asin": "B001", "title": "Valid"},
+                    {"title": "No ASIN"},
+                    {"asin": "B003", "title": "Also Valid"},
+                ]
+            }
+        )
+
+        results = mock_client.search_catalog(keywords="test", use_cache=False)
+
+        assert [p.asin for p in results] == ["B001", "B003"]
+
     def test_get_similar_products(self, mock_client):
         """get_similar_products parses response."""
         mock_client._client.get.return_value = {
@@ -435,6 +458,28 @@ class TestWishlistMethods:
         assert len(items) == 2
         assert all(isinstance(i, WishlistItem) for i in items)
 
+    def test_get_wishlist_caches_raw_valid_items(self, mock_client_with_cache):
+        """get_wishlist caches the raw API dicts of items that validated."""
+        mock_client_with_cache._client.get.return_value = {
+            "products": [
+                {"asin": "B001", "title": "Wishlist Item 1"},
+                {"title": "Missing ASIN"},
+            ]
+        }
+
+        items1 = mock_client_with_cache.get_wishlist(use_cache=True)
+        assert [i.asin for i in items1] == ["B001"]
+
+        cached = mock_client_with_cache._cache.get("library", "wishlist_p0_-DateAdded")
+        assert cached == [{"asin": "B001", "title": "Wishlist Item 1"}]
+
+        # Second call - served from cache
+        mock_client_with_cache._client.get.reset_mock()
+        items2 = mock_client_with_cache.get_wishlist(use_cache=True)
+
+        assert [i.asin for i in items2] == ["B001"]
+        mock_client_with_cache._client.get.assert_not_called()
+
     def test_add_to_wishlist_success(self, mock_client):
         """add_to_wishlist returns True on success."""
         mock_client._client.post.return_value = {}
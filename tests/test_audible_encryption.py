@@ -302,6 +302,35 @@ class TestGetFileEncryptionStyle:
             assert get_file_encryption_style(auth_file) is None
 
 
+class TestEncryptionDetectionCache:
+    """Tests for the mtime-keyed encryption detection cache."""
+
+    def test_repeated_probes_read_header_once(self, tmp_path):
+        """Test repeated probes of an unchanged file only detect once."""
+        auth_file = tmp_path / "auth.json"
+        auth_file.write_text("encrypted_data")
+
+        with patch("src.audible.encryption.detect_file_encryption", return_value="json") as mock_detect:
+            assert is_file_encrypted(auth_file) is True
+            assert get_file_encryption_style(auth_file) == "json"
+            assert is_file_encrypted(auth_file) is True
+
+        mock_detect.assert_called_once()
+
+    def test_rewritten_file_is_redetected(self, tmp_path):
+        """Test changing the file contents invalidates the cached result."""
+        auth_file = tmp_path / "auth.json"
+        auth_file.write_text("encrypted_data")
+
+        with patch("src.audible.encryption.detect_file_encryption", return_value="json"):
+            assert get_file_encryption_style(auth_file) == "json"
+
+        auth_file.write_text('{"adp_token": "plain text"}')
+
+        with patch("src.audible.encryption.detect_file_encryption", return_value=False):
+            assert get_file_encryption_style(auth_file) is None
+
+
 class TestClientIntegration:
     """Integration tests for encryption with AudibleClient."""
 
@@ -1,12 +1,21 @@
 """Tests for Audible enrichment module."""
 
+import asyncio
+import sys
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
-from src.audible.enrichment import AudibleEnrichment, AudibleEnrichmentService
-from src.audible.models import PlusCatalogInfo, PricingInfo
+from src.audible.enrichment import (
+    AsyncAudibleEnrichmentService,
+    AudibleEnrichment,
+    AudibleEnrichmentHeader,
+    AudibleEnrichmentService,
+    _compute_scoring,
+)
+from src.audible.models import AudioFormat, ContentQualityInfo, PlusCatalogInfo, PricingInfo
 
 
 class TestAudibleEnrichment:
@@ -62,6 +71,87 @@ class TestAudibleEnrichment:
         enrichment = AudibleEnrichment(asin="B001", plus_catalog=plus_info)
         assert enrichment.acquisition_recommendation == "FREE"
 
+    def test_enrichment_derived_fields_computed_on_validation(self):
+        """Test derived fields are populated when the model is validated (e.g. cache load)."""
+        pricing = PricingInfo(list_price=20.0, sale_price=5.0)
+        data = AudibleEnrichment(asin="B001", pricing=pricing).model_dump()
+        data["acquisition_recommendation"] = "stale"
+        data["priority_boost"] = 0.0
+
+        enrichment = AudibleEnrichment.model_validate(data)
+
+        assert enrichment.acquisition_recommendation == "GOOD_DEAL ($5.00, 75% off)"
+        assert enrichment.priority_boost == 3.0
+
+    def test_enrichment_derived_fields_follow_mutation(self):
+        """Test scoring reflects ownership assigned after construction."""
+        enrichment = AudibleEnrichment(asin="B001", has_atmos=True)
+        assert enrichment.priority_boost == 1.5
+
+        enrichment.owned = True
+
+        assert enrichment.acquisition_recommendation == "OWNED"
+        assert enrichment.priority_boost == 0.1
+
+    def test_enrichment_scoring_runs_once_per_input_change(self):
+        """Test model_dump scores once, and changed inputs (even nested pricing) trigger a rescore."""
+        enrichment = AudibleEnrichment(asin="B001", pricing=PricingInfo(list_price=20.0, sale_price=5.0))
+
+        with patch("src.audible.enrichment._compute_scoring", wraps=_compute_scoring) as mock_scoring:
+            dumped = enrichment.model_dump()
+            assert mock_scoring.call_count == 1
+            assert (dumped["priority_boost"], dumped["acquisition_recommendation"]) == enrichment.scoring
+            assert mock_scoring.call_count == 1
+
+            enrichment.pricing.sale_price = 15.0
+            assert enrichment.acquisition_recommendation == "CREDIT"
+            assert mock_scoring.call_count == 2
+
+        assert enrichment == AudibleEnrichment.model_validate(enrichment.model_dump())
+
+    def test_enrichment_derived_fields_follow_model_copy(self):
+        """Test model_copy(update=...) recomputes quality labels and scoring."""
+        fmt = AudioFormat(codec="mp4a.40.42", codec_name="HE-AAC", bitrate_kbps=114.0)
+        enrichment = AudibleEnrichment(asin="B001", best_bitrate=64)
+        assert enrichment.best_available_label == "64 kbps"
+        assert enrichment.priority_boost == 1.0
+
+        copy = enrichment.model_copy(update={"best_bitrate": 128, "has_atmos": True})
+        assert copy.best_available_label == "Dolby Atmos"
+        assert copy.actual_best_bitrate == 128
+        assert copy.priority_boost == 1.5
+
+        copy = enrichment.model_copy(update={"actual_quality": ContentQualityInfo.from_formats("B001", [fmt])})
+        assert copy.best_available_label == "HE-AAC @ 114 kbps"
+        assert copy.actual_best_bitrate == 114
+        assert "best_available_label" not in copy.model_dump()
+        assert copy.model_dump()["priority_boost"] == 1.0
+
+    def test_enrichment_from_cached_matches_validation(self):
+        """Test from_cached rebuilds the same model as model_validate after a JSON round-trip."""
+        import orjson
+
+        fmt = AudioFormat(codec="mp4a.40.42", codec_name="HE-AAC", bitrate_kbps=114.0)
+        original = AudibleEnrichment(
+            asin="B001",
+            title="Cached Book",
+            pricing=PricingInfo(list_price=20.0, sale_price=5.0),
+            plus_catalog=PlusCatalogInfo(
+                is_plus_catalog=True,
+                plan_name="US Minerva",
+                expiration_date=datetime.now(timezone.utc) + timedelta(days=10),
+            ),
+            actual_quality=ContentQualityInfo.from_formats("B001", [fmt]),
+        )
+        cached = orjson.loads(orjson.dumps(original.model_dump()))
+
+        rebuilt = AudibleEnrichment.from_cached(cached)
+
+        assert rebuilt == AudibleEnrichment.model_validate(cached)
+        assert rebuilt.plus_catalog.is_expiring_soon is True
+        assert rebuilt.actual_quality.best_format.codec_name == "HE-AAC"
+        assert rebuilt.acquisition_recommendation.startswith("FREE (expires")
+
     def test_enrichment_json_serialization(self):
         """Test AudibleEnrichment can be serialized to JSON."""
         enrichment = AudibleEnrichment(asin="B001", title="Test")
@@ -119,6 +209,100 @@ class TestAudibleEnrichmentService:
         assert result.asin == "B001"
         assert result.title == "Test Book"
 
+    def test_service_enrich_single_cover_image_preference(self, service, mock_client):
+        """Test cover image prefers 500px, then falls back through other sizes."""
+        with patch.object(service, "_get_catalog_product") as mock_get:
+            mock_get.return_value = {
+                "product": {"title": "Test Book", "product_images": {"252": "small.jpg", "1024": "large.jpg"}}
+            }
+            result = service.enrich_single("B001")
+
+        assert result.cover_image_url == "large.jpg"
+
+    def test_service_enrich_single_parses_codec_bitrates(self, service, mock_client):
+        """Test best bitrate comes from codec names, ignoring sample-rate-sized numbers."""
+        with patch.object(service, "_get_catalog_product") as mock_get:
+            mock_get.return_value = {
+                "product": {
+                    "title": "Test Book",
+                    "available_codecs": [
+                        {"name": "aax_22_32", "enhanced_codec": "LC_32_22050_stereo"},
+                        {"name": "_".join(["mp4", "44", "128"]), "enhanced_codec": "LC_128_44100_stereo"},
+                        {"name": "aax_44_44100"},
+                        {"enhanced_codec": "LC_16_22050_mono"},
+                    ],
+                }
+            }
+            result = service.enrich_single("B001")
+
+        assert result.best_bitrate == 128
+        assert result.available_codecs == ["aax_22_32", "mp4_44_128", "aax_44_44100"]
+        assert result.available_codecs[1] is sys.intern("mp4_44_128")
+
+    def test_service_enrich_single_uses_enhanced_codec_fallback(self, service, mock_client):
+        """Test enhanced_codec is used when no codec name carries a bitrate."""
+        with patch.object(service, "_get_catalog_product") as mock_get:
+            mock_get.return_value = {
+                "product": {
+                    "title": "Test Book",
+                    "available_codecs": [{"name": "format4", "enhanced_codec": "LC_64_22050"}],
+                }
+            }
+            result = service.enrich_single("B001")
+
+        assert result.best_bitrate == 64
+
+    def test_service_enrich_single_keeps_higher_enhanced_codec_bitrate(self, service, mock_client):
+        """Test an earlier enhanced_codec bitrate beats a lower codec-name bitrate that follows it."""
+        with patch.object(service, "_get_catalog_product") as mock_get:
+            mock_get.return_value = {
+                "product": {
+                    "title": "Test Book",
+                    "available_codecs": [
+                        {"name": "format4", "enhanced_codec": "LC_128_44100_stereo"},
+                        {"name": "aax_22_64", "enhanced_codec": "LC_64_22050_stereo"},
+                    ],
+                }
+            }
+            result = service.enrich_single("B001")
+
+        assert result.best_bitrate == 128
+
+    def test_service_enrich_single_uses_preloaded_library(self, service, mock_client):
+        """Test a preloaded library set is used instead of loading the library."""
+        with patch.object(service, "_get_catalog_product") as mock_get:
+            mock_get.return_value = {"product": {"title": "Test Book"}}
+            result = service.enrich_single("B001", _library_asins={"B001"})
+
+        assert result.owned is True
+        mock_client.get_all_library_items.assert_not_called()
+
+    def test_service_library_asins_cached_across_instances(self, mock_client, tmp_path):
+        """Test the owned-ASIN list is cached so a new service skips the library walk."""
+        from src.cache import SQLiteCache
+
+        cache = SQLiteCache(tmp_path / "test_cache.db")
+        mock_client.get_all_library_items.return_value = [MagicMock(asin="B001"), MagicMock(asin="B002")]
+
+        AudibleEnrichmentService(client=mock_client, cache=cache).prefetch_library()
+        mock_client.get_all_library_items.reset_mock()
+
+        fresh = AudibleEnrichmentService(client=mock_client, cache=cache)
+        assert fresh._load_library_asins() == {"B001", "B002"}
+        mock_client.get_all_library_items.assert_not_called()
+
+    def test_service_enrich_single_minimal_skips_catalog_for_owned(self, service, mock_client):
+        """Test minimal mode returns an ownership-only enrichment without a catalog request."""
+        mock_client.get_all_library_items.return_value = [MagicMock(asin="B001")]
+
+        with patch.object(service, "_get_catalog_product") as mock_get:
+            result = service.enrich_single("B001", minimal=True)
+
+        mock_get.assert_not_called()
+        assert result.owned is True
+        assert result.acquisition_recommendation == "OWNED"
+        assert result.audible_url == "https://www.audible.com/pd/B001"
+
     def test_service_enrich_single_returns_none_on_error(self, service, mock_client):
         """Test enrich_single returns None when API fails."""
         with patch.object(service, "_get_catalog_product") as mock_get:
@@ -127,6 +311,50 @@ class TestAudibleEnrichmentService:
 
         assert result is None
 
+    def test_service_enrich_single_caches_not_found(self, mock_client, tmp_path):
+        """Test a missing product is cached briefly while transient errors are not."""
+        from src.audible.client import AudibleNotFoundError
+        from src.cache import SQLiteCache
+
+        mock_client.get_all_library_items.return_value = []
+        service = AudibleEnrichmentService(client=mock_client, cache=SQLiteCache(tmp_path / "test_cache.db"))
+
+        with patch.object(service, "_get_catalog_product") as mock_get:
+            mock_get.side_effect = AudibleNotFoundError("gone")
+            assert service.enrich_single("B001") is None
+            assert service.enrich_single("B001") is None
+            assert mock_get.call_count == 1
+
+            mock_get.side_effect = Exception("timeout")
+            assert service.enrich_single("B002") is None
+            assert service.enrich_single("B002") is None
+            assert mock_get.call_count == 3
+
+    def test_service_enrich_batch_headers(self, mock_client, tmp_path):
+        """Test headers come from cached dicts and only misses are enriched."""
+        from src.cache import SQLiteCache
+
+        mock_client.get_all_library_items.return_value = [MagicMock(asin="B002")]
+        service = AudibleEnrichmentService(client=mock_client, cache=SQLiteCache(tmp_path / "test_cache.db"))
+        deal = AudibleEnrichment(asin="B001", pricing=PricingInfo(list_price=20.0, sale_price=5.0))
+        service._cache.set(service.CACHE_NAMESPACE, "enrich_B001", deal.model_dump())
+        service._cache.set(
+            service.CACHE_NAMESPACE, "enrich_B002", deal.model_copy(update={"asin": "B002"}).model_dump()
+        )
+
+        with (
+            patch.object(AudibleEnrichment, "from_cached", wraps=AudibleEnrichment.from_cached) as mock_from_cached,
+            patch.object(service, "enrich_single", return_value=AudibleEnrichment(asin="B003")) as mock_single,
+        ):
+            headers = service.enrich_batch_headers(["B001", "B002", "B003"])
+
+        assert headers["B001"] == AudibleEnrichmentHeader("B001", False, 3.0, "GOOD_DEAL ($5.00, 75% off)")
+        assert headers["B002"] == AudibleEnrichmentHeader("B002", True, 0.1, "OWNED")
+        assert headers["B003"].acquisition_recommendation == "N/A"
+        # Only the ASIN whose ownership changed is rebuilt; only the miss is enriched
+        assert mock_from_cached.call_count == 1
+        assert [c.args[0] for c in mock_single.call_args_list] == ["B003"]
+
     def test_service_enrich_batch(self, service, mock_client):
         """Test enriching multiple ASINs."""
         # Mock the enrich_single method for batch test
@@ -143,6 +371,166 @@ class TestAudibleEnrichmentService:
         assert "B001" in results
         assert "B002" in results
 
+    def test_service_enrich_batch_iter_skips_missing(self, service, mock_client):
+        """Test the batch iterator yields results in order and skips misses."""
+        with patch.object(service, "enrich_single") as mock_enrich:
+            mock_enrich.side_effect = [
+                AudibleEnrichment(asin="B001"),
+                None,
+                AudibleEnrichment(asin="B003"),
+            ]
+            results = list(service.enrich_batch_iter(["B001", "B002", "B003"]))
+
+        assert [e.asin for e in results] == ["B001", "B003"]
+
+    def test_service_enrich_batch_throttles_progress(self, mock_client):
+        """Test batch progress updates are rate-limited but always report the last item."""
+        progress = MagicMock()
+        service = AudibleEnrichmentService(client=mock_client, progress_callback=progress)
+        asins = [f"B{i:03d}" for i in range(50)]
+
+        with (
+            patch.object(service, "enrich_single", side_effect=lambda asin, **_: AudibleEnrichment(asin=asin)),
+            patch("src.audible.enrichment.time.monotonic", return_value=100.0),
+        ):
+            results = service.enrich_batch(asins)
+
+        assert len(results) == 50
+        # Clock never advances: first item reports, then only the final one
+        assert progress.call_count == 2
+        progress.assert_called_with(50, 50, "B049")
+
+
+class TestAsyncAudibleEnrichmentService:
+    """Test AsyncAudibleEnrichmentService."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Mock AsyncAudibleClient with an empty library."""
+        client = MagicMock()
+        client.get_all_library_items = AsyncMock(return_value=[])
+        return client
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a temporary SQLite cache."""
+        from src.cache import SQLiteCache
+
+        return SQLiteCache(tmp_path / "test_cache.db")
+
+    async def test_enrich_batch_serves_cache_hits_without_tasks(self, mock_client, cache):
+        """Test cached ASINs are loaded in bulk and only misses are enriched."""
+        service = AsyncAudibleEnrichmentService(mock_client, cache=cache)
+        cache.set(
+            service.CACHE_NAMESPACE, "enrich_v2_B001", AudibleEnrichment(asin="B001", title="Cached").model_dump()
+        )
+
+        with patch.object(
+            service, "enrich_single_with_quality", AsyncMock(return_value=AudibleEnrichment(asin="B002"))
+        ) as mock_single:
+            results = await service.enrich_batch_with_quality(["B001", "B002"])
+
+        assert results["B001"].title == "Cached"
+        assert "B002" in results
+        assert service.stats["cache_hits"] == 1
+        mock_single.assert_awaited_once()
+        assert mock_single.await_args.args == ("B002",)
+        assert mock_single.await_args.kwargs["_skip_cache_read"] is True
+
+    async def test_enrich_batch_flushes_cache_writes_once(self, mock_client, cache):
+        """Test fresh enrichments are written to the cache in a single bulk call."""
+        service = AsyncAudibleEnrichmentService(mock_client, cache=cache)
+
+        async def fake_single(asin, **kwargs):
+            kwargs["_cache_writes"].append((f"enrich_v2_{asin}", {"asin": asin}, 60))
+            return AudibleEnrichment(asin=asin)
+
+        with (
+            patch.object(service, "enrich_single_with_quality", side_effect=fake_single),
+            patch.object(cache, "set_many", wraps=cache.set_many) as mock_set_many,
+        ):
+            await service.enrich_batch_with_quality(["B001", "B002"])
+
+        mock_set_many.assert_called_once()
+        assert cache.get(service.CACHE_NAMESPACE, "enrich_v2_B002") == {"asin": "B002"}
+
+    async def test_enrich_batch_bounds_concurrency_and_survives_failures(self, mock_client):
+        """Test the worker pool never exceeds max_concurrent and isolates failures."""
+        service = AsyncAudibleEnrichmentService(mock_client)
+        in_flight = 0
+        peak = 0
+
+        async def fake_single(asin, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if asin == "B003":
+                raise RuntimeError("boom")
+            return AudibleEnrichment(asin=asin)
+
+        asins = [f"B{i:03d}" for i in range(10)]
+        with patch.object(service, "enrich_single_with_quality", side_effect=fake_single):
+            results = await service.enrich_batch_with_quality(asins, max_concurrent=3)
+
+        assert peak == 3
+        assert set(results) == set(asins) - {"B003"}
+
+    @pytest.mark.parametrize("max_concurrent", [0, -1])
+    async def test_enrich_batch_non_positive_concurrency_still_enriches(self, mock_client, max_concurrent):
+        """Test max_concurrent <= 0 falls back to one worker instead of skipping every ASIN."""
+        service = AsyncAudibleEnrichmentService(mock_client)
+
+        with patch.object(
+            service, "enrich_single_with_quality", AsyncMock(side_effect=lambda asin, **_: AudibleEnrichment(asin=asin))
+        ):
+            results = await service.enrich_batch_with_quality(["B001", "B002"], max_concurrent=max_concurrent)
+
+        assert set(results) == {"B001", "B002"}
+
+    async def test_enrich_batch_throttles_progress_like_sync(self, mock_client, cache):
+        """Test progress matches the sync contract: throttled, final item always reported, bare ASINs."""
+        progress = MagicMock()
+        service = AsyncAudibleEnrichmentService(mock_client, cache=cache, progress_callback=progress)
+        cache.set(service.CACHE_NAMESPACE, "enrich_v2_B000", AudibleEnrichment(asin="B000").model_dump())
+        asins = [f"B{i:03d}" for i in range(50)]
+
+        with (
+            patch.object(
+                service,
+                "enrich_single_with_quality",
+                AsyncMock(side_effect=lambda asin, **_: AudibleEnrichment(asin=asin)),
+            ),
+            patch("src.audible.enrichment.time.monotonic", return_value=100.0),
+        ):
+            results = await service.enrich_batch_with_quality(asins, max_concurrent=1)
+
+        assert len(results) == 50
+        # Clock never advances: the cache-hit jump reports, then only the final item
+        assert progress.call_args_list[0].args == (1, 50, "B000")
+        assert progress.call_count == 2
+        progress.assert_called_with(50, 50, "B049")
+
+    async def test_concurrent_calls_for_same_asin_share_one_fetch(self, mock_client):
+        """Test concurrent uncached lookups of one ASIN issue a single catalog request."""
+        service = AsyncAudibleEnrichmentService(mock_client)
+
+        async def slow_product(asin, use_cache=True):
+            await asyncio.sleep(0)
+            return None
+
+        mock_client.get_catalog_product = AsyncMock(side_effect=slow_product)
+
+        results = await asyncio.gather(
+            service.enrich_single_with_quality("B001"),
+            service.enrich_single_with_quality("B001"),
+        )
+
+        assert results == [None, None]
+        mock_client.get_catalog_product.assert_awaited_once()
+        assert service._inflight == {}
+
 
 class TestPricingInfoIntegration:
     """Test PricingInfo integration with enrichment."""
@@ -161,6 +549,35 @@ class TestPricingInfoIntegration:
         assert pricing.sale_price == 15.0
         assert pricing.currency == "USD"
 
+    @pytest.mark.parametrize(
+        "api_price",
+        [
+            {"credit_price": None, "list_price": {"base": None}},
+            {"credit_price": "n/a", "list_price": {"base": "not a price", "currency_code": None}},
+            {"list_price": ["20.0"], "lowest_price": {"base": {}, "type": 3}},
+        ],
+    )
+    def test_pricing_from_api_response_tolerates_malformed_fields(self, api_price):
+        """Test null or malformed price fields fall back to defaults instead of raising."""
+        pricing = PricingInfo.from_api_response(api_price)
+
+        assert pricing is not None
+        assert pricing.credit_price == 1.0
+        assert pricing.list_price is None
+        assert pricing.sale_price is None
+        assert pricing.currency == "USD"
+        assert pricing.price_type is None
+        assert pricing == PricingInfo.model_validate(pricing.model_dump())
+
+    def test_pricing_from_api_response_coerces_numeric_strings(self):
+        """Test numeric strings are read as prices."""
+        pricing = PricingInfo.from_api_response({"credit_price": "2", "lowest_price": {"base": "4.99", "type": "sale"}})
+
+        assert pricing is not None
+        assert pricing.credit_price == 2.0
+        assert pricing.sale_price == 4.99
+        assert pricing.is_monthly_deal is True
+
     def test_pricing_discount_calculation(self):
         """Test discount percentage calculation."""
         pricing = PricingInfo(list_price=100.0, sale_price=75.0, currency="USD")
@@ -198,6 +615,43 @@ class TestPlusCatalogInfoIntegration:
         assert plus_info.plan_name is None
         assert plus_info.expiration_date is None
 
+    def test_plus_catalog_from_api_response(self):
+        """Test plans parsing extracts Plus Catalog status and expiration."""
+        plans = [{"plan_name": "US Minerva", "end_date": "2030-01-15T00:00:00.000Z"}]
+
+        plus_info = PlusCatalogInfo.from_api_response(plans)
+
+        assert plus_info.is_plus_catalog is True
+        assert plus_info.expiration_date == datetime(2030, 1, 15, tzinfo=timezone.utc)
+
+    def test_plus_catalog_from_api_response_skips_malformed_plans(self):
+        """Test null or malformed plan entries are skipped rather than raising."""
+        plans = [
+            None,
+            "US Minerva",
+            {"plan_name": None, "end_date": None},
+            {"plan_name": ["US Minerva"]},
+            {"plan_name": "US Minerva", "end_date": 20300115},
+        ]
+
+        plus_info = PlusCatalogInfo.from_api_response(plans)
+
+        assert plus_info.is_plus_catalog is True
+        assert plus_info.plan_name == "US Minerva"
+        assert plus_info.expiration_date is None
+        assert PlusCatalogInfo.from_api_response([{"plan_name": None}]).is_plus_catalog is False
+
+    def test_plus_catalog_end_date_formats(self):
+        """Test end dates parse with or without fractions and offsets, and sentinel dates are ignored."""
+        for end_date in ("2030-01-15T00:00:00Z", "2030-01-15T00:00:00.123Z", "2030-01-15T00:00:00"):
+            plus_info = PlusCatalogInfo.from_api_response([{"plan_name": "US Minerva", "end_date": end_date}])
+            assert plus_info.expiration_date is not None
+            assert plus_info.expiration_date.date().isoformat() == "2030-01-15"
+            assert plus_info.expiration_date.tzinfo is not None
+
+        forever = PlusCatalogInfo.from_api_response([{"plan_name": "US Minerva", "end_date": "2099-12-31T00:00:00Z"}])
+        assert forever.expiration_date is None
+
     def test_plus_catalog_with_plan(self):
         """Test PlusCatalogInfo with plan name."""
         plus_info = PlusCatalogInfo(is_plus_catalog=True, plan_name="US_MINERVA")
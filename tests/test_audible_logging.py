@@ -70,7 +70,7 @@ class TestConfigureLogging:
         try:
             configure_logging(level="info", console_output=False, file_path=str(log_file))
 
-            logger = get_logger("test_file")
+            logger = get_logger(f"{MODULE_LOGGER_NAME}.test_file")
             logger.info("File test message")
 
             # Ensure handlers are flushed
@@ -78,14 +78,56 @@ class TestConfigureLogging:
                 if hasattr(handler, "flush"):
                     handler.flush()
 
-            # File should exist
-            assert log_file.exists()
+            # File is created on the first record
+            assert "File test message" in log_file.read_text()
         finally:
             # Explicitly close handlers to avoid ResourceWarning
             for handler in parent_logger.handlers[:]:
                 handler.close()
                 parent_logger.removeHandler(handler)
 
+    def test_configure_logging_file_output_is_buffered(self, tmp_path):
+        """Test file records are batched until the buffer flushes or an error arrives."""
+        log_file = tmp_path / "test.log"
+        configure_logging(level="info", console_output=False, file_path=log_file, configure_audible_package=False)
+
+        logger = get_logger(f"{MODULE_LOGGER_NAME}.test_buffered")
+        logger.info("Buffered message")
+        assert not log_file.exists()  # nothing written yet, and the file is opened lazily
+
+        logger.error("Error message")
+        contents = log_file.read_text()
+        assert "Buffered message" in contents
+        assert "Error message" in contents
+
+    def test_configure_logging_samples_console_debug(self, capsys):
+        """Test debug_sample_every thins DEBUG console output but keeps warnings."""
+        configure_logging(level="debug", use_rich=False, debug_sample_every=3, configure_audible_package=False)
+
+        logger = get_logger(f"{MODULE_LOGGER_NAME}.test_sampling")
+        for i in range(6):
+            logger.debug("item %d", i)
+        logger.warning("still shown")
+
+        out = capsys.readouterr().out
+        assert "item 0" in out and "item 3" in out
+        assert "item 1" not in out and "item 5" not in out
+        assert "still shown" in out
+
+    def test_configure_logging_minimal_records(self, monkeypatch):
+        """Test unused LogRecord fields are switched off, and raiseExceptions only in production."""
+        for flag in ("logThreads", "logProcesses", "logMultiprocessing", "raiseExceptions"):
+            monkeypatch.setattr(logging, flag, True)
+
+        configure_logging(level="info", console_output=False, configure_audible_package=False)
+        assert logging.logThreads is False
+        assert logging.logProcesses is False
+        assert logging.logMultiprocessing is False
+        assert logging.raiseExceptions is True
+
+        configure_logging(level="info", console_output=False, configure_audible_package=False, production=True)
+        assert logging.raiseExceptions is False
+
     def test_get_logger_returns_logger(self):
         """Test get_logger returns a logger instance."""
         logger = get_logger("my_module")
@@ -135,12 +177,43 @@ class TestConfigureLogging:
         assert get_level("warning") == logging.WARNING
         assert get_level("error") == logging.ERROR
 
+    def test_get_level_case_insensitive(self):
+        """Test get_level accepts upper and mixed case names."""
+        assert get_level("DEBUG") == logging.DEBUG
+        assert get_level("Warning") == logging.WARNING
+        assert get_level("bogus") == logging.INFO
+
+    def test_level_map_is_read_only(self):
+        """Test the public LEVEL_MAP constant cannot be mutated."""
+        from src.audible.logging import LEVEL_MAP
+
+        with pytest.raises(TypeError):
+            LEVEL_MAP["verbose"] = 5  # type: ignore[index]
+
     def test_get_level_int(self):
         """Test get_level with int."""
         assert get_level(logging.DEBUG) == logging.DEBUG
         assert get_level(logging.INFO) == logging.INFO
 
 
+class TestLogHelpers:
+    """Test the re-exported log_* helpers."""
+
+    def test_log_helpers_defer_formatting(self, caplog):
+        """Test helper arguments are merged into the message only when the record is emitted."""
+        from src.audible.logging import log_debug, log_success
+
+        formatted = MagicMock(__str__=MagicMock(return_value="value"))
+        logger = logging.getLogger(f"{MODULE_LOGGER_NAME}.helpers")
+
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            log_debug("skipped %s", formatted, logger=logger)
+            log_success("loaded %d items from %s", 3, "cache", logger=logger)
+
+        formatted.__str__.assert_not_called()
+        assert caplog.records[-1].getMessage() == "[green]✓[/green] loaded 3 items from cache"
+
+
 class TestLogContext:
     """Test LogContext context manager."""
 
@@ -177,6 +250,18 @@ class TestLogContext:
             # Should restore to debug
             assert parent.level == logging.DEBUG
 
+    def test_log_context_same_level_is_noop(self):
+        """Test entering a context at the current level does not touch the loggers."""
+        configure_logging(level="info", console_output=True)
+        logging.getLogger("audible").setLevel(logging.INFO)
+
+        with patch.object(logging.Logger, "setLevel") as mock_set_level:
+            with LogContext("info"):
+                pass
+            set_level("info")
+
+        mock_set_level.assert_not_called()
+
 
 class TestEnvironmentVariables:
     """Test environment variable support."""
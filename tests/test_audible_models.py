@@ -13,9 +13,11 @@ from src.audible.models import (
     AudibleCategory,
     AudibleCategoryLadder,
     AudibleLibraryItem,
+    AudibleListeningStats,
     AudibleNarrator,
     AudibleRating,
     AudibleSeries,
+    WishlistItem,
 )
 
 
@@ -40,6 +42,20 @@ class TestAudibleAuthor:
         assert author.name == "Test"
         assert not hasattr(author, "extra_field")
 
+    def test_author_is_slotted_and_frozen(self):
+        """Test leaf DTOs carry no per-instance __dict__ and reject mutation."""
+        author = AudibleAuthor(name="Test")
+        assert not hasattr(author, "__dict__")
+        with pytest.raises(AttributeError):
+            author.name = "Changed"  # type: ignore[misc]
+
+    def test_leaf_models_hashable(self):
+        """Test frozen leaf DTOs hash by value so equal instances can be shared."""
+        assert hash(AudibleAuthor(asin="B001", name="A")) == hash(AudibleAuthor(asin="B001", name="A"))
+        assert {AudibleNarrator(name="N"), AudibleNarrator(name="N")} == {AudibleNarrator(name="N")}
+        assert len({AudibleSeries(title="S", sequence="1"), AudibleSeries(title="S", sequence="2")}) == 2
+        assert hash(AudibleCategory(id="1", name="Fantasy")) == hash(AudibleCategory(id="1", name="Fantasy"))
+
 
 class TestAudibleRating:
     """Tests for AudibleRating model with flexible value types."""
@@ -181,6 +197,25 @@ class TestAudibleBook:
         book = AudibleBook(asin="B00TEST123", title="Test Book")
         assert book.primary_author is None
 
+    def test_book_derived_properties_follow_updates(self):
+        """Test derived properties reflect model_copy(update=...) and assignment, and stay out of dumps."""
+        book = AudibleBook(
+            asin="B00TEST123",
+            title="Test Book",
+            runtime_length_min=60,
+            series=[AudibleSeries(title="Series", sequence="1")],
+        )
+        assert book.runtime_hours == 1.0
+        assert book.primary_series.title == "Series"
+
+        copy = book.model_copy(update={"runtime_length_min": 120, "series": []})
+        assert copy.runtime_hours == 2.0
+        assert copy.primary_series is None
+
+        book.authors = [AudibleAuthor(name="New Author")]
+        assert book.primary_author == "New Author"
+        assert "runtime_hours" not in book.model_dump()
+
 
 class TestAudibleLibraryItem:
     """Tests for AudibleLibraryItem with nullable boolean fields."""
@@ -312,3 +347,59 @@ class TestAudibleCatalogProduct:
         )
         assert product.runtime_hours == 5.0
         assert product.primary_author == "Author Name"
+
+
+class TestWishlistItem:
+    """Tests for WishlistItem Plus Catalog detection."""
+
+    @pytest.mark.parametrize(
+        ("plans", "is_ayce", "expected"),
+        [
+            ([{"plan_name": "US Minerva"}], False, True),
+            ([{"plan_name": "AyceRomance"}], False, True),
+            ([{"plan_name": "SomethingElse"}, {"plan_name": None}], False, False),
+            ([], True, True),
+        ],
+    )
+    def test_is_plus_catalog(self, plans, is_ayce, expected):
+        """Test Minerva/AYCE plan names and the is_ayce flag mark Plus Catalog items."""
+        item = WishlistItem(asin="B00TEST123", title="Test Book", plans=plans, is_ayce=is_ayce)
+        assert item.is_plus_catalog is expected
+        assert "is_plus_catalog" not in item.model_dump()
+
+    def test_is_plus_catalog_follows_model_copy(self):
+        """Test is_plus_catalog is recomputed for copies with updated plans."""
+        item = WishlistItem(asin="B00TEST123", title="Test Book")
+        assert item.is_plus_catalog is False
+        assert item.model_copy(update={"plans": [{"plan_name": "US Minerva"}]}).is_plus_catalog is True
+
+
+class TestRenamedFields:
+    """Tests for fields whose API key differs from the field name."""
+
+    def test_category_accepts_api_key_and_field_name(self):
+        """Test category id parses from category_id or id."""
+        ladder = AudibleCategoryLadder.model_validate({"ladder": [{"category_id": "123"}, {"id": "456"}]})
+        assert [category.id for category in ladder.ladder] == ["123", "456"]
+        assert AudibleCategory(id="789").id == "789"
+
+    def test_listening_stats_round_trip(self):
+        """Test camelCase API payloads survive a model_dump()/model_validate() cache round trip."""
+        stats = AudibleListeningStats.model_validate({"totalListeningTimeMs": 3_600_000, "currentListeningStreak": 4})
+        restored = AudibleListeningStats.model_validate(stats.model_dump())
+        assert restored.total_listening_time_ms == 3_600_000
+        assert restored.current_listening_streak == 4
+        assert restored.total_hours == 1.0
+        assert restored.model_copy(update={"total_listening_time_ms": 7_200_000}).total_hours == 2.0
+
+
+class TestModelBuild:
+    """Tests that validators are ready before the first API response."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [AudibleBook, AudibleLibraryItem, AudibleCatalogProduct, AudibleCategoryLadder, AudibleListeningStats],
+    )
+    def test_models_built_at_import(self, model):
+        """Test schemas are built at class definition, not on the first model_validate()."""
+        assert model.__pydantic_complete__
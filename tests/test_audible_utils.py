@@ -1,8 +1,10 @@
 """Tests for Audible utilities module."""
 
+from collections.abc import Mapping
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from src.audible.utils import (
@@ -18,6 +20,7 @@ from src.audible.utils import (
     get_marketplace_for_domain,
     is_auth_valid,
     list_marketplaces,
+    raw_response_body,
     refresh_auth,
 )
 
@@ -27,9 +30,14 @@ class TestMarketplaceInfo:
 
     def test_marketplaces_constant_exists(self):
         """Test MARKETPLACES constant is defined."""
-        assert isinstance(MARKETPLACES, dict)
+        assert isinstance(MARKETPLACES, Mapping)
         assert len(MARKETPLACES) > 0
 
+    def test_marketplaces_constant_is_read_only(self):
+        """Test the shared MARKETPLACES table cannot be mutated."""
+        with pytest.raises(TypeError):
+            MARKETPLACES["xx"] = MARKETPLACES["us"]  # type: ignore[index]
+
     def test_us_marketplace_exists(self):
         """Test US marketplace is defined."""
         assert "us" in MARKETPLACES
@@ -54,6 +62,13 @@ class TestMarketplaceInfo:
         assert hasattr(mp, "currency")
         assert hasattr(mp, "language")
 
+    def test_marketplace_info_is_immutable(self):
+        """Test the shared marketplace table cannot be modified through a lookup."""
+        mp = get_marketplace("us")
+        assert not hasattr(mp, "__dict__")
+        with pytest.raises(AttributeError):
+            mp.currency = "EUR"  # type: ignore[misc]
+
     def test_get_marketplace_valid(self):
         """Test get_marketplace with valid code."""
         us = get_marketplace("us")
@@ -90,6 +105,12 @@ class TestMarketplaceInfo:
         assert uk is not None
         assert uk.country_code == "uk"
 
+    def test_get_marketplace_for_domain_www_prefix(self):
+        """Test a leading www. and upper case are ignored."""
+        de = get_marketplace_for_domain("WWW.Audible.de")
+        assert de is not None
+        assert de.country_code == "de"
+
     def test_get_marketplace_for_domain_invalid(self):
         """Test lookup by invalid domain."""
         result = get_marketplace_for_domain("invalid.com")
@@ -136,6 +157,25 @@ class TestActivationBytes:
             assert result is None or isinstance(result, str)
 
 
+class TestRawResponseBody:
+    """Test the raw JSON response callback."""
+
+    def test_returns_body_bytes(self):
+        """Test a successful response is returned undecoded."""
+        request = httpx.Request("GET", "https://api.audible.com/1.0/library")
+        response = httpx.Response(200, content=b'{"items": []}', request=request)
+        assert raw_response_body(response) == b'{"items": []}'
+
+    def test_raises_audible_errors(self):
+        """Test HTTP errors still map to the audible exceptions."""
+        from audible.exceptions import NotFoundError
+
+        request = httpx.Request("GET", "https://api.audible.com/1.0/library")
+        response = httpx.Response(404, json={"message": "missing"}, request=request)
+        with pytest.raises(NotFoundError):
+            raw_response_body(response)
+
+
 class TestAuthInfo:
     """Test auth file information functions."""
 
@@ -144,6 +184,18 @@ class TestAuthInfo:
         result = is_auth_valid("/nonexistent/path/file.json")
         assert result is False
 
+    @pytest.mark.parametrize(("expires_in", "refreshed"), [(3600, False), (30, True), (-60, True)])
+    def test_is_auth_valid_skips_refresh_for_live_token(self, expires_in, refreshed):
+        """Test a live access token is accepted without a refresh round trip."""
+        import time
+
+        mock_auth = MagicMock(access_token="Atna|token", expires=time.time() + expires_in)
+        with patch("src.audible.utils.Authenticator") as mock_auth_class:
+            mock_auth_class.from_file.return_value = mock_auth
+            assert is_auth_valid("auth.json") is True
+
+        assert mock_auth.refresh_access_token.called is refreshed
+
     def test_get_auth_info_returns_dict_or_none(self):
         """Test get_auth_info returns dict or None."""
         with (
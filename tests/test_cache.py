@@ -1,6 +1,8 @@
 """Tests for SQLite cache."""
 
+import threading
 import time
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -97,10 +99,12 @@ class TestPricingTTL:
     """Tests for SQLiteCache class."""
 
     @pytest.fixture
-    def temp_cache(self, tmp_path: Path) -> SQLiteCache:
+    def temp_cache(self, tmp_path: Path) -> Iterator[SQLiteCache]:
         """Create a temporary cache for testing."""
         cache_path: Path = tmp_path / "test_cache.db"
-        return SQLiteCache(cache_path)
+        cache = SQLiteCache(cache_path)
+        yield cache
+        cache.close()
 
     def test_cache_initialization(self, temp_cache):
         """Test cache initializes correctly."""
@@ -114,6 +118,26 @@ class TestPricingTTL:
 
         assert result == {"value": 123}
 
+    def test_connection_reused_per_thread(self, temp_cache):
+        """Test each thread keeps one connection until it exits, and close() lets the cache reconnect."""
+        with temp_cache._get_connection() as first, temp_cache._get_connection() as second:
+            assert first is second
+
+        def use_cache() -> None:
+            with temp_cache._get_connection() as conn:
+                assert conn is not first
+                assert len(temp_cache._connections) == 2
+
+        thread = threading.Thread(target=use_cache)
+        thread.start()
+        thread.join()
+        assert temp_cache._connections == [first]  # the worker's connection closed with its thread
+
+        temp_cache.set("abs_items", "key", {"data": 1})
+        temp_cache.close()
+        temp_cache._memory_cache.clear()
+        assert temp_cache.get("abs_items", "key") == {"data": 1}
+
     def test_get_nonexistent_key(self, temp_cache):
         """Test getting a key that doesn't exist."""
         result = temp_cache.get("test_ns", "nonexistent")
@@ -134,6 +158,53 @@ class TestPricingTTL:
 
         assert temp_cache.get("test_ns", "key") == {"data": "updated"}
 
+    def test_get_legacy_text_rows(self, temp_cache):
+        """Test rows written as JSON text (before blob storage) are still readable."""
+        with temp_cache._get_connection() as conn:
+            conn.execute(
+                "INSERT INTO cache (namespace, key, data, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                ("test_ns", "legacy", '{"value": 1}', time.time(), time.time() + 60),
+            )
+
+        assert temp_cache.get("test_ns", "legacy") == {"value": 1}
+        assert temp_cache.get_many("test_ns", ["legacy"]) == {"legacy": {"value": 1}}
+
+    def test_get_many(self, temp_cache):
+        """Test fetching several keys at once from memory and database."""
+        temp_cache.set("test_ns", "key1", {"value": 1})
+        temp_cache.set("test_ns", "key2", {"value": 2})
+        temp_cache.set("other_ns", "key3", {"value": 3})
+        # Drop key2 from the memory layer so it must come from SQLite
+        temp_cache._memory_cache.pop("test_ns:key2")
+
+        result = temp_cache.get_many("test_ns", ["key1", "key2", "key3", "missing"])
+
+        assert result == {"key1": {"value": 1}, "key2": {"value": 2}}
+
+    def test_get_many_skips_expired(self, temp_cache):
+        """Test get_many ignores expired entries."""
+        temp_cache.set("test_ns", "fresh", {"value": 1})
+        temp_cache.set("test_ns", "stale", {"value": 2}, ttl_seconds=-1)
+
+        assert temp_cache.get_many("test_ns", ["fresh", "stale"]) == {"fresh": {"value": 1}}
+
+    def test_set_many(self, temp_cache):
+        """Test storing several items in one transaction."""
+        temp_cache.set("test_ns", "key1", {"value": "old"})
+
+        temp_cache.set_many(
+            "test_ns",
+            [
+                ("key1", {"value": 1}, None),
+                ("key2", {"asin": "B002", "title": "Book 2"}, 60),
+            ],
+        )
+        temp_cache._memory_cache.clear()
+
+        assert temp_cache.get("test_ns", "key1") == {"value": 1}
+        assert temp_cache.get("test_ns", "key2") == {"asin": "B002", "title": "Book 2"}
+        assert temp_cache.search_by_asin("B002")[0]["key"] == "key2"
+
     def test_ttl_expiration(self, temp_cache):
         """Test TTL expiration (with very short TTL)."""
         temp_cache.set("test_ns", "expiring", {"data": "value"}, ttl_seconds=1)
@@ -198,6 +269,21 @@ class TestPricingTTL:
 
         assert result == sample_library_item
 
+    def test_search_fts(self, temp_cache):
+        """Test search ranks title hits first, ignores keys, and uses the FTS index."""
+        temp_cache.set("abs_items", "weir", {"title": "The Martian", "authors": ["Andy Weir"]})
+        temp_cache.set("abs_items", "other", {"title": "Weird Tales", "authors": ["Someone Else"]})
+
+        assert [r["key"] for r in temp_cache.search_fts("weir")] == ["other", "weir"]
+        assert temp_cache.search_fts("abs_items") == []
+        assert [r["key"] for r in temp_cache.search_by_title('The "Mart')] == ["weir"]
+
+        with temp_cache._get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT rowid FROM cache_fts WHERE cache_fts MATCH ?", ("weir",)
+            ).fetchall()
+        assert "INDEX 0:M" in plan[0]["detail"]
+
     def test_clear_pricing_caches(self, temp_cache):
         """Test clearing pricing-related caches for monthly deal refresh."""
         # Add data to pricing namespaces
@@ -224,3 +310,19 @@ class TestPricingTTL:
 
         # Verify cleared counts
         assert sum(cleared.values()) == 5
+
+
+class TestGetCache:
+    """Tests for the get_cache factory."""
+
+    def test_get_cache_shares_instances(self, tmp_path: Path):
+        """Test the same arguments return one shared SQLiteCache."""
+        from src.cache import get_cache
+
+        get_cache.cache_clear()
+        try:
+            first = get_cache(str(tmp_path / "a.db"))
+            assert get_cache(str(tmp_path / "a.db")) is first
+            assert get_cache(str(tmp_path / "b.db")) is not first
+        finally:
+            get_cache.cache_clear()